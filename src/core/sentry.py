@@ -3,7 +3,13 @@
 This module provides Sentry configuration for error tracking in production.
 """
 
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
+import random
+import re
 from typing import Dict, Optional
 
 try:
@@ -14,6 +20,7 @@ try:
     from sentry_sdk.integrations.logging import LoggingIntegration
     from sentry_sdk.integrations.redis import RedisIntegration
     from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+    from sentry_sdk.scope import use_isolation_scope, use_scope
     SENTRY_AVAILABLE = True
 except ImportError:
     SENTRY_AVAILABLE = False
@@ -23,9 +30,30 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Request data scrubbed from events before they are sent
+_SENSITIVE_HEADERS = frozenset(("authorization", "cookie", "x-api-key", "x-auth-token"))
+_SENSITIVE_QUERY_RE = re.compile(r"token|key|secret", re.IGNORECASE)
+_SENSITIVE_FIELDS = frozenset(("password", "token", "secret", "key", "api_key"))
+
+# Transactions for these routes are never sent
+_DROPPED_TRANSACTION_PREFIXES = ("/health", "/metrics", "/ready")
+
+# Error records waiting to be forwarded to Sentry; records beyond this are dropped
+SENTRY_LOG_QUEUE_SIZE = 10_000
+
+_sentry_log_listener: Optional[logging.handlers.QueueListener] = None
+_sentry_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+# Error events are sampled by the capture helpers and, for logged errors, in
+# before_send; the SDK's own sample_rate is left at 1.0
+_error_sample_rate = 1.0
+_sample = random.Random().random
+
 
 def setup_sentry() -> None:
     """Configure Sentry for error tracking."""
+    global _error_sample_rate
+    
     settings = get_settings()
     
     if not SENTRY_AVAILABLE:
@@ -70,7 +98,7 @@ def setup_sentry() -> None:
         # Performance monitoring
         traces_sample_rate=1.0 if settings.is_development else 0.1,
         
-        # Error sampling
+        # Error sampling is done in the capture helpers and before_send
         sample_rate=1.0,
         
         # Additional options
@@ -83,14 +111,15 @@ def setup_sentry() -> None:
         before_send_transaction=filter_transaction_data,
     )
     
-    # Set user context
-    with sentry_sdk.configure_scope() as scope:
-        scope.set_tag("service", "lit_law411-agent")
-        scope.set_tag("version", "0.1.0")
-        scope.set_context("runtime", {
-            "name": "Python",
-            "version": "3.11+",
-        })
+    # Set service context
+    sentry_sdk.set_tag("service", "lit_law411-agent")
+    sentry_sdk.set_tag("version", "0.1.0")
+    sentry_sdk.set_context("runtime", {
+        "name": "Python",
+        "version": "3.11+",
+    })
+    
+    _error_sample_rate = settings.sentry_error_sample_rate
     
     logger.info("Sentry error tracking initialized", environment=settings.environment)
 
@@ -105,26 +134,31 @@ def filter_sensitive_data(event: Dict, hint: Dict) -> Optional[Dict]:
     Returns:
         Filtered event or None to drop event
     """
+    # Events from the logging integration bypass the capture helpers, so they
+    # are sampled here before any filtering work is done
+    if "log_record" in hint and _error_sample_rate < 1.0 and _sample() >= _error_sample_rate:
+        return None
+    
+    request = event.get("request")
+    if not request:
+        return event
+    
     # Remove sensitive headers
-    if "request" in event and "headers" in event["request"]:
-        sensitive_headers = ["authorization", "cookie", "x-api-key", "x-auth-token"]
-        for header in sensitive_headers:
-            event["request"]["headers"].pop(header, None)
+    headers = request.get("headers")
+    if headers:
+        for header in _SENSITIVE_HEADERS & headers.keys():
+            del headers[header]
     
     # Remove sensitive query parameters
-    if "request" in event and "query_string" in event["request"]:
-        query_string = event["request"]["query_string"]
-        if any(param in query_string.lower() for param in ["token", "key", "secret"]):
-            event["request"]["query_string"] = "[Filtered]"
+    query_string = request.get("query_string")
+    if query_string and _SENSITIVE_QUERY_RE.search(query_string):
+        request["query_string"] = "[Filtered]"
     
     # Remove sensitive form data
-    if "request" in event and "data" in event["request"]:
-        data = event["request"]["data"]
-        if isinstance(data, dict):
-            sensitive_fields = ["password", "token", "secret", "key", "api_key"]
-            for field in sensitive_fields:
-                if field in data:
-                    data[field] = "[Filtered]"
+    data = request.get("data")
+    if isinstance(data, dict):
+        for field in _SENSITIVE_FIELDS & data.keys():
+            data[field] = "[Filtered]"
     
     return event
 
@@ -140,10 +174,9 @@ def filter_transaction_data(event: Dict, hint: Dict) -> Optional[Dict]:
         Filtered event or None to drop event
     """
     # Don't send transactions for health checks and metrics
-    if "transaction" in event:
-        transaction_name = event["transaction"]
-        if any(path in transaction_name for path in ["/health", "/metrics", "/ready"]):
-            return None
+    transaction_name = event.get("transaction")
+    if transaction_name is not None and transaction_name.startswith(_DROPPED_TRANSACTION_PREFIXES):
+        return None
     
     return event
 
@@ -161,13 +194,15 @@ def capture_exception(exc: Exception, **kwargs) -> Optional[str]:
     if not SENTRY_AVAILABLE:
         return None
     
-    with sentry_sdk.configure_scope() as scope:
-        # Add additional context
-        for key, value in kwargs.items():
-            scope.set_extra(key, value)
-        
-        # Capture exception
+    # Skip stack collection and scope work for events that would be sampled out
+    if _error_sample_rate < 1.0 and _sample() >= _error_sample_rate:
+        return None
+    
+    if not kwargs:
         return sentry_sdk.capture_exception(exc)
+    
+    # Attach additional context to this event only
+    return sentry_sdk.capture_exception(exc, extras=kwargs)
 
 
 def capture_message(message: str, level: str = "info", **kwargs) -> Optional[str]:
@@ -184,13 +219,14 @@ def capture_message(message: str, level: str = "info", **kwargs) -> Optional[str
     if not SENTRY_AVAILABLE:
         return None
     
-    with sentry_sdk.configure_scope() as scope:
-        # Add additional context
-        for key, value in kwargs.items():
-            scope.set_extra(key, value)
-        
-        # Capture message
+    if _error_sample_rate < 1.0 and _sample() >= _error_sample_rate:
+        return None
+    
+    if not kwargs:
         return sentry_sdk.capture_message(message, level=level)
+    
+    # Attach additional context to this event only
+    return sentry_sdk.capture_message(message, level=level, extras=kwargs)
 
 
 def set_user_context(user_id: str, email: str = None, **kwargs) -> None:
@@ -204,51 +240,135 @@ def set_user_context(user_id: str, email: str = None, **kwargs) -> None:
     if not SENTRY_AVAILABLE:
         return
     
-    with sentry_sdk.configure_scope() as scope:
-        scope.set_user({
-            "id": user_id,
-            "email": email,
-            **kwargs
-        })
+    sentry_sdk.set_user({
+        "id": user_id,
+        "email": email,
+        **kwargs
+    })
+
 
+# Breadcrumbs are added on hot paths, so the implementation is picked once at
+# import time rather than checked per call
+if SENTRY_AVAILABLE:
+    def add_breadcrumb(message: str, category: str = "custom", level: str = "info", **data) -> None:
+        """Add breadcrumb to Sentry.
+        
+        Args:
+            message: Breadcrumb message
+            category: Breadcrumb category
+            level: Log level
+            **data: Additional breadcrumb data
+        """
+        sentry_sdk.add_breadcrumb(message=message, category=category, level=level, data=data)
+else:
+    def add_breadcrumb(message: str, category: str = "custom", level: str = "info", **data) -> None:
+        """Add breadcrumb to Sentry (no-op, Sentry SDK not installed)."""
 
-def add_breadcrumb(message: str, category: str = "custom", level: str = "info", **data) -> None:
-    """Add breadcrumb to Sentry.
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
     
-    Args:
-        message: Breadcrumb message
-        category: Breadcrumb category
-        level: Log level
-        **data: Additional breadcrumb data
-    """
-    if not SENTRY_AVAILABLE:
-        return
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copy the record along with the logging thread's Sentry scopes.
+        
+        The stdlib prepare() formats the message and clears exc_info, which
+        would send events without a stack trace. The copy keeps exc_info,
+        and the forked scopes keep the request context of the logging thread.
+        """
+        record = copy.copy(record)
+        record.sentry_scopes = (
+            sentry_sdk.get_isolation_scope().fork(),
+            sentry_sdk.get_current_scope().fork(),
+        )
+        return record
     
-    sentry_sdk.add_breadcrumb(
-        message=message,
-        category=category,
-        level=level,
-        data=data,
-    )
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put the record on the queue without blocking."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class _ScopedQueueListener(logging.handlers.QueueListener):
+    """Queue listener that handles each record within the scopes it was logged in."""
+    
+    def handle(self, record: logging.LogRecord) -> None:
+        """Handle the record inside the Sentry scopes captured when it was queued."""
+        scopes = getattr(record, "sentry_scopes", None)
+        if scopes is None:
+            super().handle(record)
+            return
+        
+        isolation_scope, current_scope = scopes
+        with use_isolation_scope(isolation_scope), use_scope(current_scope):
+            super().handle(record)
 
 
 def configure_sentry_logging_handler() -> None:
-    """Configure Python logging to send errors to Sentry."""
-    if not SENTRY_AVAILABLE:
+    """Configure Python logging to send errors to Sentry.
+    
+    Records are queued by the logging thread and forwarded to Sentry from a
+    background listener thread, so logging an error never waits on the SDK.
+    Forwarded records keep their exception and the logging thread's scopes.
+    """
+    global _sentry_log_listener, _sentry_queue_handler
+    
+    if not SENTRY_AVAILABLE or _sentry_log_listener is not None:
         return
     
     from sentry_sdk.integrations.logging import SentryHandler
     
-    # Add Sentry handler to root logger
+    log_queue: queue.Queue = queue.Queue(maxsize=SENTRY_LOG_QUEUE_SIZE)
+    _sentry_queue_handler = _DroppingQueueHandler(log_queue)
+    _sentry_queue_handler.setLevel(logging.ERROR)
+    
     sentry_handler = SentryHandler()
     sentry_handler.setLevel(logging.ERROR)
     
+    _sentry_log_listener = _ScopedQueueListener(
+        log_queue, sentry_handler, respect_handler_level=True
+    )
+    _sentry_log_listener.start()
+    atexit.register(_stop_sentry_log_listener)
+    
+    # Add queue handler to root logger
     root_logger = logging.getLogger()
-    root_logger.addHandler(sentry_handler)
+    root_logger.addHandler(_sentry_queue_handler)
     
     logger.info("Sentry logging handler configured")
 
 
+def _stop_sentry_log_listener() -> None:
+    """Stop the Sentry log listener after forwarding queued records.
+    
+    The queue handler is detached first, so no records are queued once the
+    listener has stopped.
+    """
+    global _sentry_log_listener, _sentry_queue_handler
+    
+    if _sentry_queue_handler is not None:
+        logging.getLogger().removeHandler(_sentry_queue_handler)
+        _sentry_queue_handler = None
+    
+    if _sentry_log_listener is not None:
+        _sentry_log_listener.stop()
+        _sentry_log_listener = None
+
+
+def flush_sentry(timeout: float = 2.0) -> None:
+    """Forward queued log records and wait for pending Sentry events.
+    
+    Args:
+        timeout: Maximum seconds to wait for events to be sent
+    """
+    if not SENTRY_AVAILABLE:
+        return
+    
+    _stop_sentry_log_listener()
+    sentry_sdk.flush(timeout=timeout)
+
+
 # Export functions
 __all__ = [
     "setup_sentry",
@@ -257,4 +377,5 @@ __all__ = [
     "set_user_context",
     "add_breadcrumb",
     "configure_sentry_logging_handler",
+    "flush_sentry",
 ]
\ No newline at end of file
@@ -1,14 +1,24 @@
-"""Database clients for three-database architecture."""
+"""Database clients for three-database architecture.
 
-from src.db.clients.airtable_client import AirtableClient
-from src.db.clients.base_client import BaseDatabaseClient, BaseRecord, SyncResult
-from src.db.clients.pinecone_client import PineconeClient
-from src.db.clients.supabase_client import SupabaseClient
-from src.db.clients.sync_manager import (
-    ConsistencyResult,
-    QueryType,
-    ThreeDatabaseSyncManager,
-)
+Clients are imported on first access, so using one client doesn't require
+the SDKs of the others to be installed.
+"""
+
+import importlib
+from typing import Any
+
+# Exported name -> module that defines it
+_EXPORTS = {
+    "AirtableClient": "src.db.clients.airtable_client",
+    "BaseDatabaseClient": "src.db.clients.base_client",
+    "BaseRecord": "src.db.clients.base_client",
+    "ConsistencyResult": "src.db.clients.sync_manager",
+    "PineconeClient": "src.db.clients.pinecone_client",
+    "QueryType": "src.db.clients.sync_manager",
+    "SupabaseClient": "src.db.clients.supabase_client",
+    "SyncResult": "src.db.clients.base_client",
+    "ThreeDatabaseSyncManager": "src.db.clients.sync_manager",
+}
 
 __all__ = [
     "AirtableClient",
@@ -20,4 +30,14 @@ __all__ = [
     "SupabaseClient",
     "SyncResult",
     "ThreeDatabaseSyncManager",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported client from its module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
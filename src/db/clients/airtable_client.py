@@ -1,15 +1,246 @@
 """Airtable client implementation for visual interface layer."""
 
 import asyncio
+import contextvars
+import json
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
-from pyairtable import Api, Base, Table
-from pyairtable.formulas import match
+from pyairtable import Api, Table
+from pyairtable.formulas import AND, EQ, FALSE, OR, RECORD_ID, match
+from requests.adapters import HTTPAdapter
 
 from src.core.config import settings
-from src.core.logging import logger
+from src.core.logging import get_logger
 from src.db.clients.base_client import BaseDatabaseClient, SyncResult
+from src.utils.memory_cache import LRUCache
+from src.utils.token_bucket import TokenBucket
+
+logger = get_logger(__name__)
+
+# Airtable accepts at most 10 records per write request
+AIRTABLE_BATCH_SIZE = 10
+
+# Records fetched per list request (Airtable's maximum)
+AIRTABLE_PAGE_SIZE = 100
+
+# Airtable allows 5 requests per second per base
+AIRTABLE_MAX_CONCURRENCY = 5
+AIRTABLE_REQUESTS_PER_SECOND = 5
+
+# Airtable table for each record type; other types go to "Records"
+_TABLE_MAPPING = {
+    "youtube_video": "YouTube Videos",
+    "legal_website": "Legal Websites",
+    "transcript": "Transcripts",
+    "legal_entity": "Legal Entities",
+    "search_query": "Search Queries",
+}
+
+# Every table records may live in, probed when a record's table is unknown
+AIRTABLE_TABLES = (*_TABLE_MAPPING.values(), "Records")
+
+# Standard fields shared by all record types, as (standard, Airtable) names
+_COMMON_FIELDS = (
+    ("id", "Record ID"),
+    ("record_type", "Record Type"),
+    ("created_at", "Created At"),
+    ("updated_at", "Updated At"),
+    ("synced_at", "Synced At"),
+    ("source_system", "Source System"),
+    ("source_id", "Source ID"),
+    ("sync_version", "Sync Version"),
+    ("created_by", "Created By"),
+    ("updated_by", "Updated By"),
+    ("agent_version", "Agent Version"),
+)
+
+# Fields copied as-is for each record type, as (standard, Airtable) names
+_TYPE_FIELDS = {
+    "youtube_video": (
+        ("title", "Video Title"),
+        ("channel_name", "Channel Name"),
+        ("url", "Video URL"),
+        ("duration", "Duration"),
+        ("view_count", "View Count"),
+        ("published_at", "Published Date"),
+        ("description", "Description"),
+    ),
+    "legal_website": (
+        ("name", "Website Name"),
+        ("url", "Website URL"),
+        ("content_type", "Content Type"),
+        ("jurisdiction", "Jurisdiction"),
+        ("last_scraped", "Last Scraped"),
+        ("quality_score", "Quality Score"),
+        ("authority_level", "Authority Level"),
+    ),
+    "transcript": (
+        ("content", "Content"),
+        ("source_type", "Source Type"),
+        ("source_url", "Source URL"),
+        ("language", "Language"),
+        ("duration_seconds", "Duration Seconds"),
+        ("confidence_score", "Confidence Score"),
+    ),
+}
+
+# Standard fields holding dates, sent to Airtable as ISO 8601 strings
+_DATETIME_FIELDS = frozenset(("created_at", "updated_at", "synced_at", "published_at", "last_scraped"))
+
+# Maximum number of Airtable record IDs whose table is remembered
+ID_INDEX_MAX_SIZE = 10_000
+
+# Fields Airtable uses to match incoming records against existing rows
+UPSERT_KEY_FIELDS = ["Record ID"]
+
+# Maximum number of records whose last upserted payload hash is remembered
+PAYLOAD_HASH_MAX_SIZE = 100_000
+
+
+@lru_cache(maxsize=1024)
+def _airtable_field_name(field: str) -> str:
+    """Convert a snake_case field name to its Airtable name, memoized."""
+    return field.replace("_", " ").title()
+
+
+def _word_count(record: Dict[str, Any]) -> int:
+    """Word count of a transcript, preferring one computed upstream."""
+    word_count = record.get("word_count")
+    if word_count is not None:
+        return word_count
+    return len(record.get("content", "").split())
+
+
+def _field_copier(field_map: Tuple[Tuple[str, str], ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build a function that copies the given non-None fields under their Airtable names.
+    
+    Date fields are split out once here, so only they are checked for datetime
+    values needing ISO 8601 serialization on each copy.
+    """
+    plain_fields = tuple(pair for pair in field_map if pair[0] not in _DATETIME_FIELDS)
+    date_fields = tuple(pair for pair in field_map if pair[0] in _DATETIME_FIELDS)
+    
+    def copy_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+        airtable_record = {
+            airtable_key: value
+            for key, airtable_key in plain_fields
+            if (value := record.get(key)) is not None
+        }
+        for key, airtable_key in date_fields:
+            value = record.get(key)
+            if value is not None:
+                airtable_record[airtable_key] = value.isoformat() if isinstance(value, datetime) else value
+        return airtable_record
+    return copy_fields
+
+
+# Field copiers specialized per record type once, at import time
+_copy_common_fields = _field_copier(_COMMON_FIELDS)
+_FIELD_COPIERS = {
+    record_type: _field_copier(_COMMON_FIELDS + fields)
+    for record_type, fields in _TYPE_FIELDS.items()
+}
+
+
+def _add_youtube_video_fields(record: Dict[str, Any], airtable_record: Dict[str, Any]) -> None:
+    """Add computed Airtable fields for a YouTube video."""
+    airtable_record["Tags"] = ", ".join(record.get("tags", []))
+    if record.get("thumbnail_url"):
+        airtable_record["Thumbnail"] = [{"url": record["thumbnail_url"]}]
+    if (categories := record.get("legal_categories", [])) is not None:
+        airtable_record["Legal Categories"] = categories
+    if (has_transcript := record.get("has_transcript", False)) is not None:
+        airtable_record["Transcript Available"] = has_transcript
+
+
+def _add_legal_website_fields(record: Dict[str, Any], airtable_record: Dict[str, Any]) -> None:
+    """Add computed Airtable fields for a legal website."""
+    if (topics := record.get("legal_topics", [])) is not None:
+        airtable_record["Legal Topics"] = topics
+
+
+def _add_transcript_fields(record: Dict[str, Any], airtable_record: Dict[str, Any]) -> None:
+    """Add computed Airtable fields for a transcript."""
+    airtable_record["Word Count"] = _word_count(record)
+    if (entities := record.get("legal_entities", [])) is not None:
+        airtable_record["Legal Entities"] = entities
+
+
+# Computed field handlers per record type
+_COMPUTED_FIELD_ADDERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], None]] = {
+    "youtube_video": _add_youtube_video_fields,
+    "legal_website": _add_legal_website_fields,
+    "transcript": _add_transcript_fields,
+}
+
+
+@lru_cache(maxsize=1024)
+def _standard_field_name(field: str) -> str:
+    """Convert an Airtable field name to its snake_case name, memoized."""
+    return field.lower().replace(" ", "_")
+
+
+# Standard names of the fields every record exposes, mapped to Airtable names
+_STANDARD_TO_AIRTABLE = dict(_COMMON_FIELDS)
+_STANDARD_NAMES = frozenset(("airtable_id", *_STANDARD_TO_AIRTABLE))
+
+
+class AirtableRecordView(Mapping[str, Any]):
+    """Read-only view of an Airtable record in standard format.
+    
+    Field names are converted when a field is accessed instead of copying every
+    field into a new dict, since most callers only read a few fields.
+    """
+    
+    __slots__ = ("_record", "_fields")
+    
+    def __init__(self, airtable_record: Dict[str, Any]):
+        """Wrap a raw Airtable record.
+        
+        Args:
+            airtable_record: Record from Airtable
+        """
+        self._record = airtable_record
+        self._fields = airtable_record.get("fields", {})
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == "airtable_id":
+            return self._record.get("id")
+        if key in _STANDARD_TO_AIRTABLE:
+            return self._fields.get(_STANDARD_TO_AIRTABLE[key])
+        
+        # Most Airtable names are the title-cased standard name; others
+        # (e.g. "Video URL") are found by converting each field name
+        airtable_key = _airtable_field_name(key)
+        if airtable_key in self._fields:
+            return self._fields[airtable_key]
+        for field, value in self._fields.items():
+            if _standard_field_name(field) == key:
+                return value
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        yield "airtable_id"
+        yield from _STANDARD_TO_AIRTABLE
+        for field in self._fields:
+            key = _standard_field_name(field)
+            if key not in _STANDARD_NAMES:
+                yield key
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __repr__(self) -> str:
+        return f"AirtableRecordView({self.to_dict()!r})"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy the record into a plain dict."""
+        return dict(self)
 
 
 class AirtableClient(BaseDatabaseClient):
@@ -36,14 +267,48 @@ class AirtableClient(BaseDatabaseClient):
         super().__init__(config)
         
         self.api = None
-        self.base = None
-        self._tables = {}
+        self._tables: Dict[str, Table] = {}
+        # pyairtable is synchronous; its calls run on threads of their own so
+        # they never wait behind other work on the loop's default executor.
+        # The threads live from connect() to disconnect()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._limiter = TokenBucket(
+            rate=AIRTABLE_REQUESTS_PER_SECOND, capacity=AIRTABLE_REQUESTS_PER_SECOND
+        )
+        self._id_to_table: OrderedDict[str, str] = OrderedDict()
+        
+        # Record ID -> (payload hash, Airtable ID) of the last successful upsert
+        self._payload_hashes: OrderedDict[str, Tuple[int, str]] = OrderedDict()
+        self._payload_keys: Dict[str, str] = {}  # Airtable ID -> Record ID
+        
+        # Short-lived read-through caches, invalidated on writes
+        self._get_cache = LRUCache(maxsize=5000, ttl=30)
+        self._query_cache = LRUCache(maxsize=1000, ttl=15)
     
     async def connect(self) -> None:
         """Establish connection to Airtable."""
         try:
             self.api = Api(self.config["api_key"])
-            self.base = Base(self.api, self.config["base_id"])
+            
+            # Keep one pooled keep-alive connection per concurrent request, so
+            # concurrent batches reuse TLS connections instead of opening new ones
+            retries = self.api.session.get_adapter("https://").max_retries
+            self.api.session.mount("https://", HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=AIRTABLE_MAX_CONCURRENCY,
+                max_retries=retries,
+            ))
+            
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=AIRTABLE_MAX_CONCURRENCY, thread_name_prefix="airtable"
+                )
+            
+            # Table handles for every known table are created up front
+            self._tables = {
+                table_name: self.api.table(self.config["base_id"], table_name)
+                for table_name in AIRTABLE_TABLES
+            }
             logger.info("Connected to Airtable", base_id=self.config["base_id"])
         except Exception as e:
             logger.error("Failed to connect to Airtable", error=str(e))
@@ -51,10 +316,16 @@ class AirtableClient(BaseDatabaseClient):
     
     async def disconnect(self) -> None:
         """Close connection to Airtable."""
-        # Airtable uses REST API, no persistent connection to close
+        # Release the session's pooled keep-alive connections
+        if self.api is not None:
+            self.api.session.close()
         self.api = None
-        self.base = None
         self._tables.clear()
+        
+        # Calls still running finish on their threads; the threads then exit
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         logger.info("Disconnected from Airtable")
     
     def _get_table(self, table_name: str) -> Table:
@@ -67,7 +338,7 @@ class AirtableClient(BaseDatabaseClient):
             Table object
         """
         if table_name not in self._tables:
-            self._tables[table_name] = self.base.table(table_name)
+            self._tables[table_name] = self.api.table(self.config["base_id"], table_name)
         return self._tables[table_name]
     
     def _prepare_for_airtable(self, record: Dict[str, Any]) -> Dict[str, Any]:
@@ -79,65 +350,24 @@ class AirtableClient(BaseDatabaseClient):
         Returns:
             Record in Airtable format
         """
-        # Map standard fields to human-readable Airtable fields
-        airtable_record = {
-            "Record ID": record.get("id"),
-            "Record Type": record.get("record_type"),
-            "Created At": record.get("created_at"),
-            "Updated At": record.get("updated_at"),
-            "Synced At": record.get("synced_at"),
-            "Source System": record.get("source_system"),
-            "Source ID": record.get("source_id"),
-            "Sync Version": record.get("sync_version"),
-            "Created By": record.get("created_by"),
-            "Updated By": record.get("updated_by"),
-            "Agent Version": record.get("agent_version"),
-        }
+        record_type = record.get("record_type")
+        
+        # Map standard fields to human-readable Airtable fields. None values
+        # are never added, since Airtable doesn't like them
+        airtable_record = _FIELD_COPIERS.get(record_type, _copy_common_fields)(record)
+        
+        # Add record-type specific computed fields
+        add_computed_fields = _COMPUTED_FIELD_ADDERS.get(record_type)
+        if add_computed_fields is not None:
+            add_computed_fields(record, airtable_record)
         
-        # Add record-type specific fields
-        if record.get("record_type") == "youtube_video":
-            airtable_record.update({
-                "Video Title": record.get("title"),
-                "Channel Name": record.get("channel_name"),
-                "Video URL": record.get("url"),
-                "Duration": record.get("duration"),
-                "View Count": record.get("view_count"),
-                "Published Date": record.get("published_at"),
-                "Description": record.get("description"),
-                "Tags": ", ".join(record.get("tags", [])),
-                "Thumbnail": [{"url": record.get("thumbnail_url")}] if record.get("thumbnail_url") else None,
-                "Legal Categories": record.get("legal_categories", []),
-                "Transcript Available": record.get("has_transcript", False),
-            })
-        elif record.get("record_type") == "legal_website":
-            airtable_record.update({
-                "Website Name": record.get("name"),
-                "Website URL": record.get("url"),
-                "Content Type": record.get("content_type"),
-                "Legal Topics": record.get("legal_topics", []),
-                "Jurisdiction": record.get("jurisdiction"),
-                "Last Scraped": record.get("last_scraped"),
-                "Quality Score": record.get("quality_score"),
-                "Authority Level": record.get("authority_level"),
-            })
-        elif record.get("record_type") == "transcript":
-            airtable_record.update({
-                "Content": record.get("content"),
-                "Source Type": record.get("source_type"),
-                "Source URL": record.get("source_url"),
-                "Language": record.get("language"),
-                "Duration Seconds": record.get("duration_seconds"),
-                "Word Count": len(record.get("content", "").split()),
-                "Confidence Score": record.get("confidence_score"),
-                "Legal Entities": record.get("legal_entities", []),
-            })
-        
-        # Add any additional metadata
+        # Add any additional metadata, serialized once as compact JSON
         if "metadata" in record:
-            airtable_record["Metadata"] = str(record["metadata"])
+            airtable_record["Metadata"] = json.dumps(
+                record["metadata"], separators=(",", ":"), default=str
+            )
         
-        # Remove None values (Airtable doesn't like them)
-        return {k: v for k, v in airtable_record.items() if v is not None}
+        return airtable_record
     
     async def upsert(self, record: Dict[str, Any]) -> SyncResult:
         """Insert or update a record in Airtable.
@@ -148,77 +378,104 @@ class AirtableClient(BaseDatabaseClient):
         Returns:
             SyncResult indicating success or failure
         """
-        try:
-            table_name = self._get_table_name(record.get("record_type", "default"))
-            table = self._get_table(table_name)
-            
-            airtable_data = self._prepare_for_airtable(record)
-            
-            # Check if record exists
-            existing = None
-            if record.get("airtable_id"):
-                try:
-                    existing = table.get(record["airtable_id"])
-                except:
-                    pass
-            
-            if not existing and record.get("id"):
-                # Search by Record ID
-                formula = match({"Record ID": record["id"]})
-                results = table.all(formula=formula)
-                if results:
-                    existing = results[0]
-            
-            if existing:
-                # Update existing record
-                updated = table.update(existing["id"], airtable_data)
-                return SyncResult(
-                    success=True,
-                    database="Airtable",
-                    record_id=updated["id"],
-                )
-            else:
-                # Create new record
-                created = table.create(airtable_data)
-                return SyncResult(
-                    success=True,
-                    database="Airtable",
-                    record_id=created["id"],
-                )
-                
-        except Exception as e:
-            logger.error("Airtable upsert failed", error=str(e), record_id=record.get("id"))
-            return SyncResult(
-                success=False,
-                database="Airtable",
-                error=str(e),
-            )
+        results = await self.batch_upsert([record])
+        return results[0]
     
-    async def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+    async def get(self, record_id: str, record_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Retrieve a record from Airtable.
         
         Args:
             record_id: Airtable record ID
+            record_type: Record type, if known, to read from its table directly
             
         Returns:
             Record data if found, None otherwise
         """
+        cached = self._get_cache.get(record_id)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            # Try all tables
-            for table_name in ["youtube_videos", "legal_websites", "transcripts", "default"]:
+            for table_name in self._candidate_tables(record_id, record_type):
                 table = self._get_table(table_name)
                 try:
-                    record = table.get(record_id)
+                    record = await self._call(table.get, record_id)
                     if record:
-                        return self._from_airtable_format(record)
-                except:
+                        self._remember_table(record_id, table_name)
+                        result = self._from_airtable_format(record)
+                        self._get_cache.set(record_id, result)
+                        return dict(result)
+                except Exception:
                     continue
             return None
         except Exception as e:
             logger.error("Airtable get failed", error=str(e), record_id=record_id)
             return None
     
-    async def query(self, filters: Dict[str, Any], limit: int = 100) -> List[Dict[str, Any]]:
+    async def get_many(
+        self, record_ids: List[str], record_type: Optional[str] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Retrieve many records from Airtable, up to 100 per request.
+        
+        Records are fetched with a RECORD_ID() formula per table instead of one
+        request per record.
+        
+        Args:
+            record_ids: Airtable record IDs
+            record_type: Record type, if known, to read from its table directly
+            
+        Returns:
+            Record data for each ID, in input order, or None if not found
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        ids_by_table: Dict[str, List[str]] = {}
+        for record_id in dict.fromkeys(record_ids):
+            cached = self._get_cache.get(record_id)
+            if cached is not None:
+                found[record_id] = cached
+                continue
+            for table_name in self._candidate_tables(record_id, record_type):
+                ids_by_table.setdefault(table_name, []).append(record_id)
+        
+        fetches = [
+            (table_name, self._fetch_by_ids(table_name, ids[i:i + AIRTABLE_PAGE_SIZE]))
+            for table_name, ids in ids_by_table.items()
+            for i in range(0, len(ids), AIRTABLE_PAGE_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(coro for _, coro in fetches), return_exceptions=True
+        )
+        
+        for (table_name, _), records in zip(fetches, responses):
+            if isinstance(records, Exception):
+                logger.error("Airtable get_many failed", error=str(records), table=table_name)
+                continue
+            for record in records:
+                self._remember_table(record["id"], table_name)
+                result = self._from_airtable_format(record)
+                self._get_cache.set(record["id"], result)
+                found[record["id"]] = result
+        
+        return [
+            dict(found[record_id]) if record_id in found else None
+            for record_id in record_ids
+        ]
+    
+    async def _fetch_by_ids(self, table_name: str, record_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch up to 100 records from one table by Airtable record ID.
+        
+        Args:
+            table_name: Table to read from
+            record_ids: Airtable record IDs
+            
+        Returns:
+            Raw Airtable records found in the table
+        """
+        formula = str(OR(*(EQ(RECORD_ID(), record_id) for record_id in record_ids)))
+        table = self._get_table(table_name)
+        return await self._call(table.all, formula=formula, max_records=len(record_ids))
+    
+    async def query(self, filters: Dict[str, Any], limit: int = 100) -> List[Mapping[str, Any]]:
         """Query records from Airtable.
         
         Args:
@@ -226,51 +483,85 @@ class AirtableClient(BaseDatabaseClient):
             limit: Maximum number of records to return
             
         Returns:
-            List of matching records
+            List of matching records, as read-only AirtableRecordView mappings
         """
         try:
-            table_name = self._get_table_name(filters.get("record_type", "default"))
-            table = self._get_table(table_name)
-            
-            # Build Airtable formula from filters
-            formula_parts = []
-            for key, value in filters.items():
-                if key != "record_type":
-                    airtable_key = self._to_airtable_field_name(key)
-                    formula_parts.append(f"{{{airtable_key}}} = '{value}'")
-            
-            formula = None
-            if formula_parts:
-                formula = "AND(" + ", ".join(formula_parts) + ")"
+            cache_key = (frozenset(filters.items()), limit)
+            hash(cache_key)
+        except TypeError:
+            # Unhashable filter values (e.g. lists) are not cached
+            cache_key = None
+        
+        if cache_key is not None:
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+        
+        try:
+            results = [record async for record in self.iterate(filters, limit=limit)]
             
-            records = table.all(formula=formula, max_records=limit)
-            return [self._from_airtable_format(r) for r in records]
+            if cache_key is not None:
+                self._query_cache.set(cache_key, results)
+            return list(results)
             
         except Exception as e:
             logger.error("Airtable query failed", error=str(e), filters=filters)
             return []
     
-    async def delete(self, record_id: str) -> SyncResult:
+    async def iterate(
+        self, filters: Dict[str, Any], limit: int = 100
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """Stream matching records from Airtable one page at a time.
+        
+        Each page is fetched in a worker thread and its records are yielded
+        before the next page is requested, so only one page is held in memory.
+        
+        Args:
+            filters: Query filters
+            limit: Maximum number of records to yield
+            
+        Yields:
+            Matching records in standard format
+        """
+        table_name = self._get_table_name(filters.get("record_type", "default"))
+        table = self._get_table(table_name)
+        
+        formula = self._build_formula(filters)
+        pages = table.iterate(page_size=AIRTABLE_PAGE_SIZE, formula=formula, max_records=limit)
+        while True:
+            page = await self._call(next, pages, None)
+            if page is None:
+                return
+            for record in page:
+                self._remember_table(record["id"], table_name)
+                yield AirtableRecordView(record)
+    
+    async def delete(self, record_id: str, record_type: Optional[str] = None) -> SyncResult:
         """Delete a record from Airtable.
         
         Args:
             record_id: Airtable record ID
+            record_type: Record type, if known, to delete from its table directly
             
         Returns:
             SyncResult indicating success or failure
         """
         try:
-            # Try all tables
-            for table_name in ["youtube_videos", "legal_websites", "transcripts", "default"]:
+            for table_name in self._candidate_tables(record_id, record_type):
                 table = self._get_table(table_name)
                 try:
-                    table.delete(record_id)
+                    await self._call(table.delete, record_id)
+                    self._id_to_table.pop(record_id, None)
+                    self._invalidate_cached(record_id)
+                    
+                    # A deleted record must be written again on its next upsert
+                    self._forget_payload(record_id)
                     return SyncResult(
                         success=True,
                         database="Airtable",
                         record_id=record_id,
                     )
-                except:
+                except Exception:
                     continue
                     
             return SyncResult(
@@ -287,53 +578,243 @@ class AirtableClient(BaseDatabaseClient):
                 error=str(e),
             )
     
+    def _build_formula(self, filters: Dict[str, Any]) -> Optional[str]:
+        """Build an Airtable filter formula from query filters.
+        
+        Values are escaped by pyairtable, so quotes in a value cannot break the
+        formula. List values match any of their items, so an empty list
+        matches no records.
+        
+        Args:
+            filters: Query filters; record_type selects the table, not rows
+            
+        Returns:
+            Formula string, or None to match every record
+        """
+        conditions = []
+        for key, value in filters.items():
+            if key == "record_type":
+                continue
+            airtable_key = self._to_airtable_field_name(key)
+            if isinstance(value, (list, tuple, set)):
+                if not value:
+                    # OR() needs at least one argument
+                    return str(FALSE())
+                conditions.append(OR(*(match({airtable_key: v}) for v in value)))
+            else:
+                conditions.append(match({airtable_key: value}))
+        
+        if not conditions:
+            return None
+        return str(AND(*conditions))
+    
+    def _candidate_tables(self, record_id: str, record_type: Optional[str]) -> List[str]:
+        """List the tables that may hold a record, most likely first.
+        
+        Args:
+            record_id: Airtable record ID
+            record_type: Record type, if known
+            
+        Returns:
+            Table names to try in order
+        """
+        if record_type:
+            return [self._get_table_name(record_type)]
+        if record_id in self._id_to_table:
+            return [self._id_to_table[record_id]]
+        return list(AIRTABLE_TABLES)
+    
+    def _invalidate_cached(self, airtable_id: str) -> None:
+        """Drop cached reads that a write to a record may have made stale.
+        
+        Args:
+            airtable_id: Airtable record ID that was written
+        """
+        self._get_cache.pop(airtable_id)
+        self._query_cache.clear()
+    
+    def _remember_table(self, airtable_id: str, table_name: str) -> None:
+        """Record which table an Airtable record lives in.
+        
+        Args:
+            airtable_id: Airtable record ID
+            table_name: Table holding the record
+        """
+        self._id_to_table[airtable_id] = table_name
+        self._id_to_table.move_to_end(airtable_id)
+        if len(self._id_to_table) > ID_INDEX_MAX_SIZE:
+            self._id_to_table.popitem(last=False)
+    
     async def batch_upsert(self, records: List[Dict[str, Any]]) -> List[SyncResult]:
         """Batch insert or update multiple records.
         
+        Records are matched on their Record ID server-side (Airtable's
+        performUpsert), so existing rows are updated and new ones created in
+        the same request. Records whose payload is unchanged since their last
+        successful upsert are not sent again.
+        
         Args:
             records: List of records to upsert
             
         Returns:
-            List of SyncResults for each record
+            List of SyncResults for each record, in input order
         """
-        results = []
+        results: List[Optional[SyncResult]] = [None] * len(records)
+        payloads: Dict[int, Tuple[Dict[str, Any], str, int]] = {}
         
-        # Group records by table
-        records_by_table = {}
-        for record in records:
+        # Group record positions by table, skipping records unchanged since
+        # their last successful upsert
+        positions_by_table: Dict[str, List[int]] = {}
+        for position, record in enumerate(records):
+            if not record.get("id") and not record.get("airtable_id"):
+                results[position] = SyncResult(
+                    success=False,
+                    database="Airtable",
+                    error="Record ID is required for upsert",
+                )
+                continue
+            
+            try:
+                payload = self._to_upsert_payload(record)
+                payload_key = record.get("id") or record["airtable_id"]
+                payload_hash = hash(json.dumps(payload, sort_keys=True, default=str))
+            except Exception as e:
+                logger.error("Failed to prepare Airtable record", error=str(e), record_id=record.get("id"))
+                results[position] = SyncResult(
+                    success=False,
+                    database="Airtable",
+                    error=str(e),
+                )
+                continue
+            
+            last_upsert = self._payload_hashes.get(payload_key)
+            if last_upsert is not None and last_upsert[0] == payload_hash:
+                results[position] = SyncResult(
+                    success=True,
+                    database="Airtable",
+                    record_id=last_upsert[1],
+                    skipped=True,
+                )
+                continue
+            
+            payloads[position] = (payload, payload_key, payload_hash)
             table_name = self._get_table_name(record.get("record_type", "default"))
-            if table_name not in records_by_table:
-                records_by_table[table_name] = []
-            records_by_table[table_name].append(record)
+            positions_by_table.setdefault(table_name, []).append(position)
         
-        # Process each table's records in batches of 10 (Airtable limit)
-        for table_name, table_records in records_by_table.items():
+        # Split each table's records into batches of 10 (Airtable limit)
+        batches = []
+        for table_name, positions in positions_by_table.items():
             table = self._get_table(table_name)
+            for i in range(0, len(positions), AIRTABLE_BATCH_SIZE):
+                batch = positions[i:i + AIRTABLE_BATCH_SIZE]
+                batch_data = [payloads[p][0] for p in batch]
+                batches.append((table_name, batch, self._upsert_batch(table, batch_data)))
+        
+        # Send batches concurrently, bounded by the per-base request limit
+        responses = await asyncio.gather(
+            *(coro for _, _, coro in batches), return_exceptions=True
+        )
+        
+        for (table_name, batch, _), response in zip(batches, responses):
+            if isinstance(response, Exception):
+                logger.error("Airtable batch upsert failed", error=str(response), table=table_name)
+                for position in batch:
+                    results[position] = SyncResult(
+                        success=False,
+                        database="Airtable",
+                        error=str(response),
+                    )
+                continue
             
-            for i in range(0, len(table_records), 10):
-                batch = table_records[i:i + 10]
-                batch_data = [self._prepare_for_airtable(r) for r in batch]
-                
-                try:
-                    # Airtable batch create
-                    created = table.batch_create(batch_data)
-                    for record in created:
-                        results.append(SyncResult(
-                            success=True,
-                            database="Airtable",
-                            record_id=record["id"],
-                        ))
-                except Exception as e:
-                    logger.error("Airtable batch upsert failed", error=str(e))
-                    for _ in batch:
-                        results.append(SyncResult(
-                            success=False,
-                            database="Airtable",
-                            error=str(e),
-                        ))
+            for position, record in zip(batch, response["records"]):
+                self._remember_table(record["id"], table_name)
+                self._invalidate_cached(record["id"])
+                self._remember_payload(payloads[position], record["id"])
+                results[position] = SyncResult(
+                    success=True,
+                    database="Airtable",
+                    record_id=record["id"],
+                )
         
         return results
     
+    def _remember_payload(self, payload: Tuple[Dict[str, Any], str, int], airtable_id: str) -> None:
+        """Record the hash of a successfully upserted payload.
+        
+        Args:
+            payload: Upserted (payload, Record ID, payload hash)
+            airtable_id: Airtable record ID the payload was written to
+        """
+        _, payload_key, payload_hash = payload
+        previous = self._payload_hashes.get(payload_key)
+        if previous is not None and previous[1] != airtable_id:
+            self._payload_keys.pop(previous[1], None)
+        self._payload_hashes[payload_key] = (payload_hash, airtable_id)
+        self._payload_hashes.move_to_end(payload_key)
+        self._payload_keys[airtable_id] = payload_key
+        if len(self._payload_hashes) > PAYLOAD_HASH_MAX_SIZE:
+            _, (_, evicted_id) = self._payload_hashes.popitem(last=False)
+            self._payload_keys.pop(evicted_id, None)
+    
+    def _forget_payload(self, airtable_id: str) -> None:
+        """Forget the upserted payload hash of a record, so it is written again.
+        
+        Args:
+            airtable_id: Airtable record ID
+        """
+        payload_key = self._payload_keys.pop(airtable_id, None)
+        if payload_key is not None:
+            self._payload_hashes.pop(payload_key, None)
+    
+    async def _upsert_batch(self, table: Table, batch_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send one performUpsert request without blocking the event loop.
+        
+        Args:
+            table: Table to write to
+            batch_data: Up to 10 upsert payloads
+            
+        Returns:
+            Airtable upsert response
+        """
+        return await self._call(
+            table.batch_upsert, batch_data, key_fields=UPSERT_KEY_FIELDS, typecast=True
+        )
+    
+    async def _call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a pyairtable call on the client's executor, within the base's rate limit.
+        
+        Requests wait for a token before being sent, so the client stays under
+        Airtable's per-base limit instead of hitting 429s and backing off. The
+        executor's size bounds how many requests are in flight at once.
+        
+        Args:
+            func: Blocking pyairtable method to call
+            *args: Positional arguments for the call
+            **kwargs: Keyword arguments for the call
+            
+        Returns:
+            The call's result
+        """
+        await self._limiter.acquire()
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(context.run, func, *args, **kwargs)
+        )
+    
+    def _to_upsert_payload(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a performUpsert record payload.
+        
+        Args:
+            record: Record in standard format
+            
+        Returns:
+            Payload with Airtable fields and, when known, the Airtable record ID
+        """
+        payload = {"fields": self._prepare_for_airtable(record)}
+        if record.get("airtable_id"):
+            payload["id"] = record["airtable_id"]
+        return payload
+    
     def _get_table_name(self, record_type: str) -> str:
         """Get Airtable table name for a record type.
         
@@ -343,14 +824,7 @@ class AirtableClient(BaseDatabaseClient):
         Returns:
             Table name
         """
-        table_mapping = {
-            "youtube_video": "YouTube Videos",
-            "legal_website": "Legal Websites",
-            "transcript": "Transcripts",
-            "legal_entity": "Legal Entities",
-            "search_query": "Search Queries",
-        }
-        return table_mapping.get(record_type, "Records")
+        return _TABLE_MAPPING.get(record_type, "Records")
     
     def _to_airtable_field_name(self, field: str) -> str:
         """Convert snake_case field to Airtable human-readable format.
@@ -361,7 +835,7 @@ class AirtableClient(BaseDatabaseClient):
         Returns:
             Human-readable field name
         """
-        return field.replace("_", " ").title()
+        return _airtable_field_name(field)
     
     def _from_airtable_format(self, airtable_record: Dict[str, Any]) -> Dict[str, Any]:
         """Convert Airtable record back to standard format.
@@ -372,28 +846,4 @@ class AirtableClient(BaseDatabaseClient):
         Returns:
             Record in standard format
         """
-        fields = airtable_record.get("fields", {})
-        
-        # Map back to standard fields
-        standard_record = {
-            "airtable_id": airtable_record.get("id"),
-            "id": fields.get("Record ID"),
-            "record_type": fields.get("Record Type"),
-            "created_at": fields.get("Created At"),
-            "updated_at": fields.get("Updated At"),
-            "synced_at": fields.get("Synced At"),
-            "source_system": fields.get("Source System"),
-            "source_id": fields.get("Source ID"),
-            "sync_version": fields.get("Sync Version"),
-            "created_by": fields.get("Created By"),
-            "updated_by": fields.get("Updated By"),
-            "agent_version": fields.get("Agent Version"),
-        }
-        
-        # Add all other fields
-        for key, value in fields.items():
-            snake_key = key.lower().replace(" ", "_")
-            if snake_key not in standard_record:
-                standard_record[snake_key] = value
-        
-        return standard_record
\ No newline at end of file
+        return AirtableRecordView(airtable_record).to_dict()
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Base database client interface for three-database architecture."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,6 +19,7 @@ class SyncResult:
     record_id: Optional[str] = None
     error: Optional[str] = None
     timestamp: datetime = None
+    skipped: bool = False  # True when the write was unnecessary and not sent
     
     def __post_init__(self):
         if self.timestamp is None:
@@ -41,17 +43,17 @@ class BaseRecord:
     source_system: str  # Which agent created this
     source_id: str  # Original ID from source
     
-    # Sync metadata
-    airtable_id: Optional[str] = None
-    supabase_id: Optional[str] = None
-    pinecone_id: Optional[str] = None
-    sync_version: int = 1
-    
     # Audit
     created_by: str
     updated_by: str
     agent_version: str
     
+    # Sync metadata (defaulted fields come last)
+    airtable_id: Optional[str] = None
+    supabase_id: Optional[str] = None
+    pinecone_id: Optional[str] = None
+    sync_version: int = 1
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert record to dictionary."""
         return {
@@ -118,6 +120,20 @@ class BaseDatabaseClient(ABC):
         """
         pass
     
+    async def get_many(self, record_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Retrieve many records by ID.
+        
+        The default implementation calls get() for every ID concurrently;
+        clients that can read many records in one request override it.
+        
+        Args:
+            record_ids: IDs of the records to retrieve
+            
+        Returns:
+            Record data for each ID, in input order, or None if not found
+        """
+        return list(await asyncio.gather(*(self.get(record_id) for record_id in record_ids)))
+    
     @abstractmethod
     async def query(self, filters: Dict[str, Any], limit: int = 100) -> List[Dict[str, Any]]:
         """Query records with filters.
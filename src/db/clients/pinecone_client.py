@@ -2,17 +2,288 @@
 
 import asyncio
 import hashlib
+import json
+import sqlite3
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pinecone
 from pinecone import Index, Vector
-import openai
+from openai import AsyncOpenAI
 import numpy as np
 
 from src.core.config import settings
-from src.core.logging import logger
+from src.core.logging import get_logger
 from src.db.clients.base_client import BaseDatabaseClient, SyncResult
+from src.db.clients.pinecone_utils import batch_file_ranges, chunk_text
+from src.utils.memory_cache import LRUCache
+
+logger = get_logger(__name__)
+
+# Embedding requests in flight at once
+EMBEDDING_CONCURRENCY = 8
+
+# Limits for one multi-input embedding request: OpenAI accepts up to 2048
+# inputs and 300k tokens, budgeted here as characters (~4 per token)
+EMBEDDING_BATCH_MAX_INPUTS = 2048
+EMBEDDING_BATCH_MAX_CHARS = 1_000_000
+
+# Maximum number of embeddings kept in memory for reuse
+EMBEDDING_CACHE_SIZE = 10_000
+
+# Pinecone upsert requests in flight at once
+UPSERT_CONCURRENCY = 8
+
+# Records per fetch request in get_many; each record is fetched together with
+# its first chunk ID, within Pinecone's limit of 1000 IDs per fetch
+FETCH_BATCH_RECORDS = 500
+
+# Pinecone accepts up to 1000 vector IDs per fetch or delete request
+VECTOR_IDS_PER_REQUEST = 1000
+
+# batch_upsert embeds and upserts vectors in windows of this size, with this
+# many windows in flight at once
+PIPELINE_WINDOW_VECTORS = 512
+PIPELINE_WINDOWS_IN_FLIGHT = 4
+
+# Maximum characters of a record's content stored and embedded
+CONTENT_MAX_CHARS = 5000
+
+# Long transcripts are embedded as chunks of about 800 tokens (~4 characters
+# each) overlapping by about 100 tokens
+TRANSCRIPT_CHUNK_CHARS = 3200
+TRANSCRIPT_CHUNK_OVERLAP_CHARS = 400
+
+# Enumerated metadata also stored combined in one filter_sig field, so a filter
+# on all of them is a single equality match instead of an $and of several
+FILTER_SIG_FIELDS = ("record_type", "jurisdiction")
+
+# Batches at least this large have their metadata prepared in a worker thread
+PREPARE_IN_THREAD_MIN_RECORDS = 200
+
+# Seconds between status checks of a submitted Batch API job
+EMBEDDING_BATCH_API_POLL_INTERVAL = 60
+_BATCH_API_FINAL_STATUSES = frozenset(("completed", "failed", "expired", "cancelled"))
+
+# Metadata values stored as they are; anything else is stored as a string
+_NATIVE_METADATA_TYPES = (str, bool, int, float, list, dict)
+
+# Keys every record read back from Pinecone starts with, in this order
+_RECORD_TEMPLATE = dict.fromkeys((
+    "pinecone_id",
+    "id",
+    "record_type",
+    "source_system",
+    "source_id",
+    "created_at",
+    "updated_at",
+    "airtable_id",
+    "supabase_id",
+))
+
+
+def _add_youtube_video_metadata(record: Dict[str, Any], metadata: Dict[str, Any]) -> List[str]:
+    """Add metadata fields for a YouTube video."""
+    metadata["title"] = record.get("title", "")
+    metadata["channel_name"] = record.get("channel_name", "")
+    metadata["video_id"] = record.get("video_id")
+    metadata["url"] = record.get("url")
+    metadata["published_at"] = record.get("published_at")
+    metadata["legal_categories"] = record.get("legal_categories", [])
+    metadata["has_transcript"] = record.get("has_transcript", False)
+    return [
+        record.get("title", ""),
+        record.get("description", ""),
+        " ".join(record.get("tags", [])),
+    ]
+
+
+def _add_legal_website_metadata(record: Dict[str, Any], metadata: Dict[str, Any]) -> List[str]:
+    """Add metadata fields for a legal website."""
+    metadata["name"] = record.get("name", "")
+    metadata["url"] = record.get("url")
+    metadata["legal_topics"] = record.get("legal_topics", [])
+    metadata["jurisdiction"] = record.get("jurisdiction")
+    metadata["authority_level"] = record.get("authority_level")
+    metadata["quality_score"] = record.get("quality_score", 0.0)
+    return [
+        record.get("name", ""),
+        record.get("content", ""),
+        " ".join(record.get("legal_topics", [])),
+    ]
+
+
+def _add_transcript_metadata(record: Dict[str, Any], metadata: Dict[str, Any]) -> List[str]:
+    """Add metadata fields for a transcript."""
+    metadata["source_type"] = record.get("source_type")
+    metadata["source_url"] = record.get("source_url")
+    metadata["language"] = record.get("language", "en")
+    metadata["duration_seconds"] = record.get("duration_seconds")
+    metadata["legal_entities"] = record.get("legal_entities", [])
+    return [record.get("content", "")]
+
+
+def _add_legal_entity_metadata(record: Dict[str, Any], metadata: Dict[str, Any]) -> List[str]:
+    """Add metadata fields for a legal entity."""
+    metadata["entity_type"] = record.get("entity_type")
+    metadata["entity_text"] = record.get("entity_text")
+    metadata["normalized_text"] = record.get("normalized_text")
+    metadata["confidence_score"] = record.get("confidence_score", 0.0)
+    return [
+        record.get("entity_text", ""),
+        record.get("context", ""),
+    ]
+
+
+def _bounded_join(parts: List[Optional[str]], limit: int, sep: str = " ") -> str:
+    """Join the non-empty parts with sep, truncated to limit characters.
+    
+    Equivalent to ``sep.join(filter(None, parts))[:limit]`` but stops copying
+    once the limit is reached, so long parts are never copied in full.
+    """
+    pieces: List[str] = []
+    length = 0
+    for part in parts:
+        if not part:
+            continue
+        if pieces:
+            pieces.append(sep)
+            length += len(sep)
+        if length >= limit:
+            break
+        piece = part[:limit - length]
+        pieces.append(piece)
+        length += len(piece)
+    return "".join(pieces)[:limit]
+
+
+def _metadata_matches(stored: Any, value: Any) -> bool:
+    """Check a stored metadata value against an equality filter value.
+    
+    List metadata matches any of its items, mirroring how Pinecone evaluates
+    equality filters; vectors written before numbers and booleans kept their
+    type store them as strings, so those match the filter value's string too.
+    """
+    if isinstance(stored, list):
+        return value in stored or str(value) in stored
+    return stored is not None and (stored == value or stored == str(value))
+
+
+def _metadata_string(value: Any) -> str:
+    """Convert a metadata value Pinecone cannot store natively to a string."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _id_string(value: Any) -> Optional[str]:
+    """Store IDs as strings; Pinecone would return numeric IDs as floats."""
+    return None if value is None else str(value)
+
+
+def _filter_sig(values: Dict[str, Any]) -> str:
+    """Combine the enumerated filter fields into one filter_sig value."""
+    return "|".join(str(values.get(field) or "") for field in FILTER_SIG_FIELDS)
+
+
+# Type-specific metadata handlers per record type; each adds its fields to the
+# metadata and returns the text parts to embed
+_TYPE_METADATA_ADDERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], List[str]]] = {
+    "youtube_video": _add_youtube_video_metadata,
+    "legal_website": _add_legal_website_metadata,
+    "transcript": _add_transcript_metadata,
+    "legal_entity": _add_legal_entity_metadata,
+}
+
+
+class _EmbeddingBatchTracker:
+    """SQLite record of submitted OpenAI embedding batches and their vectors.
+    
+    Methods are blocking and open their own connection, so they can be run in
+    a worker thread.
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the tracker.
+        
+        Args:
+            path: SQLite database file, created along with its directory
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_batches ("
+                "batch_id TEXT PRIMARY KEY, created_at TEXT NOT NULL)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_batch_vectors ("
+                "batch_id TEXT NOT NULL, custom_id TEXT NOT NULL, vector_id TEXT NOT NULL, "
+                "chunk_id TEXT NOT NULL, namespace TEXT NOT NULL, metadata TEXT NOT NULL, "
+                "PRIMARY KEY (batch_id, custom_id))"
+            )
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the tracker database."""
+        return sqlite3.connect(self.path)
+    
+    def add(self, batch_id: str, vectors: List[Tuple[str, str, str, str, Dict[str, Any]]]) -> None:
+        """Record a submitted batch and the vectors waiting on it.
+        
+        Args:
+            batch_id: OpenAI batch ID
+            vectors: (custom ID, vector ID, chunk vector ID, namespace, metadata)
+                for each embedding request in the batch
+        """
+        with self._connect() as db:
+            db.execute(
+                "INSERT INTO embedding_batches VALUES (?, ?)",
+                (batch_id, datetime.utcnow().isoformat()),
+            )
+            db.executemany(
+                "INSERT INTO embedding_batch_vectors VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (batch_id, custom_id, vector_id, chunk_id, namespace, json.dumps(metadata))
+                    for custom_id, vector_id, chunk_id, namespace, metadata in vectors
+                ],
+            )
+    
+    def pending(self) -> List[str]:
+        """List the batches whose results have not been upserted yet."""
+        with self._connect() as db:
+            rows = db.execute("SELECT batch_id FROM embedding_batches ORDER BY created_at").fetchall()
+        return [batch_id for batch_id, in rows]
+    
+    def vectors(self, batch_id: str) -> Dict[str, Tuple[str, str, str, Dict[str, Any]]]:
+        """Get a batch's vectors by custom ID.
+        
+        Args:
+            batch_id: OpenAI batch ID
+            
+        Returns:
+            (vector ID, chunk vector ID, namespace, metadata) by custom ID
+        """
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT custom_id, vector_id, chunk_id, namespace, metadata "
+                "FROM embedding_batch_vectors WHERE batch_id = ?",
+                (batch_id,),
+            ).fetchall()
+        return {
+            custom_id: (vector_id, chunk_id, namespace, json.loads(metadata))
+            for custom_id, vector_id, chunk_id, namespace, metadata in rows
+        }
+    
+    def remove(self, batch_id: str) -> None:
+        """Forget a batch once its results are handled.
+        
+        Args:
+            batch_id: OpenAI batch ID
+        """
+        with self._connect() as db:
+            db.execute("DELETE FROM embedding_batch_vectors WHERE batch_id = ?", (batch_id,))
+            db.execute("DELETE FROM embedding_batches WHERE batch_id = ?", (batch_id,))
 
 
 class PineconeClient(BaseDatabaseClient):
@@ -42,9 +313,20 @@ class PineconeClient(BaseDatabaseClient):
         super().__init__(config)
         
         self.index: Optional[Index] = None
-        self.openai_client = None
+        self.openai_client: Optional[AsyncOpenAI] = None
         self._embedding_model = "text-embedding-3-large"
         self._embedding_dimensions = 1536  # For text-embedding-3-large
+        
+        # Recently generated embeddings, keyed by a digest of model and text
+        self._embedding_cache = LRUCache(maxsize=EMBEDDING_CACHE_SIZE)
+        self._embeddings_in_flight: Dict[bytes, asyncio.Future] = {}
+        self.embedding_cache_hits = 0
+        self.embedding_cache_misses = 0
+        
+        self._upsert_slots = asyncio.Semaphore(UPSERT_CONCURRENCY)
+        self._batch_tracker: Optional[_EmbeddingBatchTracker] = None
+        self._connect_lock = asyncio.Lock()
+        self._connected = False
     
     async def connect(self) -> None:
         """Establish connection to Pinecone."""
@@ -70,6 +352,7 @@ class PineconeClient(BaseDatabaseClient):
                             "created_at",
                             "legal_categories",
                             "jurisdiction",
+                            "filter_sig",
                         ]
                     }
                 )
@@ -78,47 +361,204 @@ class PineconeClient(BaseDatabaseClient):
             self.index = pinecone.Index(index_name)
             
             # Initialize OpenAI client for embeddings
-            openai.api_key = self.config["openai_api_key"]
-            self.openai_client = openai
+            self.openai_client = AsyncOpenAI(
+                api_key=self.config["openai_api_key"], max_retries=3, timeout=30
+            )
             
             # Get index stats
-            stats = self.index.describe_index_stats()
+            stats = await asyncio.to_thread(self.index.describe_index_stats)
             logger.info(
                 "Connected to Pinecone",
                 index=index_name,
                 vectors=stats.total_vector_count,
                 dimensions=stats.dimension
             )
+            self._connected = True
             
         except Exception as e:
             logger.error("Failed to connect to Pinecone", error=str(e))
             raise
     
+    async def _ensure_connected(self) -> None:
+        """Connect on first use, once, even when first used concurrently."""
+        if self._connected:
+            return
+        async with self._connect_lock:
+            if not self._connected:
+                await self.connect()
+    
     async def disconnect(self) -> None:
         """Close connection to Pinecone."""
+        self._connected = False
         self.index = None
+        if self.openai_client is not None:
+            await self.openai_client.close()
         self.openai_client = None
-        logger.info("Disconnected from Pinecone")
+        logger.info(
+            "Disconnected from Pinecone",
+            embedding_cache_hits=self.embedding_cache_hits,
+            embedding_cache_misses=self.embedding_cache_misses,
+        )
     
-    async def _generate_embedding(self, text: str) -> List[float]:
+    async def _generate_embedding(self, text: str) -> np.ndarray:
         """Generate embedding for text using OpenAI.
         
         Args:
             text: Text to embed
             
         Returns:
-            Embedding vector
+            Embedding vector as a float32 array
         """
-        try:
-            response = await asyncio.to_thread(
-                self.openai_client.Embedding.create,
-                input=text,
-                model=self._embedding_model
+        embeddings = await self._generate_embeddings_batch([text])
+        return embeddings[0]
+    
+    async def _generate_embeddings_batch(
+        self, texts: List[str], return_exceptions: bool = False
+    ) -> List[Union[np.ndarray, Exception]]:
+        """Generate embeddings for many texts, reusing cached embeddings.
+        
+        Texts embedded recently, or being embedded by a concurrent call, are
+        not sent to OpenAI again. Cached embeddings are stored as float16 to
+        halve their memory; cosine similarity is robust to the rounding.
+        
+        Args:
+            texts: Texts to embed
+            return_exceptions: Return a failed request's exception in place of
+                each of its texts' embeddings instead of raising it
+            
+        Returns:
+            Embedding vectors as float32 arrays, in the same order as texts
+        """
+        embeddings: List[Union[np.ndarray, Exception, None]] = [None] * len(texts)
+        waiting: List[Tuple[int, asyncio.Future]] = []
+        missing: Dict[bytes, List[int]] = {}
+        
+        for position, text in enumerate(texts):
+            key = self._embedding_key(text)
+            cached = self._embedding_cache.get(key)
+            if cached is not None:
+                self.embedding_cache_hits += 1
+                embeddings[position] = cached.astype(np.float32)
+            elif key in self._embeddings_in_flight:
+                self.embedding_cache_hits += 1
+                waiting.append((position, self._embeddings_in_flight[key]))
+            else:
+                if key not in missing:
+                    self.embedding_cache_misses += 1
+                missing.setdefault(key, []).append(position)
+        
+        if missing:
+            # Let concurrent calls for the same texts wait on this request
+            loop = asyncio.get_running_loop()
+            futures = {key: loop.create_future() for key in missing}
+            self._embeddings_in_flight.update(futures)
+            try:
+                requested = await self._request_embeddings(
+                    [texts[positions[0]] for positions in missing.values()]
+                )
+            except BaseException:
+                # Don't leave concurrent callers waiting if this call is cancelled
+                for future in futures.values():
+                    future.set_exception(RuntimeError("Embedding request was cancelled"))
+                    future.exception()  # Mark retrieved if nobody waits on it
+                raise
+            finally:
+                for key in futures:
+                    del self._embeddings_in_flight[key]
+            
+            for (key, positions), embedding in zip(missing.items(), requested):
+                if isinstance(embedding, Exception):
+                    futures[key].set_exception(embedding)
+                    futures[key].exception()  # Mark retrieved if nobody waits on it
+                else:
+                    self._embedding_cache.set(key, embedding.astype(np.float16))
+                    futures[key].set_result(embedding)
+                for position in positions:
+                    embeddings[position] = embedding
+        
+        if waiting:
+            results = await asyncio.gather(
+                *(future for _, future in waiting), return_exceptions=True
             )
-            return response["data"][0]["embedding"]
-        except Exception as e:
-            logger.error("Failed to generate embedding", error=str(e))
-            raise
+            for (position, _), embedding in zip(waiting, results):
+                embeddings[position] = embedding
+        
+        if not return_exceptions:
+            for embedding in embeddings:
+                if isinstance(embedding, Exception):
+                    raise embedding
+        return embeddings
+    
+    async def _request_embeddings(self, texts: List[str]) -> List[Union[np.ndarray, Exception]]:
+        """Request embeddings from OpenAI with multi-input requests.
+        
+        Texts are split into requests within OpenAI's per-request input and
+        size limits, which are sent concurrently.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors as float32 arrays in the same order as texts,
+            with a failed request's exception in place of each of its texts'
+            embeddings
+        """
+        chunks = []
+        chunk: List[str] = []
+        chunk_chars = 0
+        for text in texts:
+            if chunk and (
+                len(chunk) == EMBEDDING_BATCH_MAX_INPUTS
+                or chunk_chars + len(text) > EMBEDDING_BATCH_MAX_CHARS
+            ):
+                chunks.append(chunk)
+                chunk, chunk_chars = [], 0
+            chunk.append(text)
+            chunk_chars += len(text)
+        if chunk:
+            chunks.append(chunk)
+        
+        # Bound requests in flight so OpenAI isn't flooded
+        request_slots = asyncio.Semaphore(
+            self.config.get("embedding_concurrency", EMBEDDING_CONCURRENCY)
+        )
+        
+        async def embed_chunk(chunk: List[str]) -> np.ndarray:
+            async with request_slots:
+                response = await self.openai_client.embeddings.create(
+                    model=self._embedding_model,
+                    input=chunk,
+                    dimensions=self._embedding_dimensions,
+                    encoding_format="float"
+                )
+            data = sorted(response.data, key=lambda item: item.index)
+            return np.asarray([item.embedding for item in data], dtype=np.float32)
+        
+        responses = await asyncio.gather(
+            *(embed_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+        
+        embeddings: List[Union[np.ndarray, Exception]] = []
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                logger.error("Failed to generate embeddings", error=str(response), texts=len(chunk))
+                embeddings.extend([response] * len(chunk))
+            else:
+                embeddings.extend(response)
+        return embeddings
+    
+    def _embedding_key(self, text: str) -> bytes:
+        """Build the embedding cache key for a text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Digest of the embedding model and text
+        """
+        return hashlib.blake2b(
+            f"{self._embedding_model}|{text}".encode(), digest_size=16
+        ).digest()
     
     def _generate_vector_id(self, record: Dict[str, Any]) -> str:
         """Generate a unique vector ID for a record.
@@ -133,100 +573,55 @@ class PineconeClient(BaseDatabaseClient):
         if record.get("id"):
             return f"{record['record_type']}_{record['id']}"
         else:
-            # Generate deterministic ID from content
-            content = str(record)
-            return f"{record['record_type']}_{hashlib.md5(content.encode()).hexdigest()}"
+            # Generate deterministic ID from canonical JSON of the content
+            content = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+            digest = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+            return f"{record['record_type']}_{digest}"
     
-    def _prepare_metadata(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_metadata(self, record: Dict[str, Any], now: Optional[str] = None) -> Dict[str, Any]:
         """Prepare metadata for Pinecone storage.
         
         Args:
             record: Record data
+            now: ISO timestamp used for missing created_at/updated_at values,
+                defaults to the current time
             
         Returns:
             Metadata dictionary
         """
+        record_type = record.get("record_type")
+        if now is None:
+            now = datetime.utcnow().isoformat()
+        
         # Core metadata fields
         metadata = {
-            "record_id": record.get("id"),
-            "record_type": record.get("record_type"),
+            "record_id": _id_string(record.get("id")),
+            "record_type": record_type,
             "source_system": record.get("source_system", "lit_law411_agent"),
-            "source_id": record.get("source_id"),
-            "created_at": record.get("created_at", datetime.utcnow().isoformat()),
-            "updated_at": record.get("updated_at", datetime.utcnow().isoformat()),
-            "airtable_id": record.get("airtable_id"),
-            "supabase_id": record.get("supabase_id"),
+            "source_id": _id_string(record.get("source_id")),
+            "created_at": record.get("created_at", now),
+            "updated_at": record.get("updated_at", now),
+            "airtable_id": _id_string(record.get("airtable_id")),
+            "supabase_id": _id_string(record.get("supabase_id")),
         }
         
-        # Add searchable text content
-        content_parts = []
-        
-        if record.get("record_type") == "youtube_video":
-            metadata.update({
-                "title": record.get("title", ""),
-                "channel_name": record.get("channel_name", ""),
-                "video_id": record.get("video_id"),
-                "url": record.get("url"),
-                "published_at": record.get("published_at"),
-                "legal_categories": record.get("legal_categories", []),
-                "has_transcript": record.get("has_transcript", False),
-            })
-            content_parts.extend([
-                record.get("title", ""),
-                record.get("description", ""),
-                " ".join(record.get("tags", [])),
-            ])
-            
-        elif record.get("record_type") == "legal_website":
-            metadata.update({
-                "name": record.get("name", ""),
-                "url": record.get("url"),
-                "legal_topics": record.get("legal_topics", []),
-                "jurisdiction": record.get("jurisdiction"),
-                "authority_level": record.get("authority_level"),
-                "quality_score": record.get("quality_score", 0.0),
-            })
-            content_parts.extend([
-                record.get("name", ""),
-                record.get("content", ""),
-                " ".join(record.get("legal_topics", [])),
-            ])
-            
-        elif record.get("record_type") == "transcript":
-            metadata.update({
-                "source_type": record.get("source_type"),
-                "source_url": record.get("source_url"),
-                "language": record.get("language", "en"),
-                "duration_seconds": record.get("duration_seconds"),
-                "legal_entities": record.get("legal_entities", []),
-            })
-            content_parts.append(record.get("content", ""))
-            
-        elif record.get("record_type") == "legal_entity":
-            metadata.update({
-                "entity_type": record.get("entity_type"),
-                "entity_text": record.get("entity_text"),
-                "normalized_text": record.get("normalized_text"),
-                "confidence_score": record.get("confidence_score", 0.0),
-            })
-            content_parts.extend([
-                record.get("entity_text", ""),
-                record.get("context", ""),
-            ])
+        # Add type-specific fields and the searchable text content
+        add_type_metadata = _TYPE_METADATA_ADDERS.get(record_type)
+        content_parts: List[str] = []
+        if add_type_metadata is not None:
+            content_parts = add_type_metadata(record, metadata)
         
         # Combine content for embedding
-        metadata["content"] = " ".join(filter(None, content_parts))[:5000]  # Limit length
-        
-        # Remove None values and ensure all values are JSON-serializable
-        clean_metadata = {}
-        for key, value in metadata.items():
-            if value is not None:
-                if isinstance(value, (list, dict)):
-                    clean_metadata[key] = value
-                else:
-                    clean_metadata[key] = str(value)
+        metadata["content"] = _bounded_join(content_parts, CONTENT_MAX_CHARS)
+        metadata["filter_sig"] = _filter_sig(metadata)
         
-        return clean_metadata
+        # Remove None values; numbers and booleans keep their type so they
+        # can be range- and equality-filtered, anything else becomes a string
+        return {
+            key: value if isinstance(value, _NATIVE_METADATA_TYPES) else _metadata_string(value)
+            for key, value in metadata.items()
+            if value is not None
+        }
     
     async def upsert(self, record: Dict[str, Any]) -> SyncResult:
         """Insert or update a record in Pinecone.
@@ -237,46 +632,8 @@ class PineconeClient(BaseDatabaseClient):
         Returns:
             SyncResult indicating success or failure
         """
-        try:
-            if not self.index:
-                await self.connect()
-            
-            # Prepare metadata
-            metadata = self._prepare_metadata(record)
-            
-            # Generate embedding from content
-            content = metadata.get("content", "")
-            if not content:
-                return SyncResult(
-                    success=False,
-                    database="Pinecone",
-                    error="No content to embed",
-                )
-            
-            embedding = await self._generate_embedding(content)
-            
-            # Generate vector ID
-            vector_id = self._generate_vector_id(record)
-            
-            # Upsert to Pinecone
-            self.index.upsert(
-                vectors=[(vector_id, embedding, metadata)],
-                namespace=record.get("namespace", "default")
-            )
-            
-            return SyncResult(
-                success=True,
-                database="Pinecone",
-                record_id=vector_id,
-            )
-            
-        except Exception as e:
-            logger.error("Pinecone upsert failed", error=str(e), record_id=record.get("id"))
-            return SyncResult(
-                success=False,
-                database="Pinecone",
-                error=str(e),
-            )
+        results = await self.batch_upsert([record])
+        return results[0]
     
     async def get(self, record_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a record from Pinecone by ID.
@@ -288,18 +645,22 @@ class PineconeClient(BaseDatabaseClient):
             Record data if found, None otherwise
         """
         try:
-            if not self.index:
-                await self.connect()
+            await self._ensure_connected()
             
-            # Fetch vector by ID
-            result = self.index.fetch(
-                ids=[record_id],
+            # Fetch vector by ID, or the first chunk of a long transcript
+            first_chunk_id = f"{record_id}_c0"
+            result = await asyncio.to_thread(
+                self.index.fetch,
+                ids=[record_id, first_chunk_id],
                 namespace="default"
             )
             
             if record_id in result["vectors"]:
                 vector_data = result["vectors"][record_id]
                 return self._from_pinecone_format(record_id, vector_data)
+            if first_chunk_id in result["vectors"]:
+                vector_data = result["vectors"][first_chunk_id]
+                return self._from_pinecone_format(first_chunk_id, vector_data)
             
             return None
             
@@ -307,6 +668,48 @@ class PineconeClient(BaseDatabaseClient):
             logger.error("Pinecone get failed", error=str(e), record_id=record_id)
             return None
     
+    async def get_many(self, record_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Retrieve many records from Pinecone, up to 500 per fetch request.
+        
+        Args:
+            record_ids: Vector IDs
+            
+        Returns:
+            Record data for each ID, in input order, or None if not found
+        """
+        try:
+            await self._ensure_connected()
+            
+            unique_ids = list(dict.fromkeys(record_ids))
+            responses = await asyncio.gather(*(
+                asyncio.to_thread(
+                    self.index.fetch,
+                    ids=[
+                        vector_id
+                        for record_id in unique_ids[i:i + FETCH_BATCH_RECORDS]
+                        for vector_id in (record_id, f"{record_id}_c0")
+                    ],
+                    namespace="default"
+                )
+                for i in range(0, len(unique_ids), FETCH_BATCH_RECORDS)
+            ))
+            
+            vectors: Dict[str, Any] = {}
+            for response in responses:
+                vectors.update(response["vectors"])
+            
+            found: Dict[str, Dict[str, Any]] = {}
+            for record_id in unique_ids:
+                vector_id = record_id if record_id in vectors else f"{record_id}_c0"
+                if vector_id in vectors:
+                    found[record_id] = self._from_pinecone_format(vector_id, vectors[vector_id])
+            
+            return [found.get(record_id) for record_id in record_ids]
+            
+        except Exception as e:
+            logger.error("Pinecone get_many failed", error=str(e), records=len(record_ids))
+            return [None] * len(record_ids)
+    
     async def query(self, filters: Dict[str, Any], limit: int = 100) -> List[Dict[str, Any]]:
         """Query records from Pinecone using vector similarity or metadata filters.
         
@@ -318,8 +721,7 @@ class PineconeClient(BaseDatabaseClient):
             List of matching records
         """
         try:
-            if not self.index:
-                await self.connect()
+            await self._ensure_connected()
             
             # Check if this is a semantic search
             if "query_text" in filters:
@@ -333,11 +735,12 @@ class PineconeClient(BaseDatabaseClient):
                         metadata_filter[key] = value
                 
                 # Query by vector similarity
-                result = self.index.query(
-                    vector=query_embedding,
+                result = await asyncio.to_thread(
+                    self.index.query,
+                    vector=query_embedding.tolist(),
                     top_k=limit,
                     include_metadata=True,
-                    filter=metadata_filter if metadata_filter else None,
+                    filter=self._compact_filter(metadata_filter) if metadata_filter else None,
                     namespace=filters.get("namespace", "default")
                 )
                 
@@ -349,12 +752,92 @@ class PineconeClient(BaseDatabaseClient):
                 # Metadata-only query (less efficient in Pinecone)
                 # For better performance, use Supabase for non-semantic queries
                 logger.warning("Metadata-only query in Pinecone is inefficient")
-                return []
+                return await self._query_by_metadata(filters, limit)
                 
         except Exception as e:
             logger.error("Pinecone query failed", error=str(e), filters=filters)
             return []
     
+    def _compact_filter(self, metadata_filter: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace equality filters on every filter_sig field with one filter_sig match.
+        
+        Only done when config["filter_sig_queries"] is set, since vectors
+        upserted before filter_sig was stored don't have it.
+        
+        Args:
+            metadata_filter: Pinecone metadata filter
+            
+        Returns:
+            Equivalent metadata filter
+        """
+        if not self.config.get("filter_sig_queries"):
+            return metadata_filter
+        if not all(
+            isinstance(metadata_filter.get(field), (str, int, float))
+            for field in FILTER_SIG_FIELDS
+        ):
+            return metadata_filter
+        
+        compacted = {
+            key: value for key, value in metadata_filter.items() if key not in FILTER_SIG_FIELDS
+        }
+        compacted["filter_sig"] = _filter_sig(metadata_filter)
+        return compacted
+    
+    async def _query_by_metadata(self, filters: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+        """Find records by metadata alone by listing and fetching vectors.
+        
+        Vector IDs start with the record type, so a record_type filter narrows
+        the listing server-side; other filters are applied to the fetched
+        metadata. Listing stops once enough matches are found, and a chunked
+        transcript is returned once.
+        
+        Listing vector IDs is only supported on serverless indexes, so this is
+        only done when config["serverless"] is set. The index connect()
+        creates is pod-based; there, no records are returned.
+        
+        Args:
+            filters: Metadata equality filters
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of matching records
+        """
+        if not self.config.get("serverless"):
+            logger.warning("Metadata-only queries need a serverless Pinecone index")
+            return []
+        
+        namespace = filters.get("namespace", "default")
+        residual_filters = {
+            key: value for key, value in filters.items() if key not in ("namespace", "record_type")
+        }
+        prefix = f"{filters['record_type']}_" if filters.get("record_type") else None
+        
+        # Each page holds up to 100 IDs, fetched together in one request
+        pages = self.index.list(prefix=prefix, namespace=namespace)
+        records: List[Dict[str, Any]] = []
+        seen_record_ids = set()
+        while len(records) < limit:
+            vector_ids = await asyncio.to_thread(next, pages, None)
+            if not vector_ids:
+                break
+            
+            result = await asyncio.to_thread(self.index.fetch, ids=vector_ids, namespace=namespace)
+            for vector_id, vector_data in result["vectors"].items():
+                metadata = vector_data.get("metadata") or {}
+                if "chunk_index" in metadata:
+                    record_vector_id = vector_id.rsplit("_c", 1)[0]
+                    if record_vector_id in seen_record_ids:
+                        continue
+                    seen_record_ids.add(record_vector_id)
+                if all(
+                    _metadata_matches(metadata.get(key), value)
+                    for key, value in residual_filters.items()
+                ):
+                    records.append(self._from_pinecone_format(vector_id, vector_data))
+        
+        return records[:limit]
+    
     async def delete(self, record_id: str) -> SyncResult:
         """Delete a record from Pinecone.
         
@@ -365,14 +848,29 @@ class PineconeClient(BaseDatabaseClient):
             SyncResult indicating success or failure
         """
         try:
-            if not self.index:
-                await self.connect()
+            await self._ensure_connected()
             
-            # Delete by ID
-            self.index.delete(
-                ids=[record_id],
+            # Delete by ID, along with any chunk vectors of a long transcript,
+            # counted by the chunk_count stored on its first chunk
+            first_chunk_id = f"{record_id}_c0"
+            result = await asyncio.to_thread(
+                self.index.fetch,
+                ids=[first_chunk_id],
                 namespace="default"
             )
+            vector_ids = [record_id]
+            if first_chunk_id in result["vectors"]:
+                metadata = result["vectors"][first_chunk_id].get("metadata") or {}
+                chunk_count = int(metadata.get("chunk_count", 1))
+                vector_ids.extend(f"{record_id}_c{i}" for i in range(chunk_count))
+            await asyncio.gather(*(
+                asyncio.to_thread(
+                    self.index.delete,
+                    ids=vector_ids[i:i + VECTOR_IDS_PER_REQUEST],
+                    namespace="default"
+                )
+                for i in range(0, len(vector_ids), VECTOR_IDS_PER_REQUEST)
+            ))
             
             return SyncResult(
                 success=True,
@@ -391,76 +889,593 @@ class PineconeClient(BaseDatabaseClient):
     async def batch_upsert(self, records: List[Dict[str, Any]]) -> List[SyncResult]:
         """Batch insert or update multiple records.
         
+        Long transcripts are stored as several overlapping chunk vectors; a
+        record only succeeds if all of its vectors are upserted. Vectors left
+        over from a transcript's earlier upserts are deleted afterwards.
+        
         Args:
             records: List of records to upsert
             
         Returns:
-            List of SyncResults for each record
+            List of SyncResults for each record, in input order
         """
-        results = []
-        vectors_to_upsert = []
-        record_map = {}
+        results: List[Optional[SyncResult]] = [None] * len(records)
         
         try:
-            if not self.index:
-                await self.connect()
+            await self._ensure_connected()
+            
+            # Prepare the vectors for every record with content to embed; large
+            # batches are prepared in a worker thread so the event loop stays
+            # responsive during bulk ingests
+            if len(records) >= PREPARE_IN_THREAD_MIN_RECORDS:
+                prepared = await asyncio.to_thread(self._prepare_vectors, records, results)
+            else:
+                prepared = self._prepare_vectors(records, results)
+            
+            # Embed and upsert in windows, so one window's upserts overlap the
+            # next window's embedding requests and only a few windows of
+            # embeddings are held in memory at once
+            window_slots = asyncio.Semaphore(PIPELINE_WINDOWS_IN_FLIGHT)
+            
+            async def embed_and_upsert(window: List[Tuple[int, str, str, Dict[str, Any], str, str]]) -> None:
+                async with window_slots:
+                    await self._embed_and_upsert(window, results)
+            
+            await asyncio.gather(*(
+                embed_and_upsert(prepared[i:i + PIPELINE_WINDOW_VECTORS])
+                for i in range(0, len(prepared), PIPELINE_WINDOW_VECTORS)
+            ))
+            
+            await self._delete_stale_vectors({
+                (namespace, vector_id): metadata.get("chunk_count", 0)
+                for position, vector_id, _, metadata, _, namespace in prepared
+                if metadata.get("record_type") == "transcript" and results[position].success
+            })
+            
+        except Exception as e:
+            logger.error("Pinecone batch upsert failed", error=str(e))
+            # Add failure results for remaining records
+            for position, result in enumerate(results):
+                if result is None:
+                    results[position] = SyncResult(
+                        success=False,
+                        database="Pinecone",
+                        error=str(e),
+                    )
+        
+        return results
+    
+    async def batch_upsert_async(
+        self, records: List[Dict[str, Any]], poll_interval: float = EMBEDDING_BATCH_API_POLL_INTERVAL
+    ) -> List[SyncResult]:
+        """Batch upsert records embedded through the OpenAI Batch API.
+        
+        The Batch API costs half as much as embedding requests and has
+        separate rate limits, but may take up to 24 hours to complete, so this
+        is meant for bulk backfills rather than live ingests. Submitted
+        batches are tracked on disk; if this call is interrupted, their
+        results can be upserted later with ``resume_embedding_batches``.
+        
+        Args:
+            records: List of records to upsert
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            List of SyncResults for each record, in input order
+        """
+        results: List[Optional[SyncResult]] = [None] * len(records)
+        
+        try:
+            await self._ensure_connected()
+            prepared = await asyncio.to_thread(self._prepare_vectors, records, results)
             
-            # Prepare all vectors
-            for record in records:
-                try:
-                    metadata = self._prepare_metadata(record)
-                    content = metadata.get("content", "")
-                    
-                    if not content:
-                        results.append(SyncResult(
+            # Submit as few Batch API jobs as the request and file size limits
+            # allow, then wait for them all
+            lines = await asyncio.to_thread(self._embedding_request_lines, prepared)
+            batch_ids = []
+            for start, end in batch_file_ranges(lines):
+                batch_ids.append(await self._submit_embedding_batch(
+                    prepared[start:end], lines[start:end], start
+                ))
+            errors_by_batch = await asyncio.gather(
+                *(self._complete_embedding_batch(batch_id, poll_interval) for batch_id in batch_ids)
+            )
+            
+            # A record only succeeds if all of its vectors were upserted
+            for errors in errors_by_batch:
+                for custom_id, error in errors.items():
+                    if error is not None:
+                        position = prepared[int(custom_id)][0]
+                        results[position] = SyncResult(
                             success=False,
                             database="Pinecone",
-                            error="No content to embed",
-                        ))
-                        continue
-                    
-                    # Generate embedding
-                    embedding = await self._generate_embedding(content)
-                    vector_id = self._generate_vector_id(record)
-                    
-                    vectors_to_upsert.append((vector_id, embedding, metadata))
-                    record_map[vector_id] = record
-                    
-                except Exception as e:
-                    results.append(SyncResult(
+                            error=error,
+                        )
+            for position, vector_id, _, _, _, _ in prepared:
+                if results[position] is None:
+                    results[position] = SyncResult(
+                        success=True,
+                        database="Pinecone",
+                        record_id=vector_id,
+                    )
+            
+        except Exception as e:
+            logger.error("Pinecone Batch API upsert failed", error=str(e))
+            for position, result in enumerate(results):
+                if result is None:
+                    results[position] = SyncResult(
                         success=False,
                         database="Pinecone",
                         error=str(e),
-                    ))
+                    )
+        
+        return results
+    
+    async def resume_embedding_batches(
+        self, poll_interval: float = EMBEDDING_BATCH_API_POLL_INTERVAL
+    ) -> int:
+        """Upsert the results of Batch API jobs left over from earlier runs.
+        
+        Args:
+            poll_interval: Seconds between batch status checks
             
-            # Batch upsert (Pinecone supports up to 100 vectors per request)
-            for i in range(0, len(vectors_to_upsert), 100):
-                batch = vectors_to_upsert[i:i + 100]
-                self.index.upsert(
-                    vectors=batch,
-                    namespace="default"
+        Returns:
+            Number of vectors upserted
+        """
+        await self._ensure_connected()
+        tracker = await self._get_batch_tracker()
+        batch_ids = await asyncio.to_thread(tracker.pending)
+        errors_by_batch = await asyncio.gather(
+            *(self._complete_embedding_batch(batch_id, poll_interval) for batch_id in batch_ids)
+        )
+        return sum(error is None for errors in errors_by_batch for error in errors.values())
+    
+    async def _get_batch_tracker(self) -> _EmbeddingBatchTracker:
+        """Open the Batch API tracker on first use."""
+        if self._batch_tracker is None:
+            self._batch_tracker = await asyncio.to_thread(
+                _EmbeddingBatchTracker,
+                self.config.get("batch_tracker_path", settings.embedding_batch_tracker_path),
+            )
+        return self._batch_tracker
+    
+    def _embedding_request_lines(
+        self, prepared: List[Tuple[int, str, str, Dict[str, Any], str, str]]
+    ) -> List[bytes]:
+        """Build the Batch API request line of each prepared vector.
+        
+        Each vector's custom ID is its index in the prepared list.
+        
+        Args:
+            prepared: Prepared vectors to embed
+            
+        Returns:
+            JSONL request line for each vector, without its newline
+        """
+        return [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {
+                    "model": self._embedding_model,
+                    "input": text,
+                    "dimensions": self._embedding_dimensions,
+                    "encoding_format": "float",
+                },
+            }).encode()
+            for i, (_, _, _, _, text, _) in enumerate(prepared)
+        ]
+    
+    async def _submit_embedding_batch(
+        self,
+        prepared: List[Tuple[int, str, str, Dict[str, Any], str, str]],
+        lines: List[bytes],
+        start: int,
+    ) -> str:
+        """Submit prepared vectors to the OpenAI Batch API.
+        
+        Args:
+            prepared: Prepared vectors to embed
+            lines: Their request lines from _embedding_request_lines
+            start: Index of the first vector in the full prepared list
+            
+        Returns:
+            OpenAI batch ID
+        """
+        return await self._create_embedding_batch(lines, [
+            (str(start + i), vector_id, chunk_id, namespace, metadata)
+            for i, (_, vector_id, chunk_id, metadata, _, namespace) in enumerate(prepared)
+        ])
+    
+    async def _create_embedding_batch(
+        self, lines: List[bytes], tracked: List[Tuple[str, str, str, str, Dict[str, Any]]]
+    ) -> str:
+        """Upload Batch API request lines, start a job on them and track it.
+        
+        Args:
+            lines: JSONL request lines, without their newlines
+            tracked: Tracker rows for the requests, as taken by _EmbeddingBatchTracker.add
+            
+        Returns:
+            OpenAI batch ID
+        """
+        input_file = await self.openai_client.files.create(
+            file=("embeddings.jsonl", b"\n".join(lines)), purpose="batch"
+        )
+        batch = await self.openai_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/embeddings",
+            completion_window="24h",
+        )
+        
+        tracker = await self._get_batch_tracker()
+        await asyncio.to_thread(tracker.add, batch.id, tracked)
+        logger.info("Submitted OpenAI embedding batch", batch_id=batch.id, vectors=len(tracked))
+        return batch.id
+    
+    async def _requeue_embedding_batch(
+        self,
+        batch: Any,
+        custom_ids: List[str],
+        vectors: Dict[str, Tuple[str, str, str, Dict[str, Any]]],
+    ) -> str:
+        """Resubmit some requests of a Batch API job as a new job.
+        
+        The requests are read back from the job's input file, so the new job
+        embeds the same text under the same custom IDs.
+        
+        Args:
+            batch: Batch API job whose requests are resubmitted
+            custom_ids: Custom IDs of the requests to resubmit
+            vectors: The job's tracked vectors by custom ID
+            
+        Returns:
+            OpenAI batch ID of the new job
+        """
+        wanted = set(custom_ids)
+        input_file = await self.openai_client.files.content(batch.input_file_id)
+        lines = [
+            line.encode()
+            for line in input_file.text.splitlines()
+            if line and json.loads(line)["custom_id"] in wanted
+        ]
+        return await self._create_embedding_batch(lines, [
+            (custom_id, *vectors[custom_id])
+            for custom_id in (json.loads(line)["custom_id"] for line in lines)
+        ])
+    
+    async def _complete_embedding_batch(
+        self, batch_id: str, poll_interval: float
+    ) -> Dict[str, Optional[str]]:
+        """Wait for a Batch API job and upsert the vectors it embedded.
+        
+        Requests that failed are read from the job's error file. If the job
+        didn't complete (it failed, expired or was cancelled), the requests
+        it didn't embed are resubmitted as a new tracked job, which
+        ``resume_embedding_batches`` picks up; if resubmitting fails, the
+        job stays tracked so a later resume retries it.
+        
+        Args:
+            batch_id: OpenAI batch ID
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Error message, or None if upserted, by custom ID
+        """
+        tracker = await self._get_batch_tracker()
+        vectors = await asyncio.to_thread(tracker.vectors, batch_id)
+        
+        batch = await self.openai_client.batches.retrieve(batch_id)
+        while batch.status not in _BATCH_API_FINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await self.openai_client.batches.retrieve(batch_id)
+        
+        errors: Dict[str, Optional[str]] = dict.fromkeys(
+            vectors, f"Embedding batch {batch_id} {batch.status}"
+        )
+        
+        # Collect the embedded vectors by namespace
+        vectors_by_namespace: Dict[str, List[Tuple[str, Tuple[str, np.ndarray, Dict[str, Any]]]]] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            output = await self.openai_client.files.content(file_id)
+            for line in output.text.splitlines():
+                if not line:
+                    continue
+                result = json.loads(line)
+                custom_id = result["custom_id"]
+                response = result.get("response") or {}
+                if custom_id not in vectors:
+                    continue
+                if response.get("status_code") != 200:
+                    errors[custom_id] = str(result.get("error") or response.get("body"))
+                    continue
+                _, chunk_id, namespace, metadata = vectors[custom_id]
+                embedding = np.asarray(response["body"]["data"][0]["embedding"], dtype=np.float32)
+                vectors_by_namespace.setdefault(namespace, []).append(
+                    (custom_id, (chunk_id, embedding, metadata))
                 )
-                
-                # Add success results for this batch
-                for vector_id, _, _ in batch:
-                    results.append(SyncResult(
+        
+        # Upsert in batches of 100 vectors, sent concurrently
+        upsert_batches = [
+            (namespace, namespace_vectors[i:i + 100])
+            for namespace, namespace_vectors in vectors_by_namespace.items()
+            for i in range(0, len(namespace_vectors), 100)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self._upsert_batch([vector for _, vector in upsert_batch], namespace)
+                for namespace, upsert_batch in upsert_batches
+            ),
+            return_exceptions=True
+        )
+        for (_, upsert_batch), response in zip(upsert_batches, responses):
+            if isinstance(response, Exception):
+                logger.error("Pinecone batch upsert failed", error=str(response), vectors=len(upsert_batch))
+            for custom_id, _ in upsert_batch:
+                errors[custom_id] = str(response) if isinstance(response, Exception) else None
+        
+        # Clean up after transcripts whose vectors in this batch all succeeded
+        failed_ids = {vectors[custom_id][0] for custom_id, error in errors.items() if error is not None}
+        await self._delete_stale_vectors({
+            (namespace, vector_id): metadata.get("chunk_count", 0)
+            for vector_id, _, namespace, metadata in vectors.values()
+            if metadata.get("record_type") == "transcript" and vector_id not in failed_ids
+        })
+        
+        # Retry what an unfinished job didn't embed; errors still report the
+        # vectors as failed for this call
+        embedded = {
+            custom_id
+            for namespace_vectors in vectors_by_namespace.values()
+            for custom_id, _ in namespace_vectors
+        }
+        unembedded = [custom_id for custom_id in vectors if custom_id not in embedded]
+        if batch.status != "completed" and unembedded:
+            try:
+                retry_id = await self._requeue_embedding_batch(batch, unembedded, vectors)
+            except Exception as e:
+                logger.error("Failed to resubmit OpenAI embedding batch", batch_id=batch_id, error=str(e))
+            else:
+                logger.warning(
+                    "Resubmitted unfinished OpenAI embedding batch",
+                    batch_id=batch_id,
+                    status=batch.status,
+                    retry_batch_id=retry_id,
+                    vectors=len(unembedded),
+                )
+                await asyncio.to_thread(tracker.remove, batch_id)
+        else:
+            await asyncio.to_thread(tracker.remove, batch_id)
+        logger.info(
+            "Completed OpenAI embedding batch",
+            batch_id=batch_id,
+            status=batch.status,
+            upserted=sum(error is None for error in errors.values()),
+        )
+        return errors
+    
+    async def _embed_and_upsert(
+        self,
+        prepared: List[Tuple[int, str, str, Dict[str, Any], str, str]],
+        results: List[Optional[SyncResult]],
+    ) -> None:
+        """Embed prepared vectors and upsert them to Pinecone.
+        
+        A record split across calls only succeeds if none of its vectors
+        failed; failures overwrite an earlier success.
+        
+        Args:
+            prepared: Prepared vectors from _prepare_vectors
+            results: Per-record results, updated in place
+        """
+        # Generate embeddings with as few OpenAI requests as possible
+        embeddings = await self._generate_embeddings_batch(
+            [text for _, _, _, _, text, _ in prepared], return_exceptions=True
+        )
+        
+        vectors_by_namespace: Dict[str, List[Tuple[int, str, Tuple[str, np.ndarray, Dict[str, Any]]]]] = {}
+        for (position, vector_id, chunk_id, metadata, _, namespace), embedding in zip(prepared, embeddings):
+            if isinstance(embedding, Exception):
+                results[position] = SyncResult(
+                    success=False,
+                    database="Pinecone",
+                    error=str(embedding),
+                )
+                continue
+            vectors_by_namespace.setdefault(namespace, []).append(
+                (position, vector_id, (chunk_id, embedding, metadata))
+            )
+        
+        # Batch upsert (Pinecone supports up to 100 vectors per request),
+        # sending batches concurrently
+        batches = [
+            (namespace, vectors[i:i + 100])
+            for namespace, vectors in vectors_by_namespace.items()
+            for i in range(0, len(vectors), 100)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self._upsert_batch([vector for _, _, vector in batch], namespace)
+                for namespace, batch in batches
+            ),
+            return_exceptions=True
+        )
+        
+        for (_, batch), response in zip(batches, responses):
+            if isinstance(response, Exception):
+                logger.error("Pinecone batch upsert failed", error=str(response), vectors=len(batch))
+                for position, _, _ in batch:
+                    results[position] = SyncResult(
+                        success=False,
+                        database="Pinecone",
+                        error=str(response),
+                    )
+                continue
+            
+            # A record split across batches only succeeds if none failed
+            for position, vector_id, _ in batch:
+                if results[position] is None:
+                    results[position] = SyncResult(
                         success=True,
                         database="Pinecone",
                         record_id=vector_id,
-                    ))
+                    )
+    
+    def _prepare_vectors(
+        self, records: List[Dict[str, Any]], results: List[Optional[SyncResult]]
+    ) -> List[Tuple[int, str, str, Dict[str, Any], str, str]]:
+        """Prepare the vectors to embed for a batch of records.
+        
+        Records that cannot be stored get their failed SyncResult set in
+        ``results``. The whole batch shares one default timestamp.
+        
+        Args:
+            records: List of records to upsert
+            results: Per-record results, updated in place for failed records
             
-        except Exception as e:
-            logger.error("Pinecone batch upsert failed", error=str(e))
-            # Add failure results for remaining records
-            remaining = len(records) - len(results)
-            for _ in range(remaining):
-                results.append(SyncResult(
+        Returns:
+            (position, vector ID, chunk vector ID, metadata, text, namespace)
+            for each vector to embed
+        """
+        now = datetime.utcnow().isoformat()
+        prepared = []
+        for position, record in enumerate(records):
+            try:
+                metadata = self._prepare_metadata(record, now)
+                content = metadata.get("content", "")
+                
+                if not content:
+                    results[position] = SyncResult(
+                        success=False,
+                        database="Pinecone",
+                        error="No content to embed",
+                    )
+                    continue
+                
+                vector_id = self._generate_vector_id(record)
+                namespace = record.get("namespace", "default")
+                for chunk_id, chunk_metadata, text in self._record_vectors(record, vector_id, metadata):
+                    prepared.append((position, vector_id, chunk_id, chunk_metadata, text, namespace))
+                
+            except Exception as e:
+                results[position] = SyncResult(
                     success=False,
                     database="Pinecone",
                     error=str(e),
+                )
+        
+        return prepared
+    
+    def _record_vectors(
+        self, record: Dict[str, Any], vector_id: str, metadata: Dict[str, Any]
+    ) -> List[Tuple[str, Dict[str, Any], str]]:
+        """List the vectors a record is stored as.
+        
+        Transcripts too long for one vector are split into overlapping chunks,
+        each stored under ``{vector_id}_c{i}`` with its chunk_index and the
+        chunk_count, so the whole transcript stays searchable instead of only
+        its start.
+        
+        Args:
+            record: Record data
+            vector_id: Record's vector ID
+            metadata: Record's prepared metadata
+            
+        Returns:
+            (vector ID, metadata, text to embed) for each vector
+        """
+        content = record.get("content") or ""
+        if record.get("record_type") != "transcript" or len(content) <= CONTENT_MAX_CHARS:
+            return [(vector_id, metadata, metadata["content"])]
+        
+        chunks = chunk_text(content, TRANSCRIPT_CHUNK_CHARS, TRANSCRIPT_CHUNK_OVERLAP_CHARS)
+        return [
+            (
+                f"{vector_id}_c{i}",
+                {**metadata, "content": chunk, "chunk_index": i, "chunk_count": len(chunks)},
+                chunk,
+            )
+            for i, chunk in enumerate(chunks)
+        ]
+    
+    async def _delete_stale_vectors(self, chunk_counts: Dict[Tuple[str, str], int]) -> None:
+        """Delete vectors left over from earlier upserts of re-stored transcripts.
+        
+        A transcript now stored as chunks loses its single vector. Chunks past
+        its new chunk count are found by fetching the first of them, whose
+        chunk_count gives the earlier count. Failures are logged, not raised,
+        since the new vectors are already stored.
+        
+        Args:
+            chunk_counts: New chunk count, 0 if stored as a single vector, by
+                (namespace, vector ID) of each upserted transcript
+        """
+        counts_by_namespace: Dict[str, Dict[str, int]] = {}
+        for (namespace, vector_id), chunk_count in chunk_counts.items():
+            counts_by_namespace.setdefault(namespace, {})[vector_id] = chunk_count
+        
+        for namespace, counts in counts_by_namespace.items():
+            try:
+                first_stale = {
+                    f"{vector_id}_c{chunk_count}": (vector_id, chunk_count)
+                    for vector_id, chunk_count in counts.items()
+                }
+                probe_ids = list(first_stale)
+                responses = await asyncio.gather(*(
+                    asyncio.to_thread(
+                        self.index.fetch,
+                        ids=probe_ids[i:i + VECTOR_IDS_PER_REQUEST],
+                        namespace=namespace
+                    )
+                    for i in range(0, len(probe_ids), VECTOR_IDS_PER_REQUEST)
                 ))
+                
+                stale_ids = [vector_id for vector_id, chunk_count in counts.items() if chunk_count]
+                for response in responses:
+                    for chunk_id, vector_data in response["vectors"].items():
+                        vector_id, chunk_count = first_stale[chunk_id]
+                        metadata = vector_data.get("metadata") or {}
+                        old_count = int(metadata.get("chunk_count", chunk_count + 1))
+                        stale_ids.extend(f"{vector_id}_c{i}" for i in range(chunk_count, old_count))
+                
+                await asyncio.gather(*(
+                    asyncio.to_thread(
+                        self.index.delete,
+                        ids=stale_ids[i:i + VECTOR_IDS_PER_REQUEST],
+                        namespace=namespace
+                    )
+                    for i in range(0, len(stale_ids), VECTOR_IDS_PER_REQUEST)
+                ))
+                
+            except Exception as e:
+                logger.warning(
+                    "Failed to delete stale Pinecone vectors",
+                    error=str(e),
+                    namespace=namespace,
+                    records=len(counts),
+                )
+    
+    async def _upsert_batch(
+        self, batch: List[Tuple[str, np.ndarray, Dict[str, Any]]], namespace: str = "default"
+    ) -> None:
+        """Upsert one batch of vectors without blocking the event loop.
         
-        return results
+        Args:
+            batch: Up to 100 (vector ID, embedding, metadata) tuples
+            namespace: Namespace to write to
+        """
+        async with self._upsert_slots:
+            await asyncio.to_thread(
+                self.index.upsert,
+                vectors=[
+                    (vector_id, embedding.tolist(), metadata)
+                    for vector_id, embedding, metadata in batch
+                ],
+                namespace=namespace
+            )
     
     async def search_similar(
         self,
@@ -481,18 +1496,18 @@ class PineconeClient(BaseDatabaseClient):
             List of (record, score) tuples
         """
         try:
-            if not self.index:
-                await self.connect()
+            await self._ensure_connected()
             
             # Generate query embedding
             query_embedding = await self._generate_embedding(query_text)
             
             # Query Pinecone
-            result = self.index.query(
-                vector=query_embedding,
+            result = await asyncio.to_thread(
+                self.index.query,
+                vector=query_embedding.tolist(),
                 top_k=top_k,
                 include_metadata=True,
-                filter=filters,
+                filter=self._compact_filter(filters) if filters else None,
                 namespace="default"
             )
             
@@ -521,23 +1536,10 @@ class PineconeClient(BaseDatabaseClient):
         """
         metadata = vector_data.get("metadata", {})
         
-        # Reconstruct record from metadata
-        record = {
-            "pinecone_id": vector_id,
-            "id": metadata.get("record_id"),
-            "record_type": metadata.get("record_type"),
-            "source_system": metadata.get("source_system"),
-            "source_id": metadata.get("source_id"),
-            "created_at": metadata.get("created_at"),
-            "updated_at": metadata.get("updated_at"),
-            "airtable_id": metadata.get("airtable_id"),
-            "supabase_id": metadata.get("supabase_id"),
-        }
-        
-        # Add all other metadata fields
-        for key, value in metadata.items():
-            if key not in record:
-                record[key] = value
+        # Reconstruct record from metadata in one merge over the core keys
+        record = {**_RECORD_TEMPLATE, **metadata}
+        record["pinecone_id"] = vector_id
+        record["id"] = metadata.get("record_id")
         
         return record
     
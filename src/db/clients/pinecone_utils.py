@@ -0,0 +1,56 @@
+"""Pinecone client helpers that don't depend on the Pinecone or OpenAI SDKs."""
+
+from typing import List, Tuple
+
+# OpenAI Batch API limits per job: requests, and bytes of the input file
+EMBEDDING_BATCH_API_MAX_REQUESTS = 50_000
+EMBEDDING_BATCH_API_MAX_BYTES = 200_000_000
+
+
+def chunk_text(text: str, size: int, overlap: int) -> List[str]:
+    """Split text into chunks of at most size characters overlapping by overlap.
+    
+    Chunks end at a space where possible so words aren't split.
+    """
+    chunks = []
+    start = 0
+    while True:
+        end = min(start + size, len(text))
+        if end < len(text):
+            space = text.rfind(" ", start + overlap + 1, end)
+            if space != -1:
+                end = space
+        chunks.append(text[start:end])
+        if end >= len(text):
+            return chunks
+        start = end - overlap
+
+
+def batch_file_ranges(
+    lines: List[bytes],
+    max_requests: int = EMBEDDING_BATCH_API_MAX_REQUESTS,
+    max_bytes: int = EMBEDDING_BATCH_API_MAX_BYTES,
+) -> List[Tuple[int, int]]:
+    """Split Batch API request lines into jobs within the request and file size limits.
+    
+    Args:
+        lines: JSONL request lines, without their newlines
+        max_requests: Maximum requests per job
+        max_bytes: Maximum size of a job's input file
+        
+    Returns:
+        (start, end) range of lines for each job
+    """
+    ranges = []
+    start = size = 0
+    for end, line in enumerate(lines):
+        if end > start and (
+            end - start >= max_requests
+            or size + len(line) + 1 > max_bytes
+        ):
+            ranges.append((start, end))
+            start, size = end, 0
+        size += len(line) + 1
+    if start < len(lines):
+        ranges.append((start, len(lines)))
+    return ranges
@@ -1,16 +1,260 @@
 """Supabase PostgreSQL client implementation for relational data layer."""
 
 import asyncio
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+import json
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from uuid import NAMESPACE_DNS, UUID, uuid4, uuid5
 
-from supabase import create_client, Client
-from postgrest.exceptions import APIError
+import asyncpg
 
 from src.core.config import settings
-from src.core.logging import logger
+from src.core.logging import get_logger
 from src.db.clients.base_client import BaseDatabaseClient, SyncResult
+from src.utils.memory_cache import LRUCache
+
+logger = get_logger(__name__)
+
+# Connection pool to Supabase's Postgres database
+POOL_MIN_SIZE = 10
+POOL_MAX_SIZE = 50
+POOL_MAX_INACTIVE_CONNECTION_LIFETIME = 300
+POOL_COMMAND_TIMEOUT = 60
+
+# Records read per query when streaming query results
+QUERY_PAGE_SIZE = 500
+
+# Records per COPY in batch upserts; chunks are sent concurrently
+BATCH_UPSERT_CHUNK_SIZE = 500
+
+# COPY chunks in flight at once, leaving pool connections for other queries
+BATCH_UPSERT_MAX_CONCURRENCY = 8
+
+# Records kept by the read-through cache for get(), and seconds they stay valid
+GET_CACHE_SIZE = 1024
+GET_CACHE_TTL = 60
+
+# Columns of the base_records table
+_BASE_COLUMNS = frozenset((
+    "id",
+    "record_type",
+    "created_at",
+    "updated_at",
+    "synced_at",
+    "source_system",
+    "source_id",
+    "airtable_id",
+    "pinecone_id",
+    "sync_version",
+    "created_by",
+    "updated_by",
+    "agent_version",
+    "metadata",
+))
+_TIMESTAMP_COLUMNS = frozenset(("created_at", "updated_at", "synced_at"))
+
+# SQL conditions for query filter keys ending in __<operator>
+_FILTER_OPERATORS = {
+    "gte": "{field} >= {param}",
+    "lte": "{field} <= {param}",
+    "like": "{field} LIKE {param}",
+    "in": "{field} = ANY({param})",
+}
+
+# Named query parameters (:name), not matching :: casts
+_NAMED_PARAM = re.compile(r"(?<!:):([A-Za-z_]\w*)")
+
+# Namespace for UUIDs derived from record IDs that are not UUIDs
+_RECORD_ID_NAMESPACE = uuid5(NAMESPACE_DNS, "lit_law411-agent")
+
+
+def _row_id(record_id: Any) -> str:
+    """Map a record ID to the UUID its row is stored under.
+    
+    UUIDs map to their canonical form; other IDs always map to the same UUID
+    derived from them.
+    """
+    try:
+        return str(UUID(str(record_id)))
+    except ValueError:
+        return str(uuid5(_RECORD_ID_NAMESPACE, str(record_id)))
+
+
+# Reused JSONB encoder; json.dumps builds a new encoder per call when given
+# options. Non-ASCII text is sent as-is rather than \u-escaped.
+_json_dumps = json.JSONEncoder(separators=(",", ":"), default=str, ensure_ascii=False).encode
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode a JSONB value in binary format (a version byte, then JSON text)."""
+    return b"\x01" + _json_dumps(value).encode()
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Decode a binary format JSONB value."""
+    return json.loads(data[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Exchange JSON and JSONB values as Python objects.
+    
+    JSONB uses the binary format, which COPY requires.
+    """
+    await conn.set_type_codec(
+        "json", encoder=_json_dumps, decoder=json.loads, schema="pg_catalog"
+    )
+    await conn.set_type_codec(
+        "jsonb", encoder=_encode_jsonb, decoder=_decode_jsonb, schema="pg_catalog", format="binary"
+    )
+
+
+def _to_column_value(column: str, value: Any) -> Any:
+    """Convert a record value to the type asyncpg expects for its column.
+    
+    Timestamps arrive as ISO strings or naive UTC datetimes.
+    """
+    if column in _TIMESTAMP_COLUMNS and value is not None:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _from_row(row: asyncpg.Record) -> Dict[str, Any]:
+    """Convert a database row to the JSON-compatible dict the REST API returns."""
+    record = dict(row)
+    for key, value in record.items():
+        if isinstance(value, UUID):
+            record[key] = str(value)
+        elif isinstance(value, datetime):
+            record[key] = value.isoformat()
+    return record
+
+
+def _youtube_video_metadata(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Metadata fields for a YouTube video."""
+    return {
+        "title": record.get("title"),
+        "channel_name": record.get("channel_name"),
+        "channel_id": record.get("channel_id"),
+        "video_id": record.get("video_id"),
+        "url": record.get("url"),
+        "duration": record.get("duration"),
+        "view_count": record.get("view_count"),
+        "like_count": record.get("like_count"),
+        "comment_count": record.get("comment_count"),
+        "published_at": record.get("published_at"),
+        "description": record.get("description"),
+        "tags": record.get("tags", []),
+        "thumbnail_url": record.get("thumbnail_url"),
+        "legal_categories": record.get("legal_categories", []),
+        "has_transcript": record.get("has_transcript", False),
+        "transcript_id": record.get("transcript_id"),
+    }
+
+
+def _legal_website_metadata(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Metadata fields for a legal website."""
+    return {
+        "name": record.get("name"),
+        "url": record.get("url"),
+        "domain": record.get("domain"),
+        "content_type": record.get("content_type"),
+        "legal_topics": record.get("legal_topics", []),
+        "jurisdiction": record.get("jurisdiction"),
+        "last_scraped": record.get("last_scraped"),
+        "quality_score": record.get("quality_score"),
+        "authority_level": record.get("authority_level"),
+        "scraping_strategy": record.get("scraping_strategy"),
+        "update_frequency": record.get("update_frequency"),
+    }
+
+
+def _transcript_metadata(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Metadata fields for a transcript."""
+    return {
+        "content": record.get("content"),
+        "source_type": record.get("source_type"),
+        "source_id": record.get("source_id"),
+        "source_url": record.get("source_url"),
+        "language": record.get("language", "en"),
+        "duration_seconds": record.get("duration_seconds"),
+        "confidence_score": record.get("confidence_score"),
+        "legal_entities": record.get("legal_entities", []),
+        "key_phrases": record.get("key_phrases", []),
+        "summary": record.get("summary"),
+    }
+
+
+def _legal_entity_metadata(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Metadata fields for a legal entity."""
+    return {
+        "entity_type": record.get("entity_type"),
+        "entity_text": record.get("entity_text"),
+        "normalized_text": record.get("normalized_text"),
+        "context": record.get("context"),
+        "source_document_id": record.get("source_document_id"),
+        "confidence_score": record.get("confidence_score"),
+        "metadata": record.get("entity_metadata", {}),
+    }
+
+
+# Type-specific metadata builders per record type
+_TYPE_METADATA: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "youtube_video": _youtube_video_metadata,
+    "legal_website": _legal_website_metadata,
+    "transcript": _transcript_metadata,
+    "legal_entity": _legal_entity_metadata,
+}
+
+# Record keys not copied into metadata as additional fields, per record type
+_BASE_RECORD_KEYS = _BASE_COLUMNS - {"metadata"}
+_RESERVED_KEYS = {
+    record_type: _BASE_RECORD_KEYS | frozenset(metadata_for_type({}))
+    for record_type, metadata_for_type in _TYPE_METADATA.items()
+}
+
+
+@lru_cache(maxsize=64)
+def _upsert_sql(columns: Tuple[str, ...]) -> str:
+    """Build the upsert statement for a set of base_records columns."""
+    placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+    updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in columns if column != "id")
+    return (
+        f"INSERT INTO base_records ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT (id) DO UPDATE SET {updates} RETURNING id"
+    )
+
+
+@lru_cache(maxsize=64)
+def _copy_upsert_sql(table_name: str, columns: Tuple[str, ...]) -> str:
+    """Build the statement merging copied upsert_rows into a table."""
+    column_list = ", ".join(columns)
+    updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in columns if column != "id")
+    return (
+        f"INSERT INTO {table_name} ({column_list}) SELECT {column_list} FROM upsert_rows "
+        f"ON CONFLICT (id) DO UPDATE SET {updates}"
+    )
+
+
+@lru_cache(maxsize=256)
+def _positional_sql(query: str, names: Tuple[str, ...]) -> Tuple[str, Tuple[str, ...]]:
+    """Rewrite the given :name parameters of a query as $n placeholders.
+    
+    Returns the rewritten query and the parameter names in placeholder order.
+    """
+    order: Dict[str, int] = {}
+    
+    def placeholder(match: "re.Match[str]") -> str:
+        name = match.group(1)
+        if name not in names:
+            return match.group(0)
+        return f"${order.setdefault(name, len(order) + 1)}"
+    
+    return _NAMED_PARAM.sub(placeholder, query), tuple(order)
 
 
 class SupabaseClient(BaseDatabaseClient):
@@ -33,22 +277,39 @@ class SupabaseClient(BaseDatabaseClient):
         """
         if config is None:
             config = {
-                "url": settings.SUPABASE_URL,
-                "anon_key": settings.SUPABASE_ANON_KEY,
-                "service_role_key": settings.SUPABASE_SERVICE_ROLE_KEY,
+                "url": settings.supabase_url,
+                "db_url": settings.supabase_db_url,
             }
         super().__init__(config)
         
-        self.client: Optional[Client] = None
+        self._pool: Optional[asyncpg.Pool] = None
         self._table_cache = {}
+        self._agent_version = settings.app_version
+        
+        # Short-lived read-through cache for get(), invalidated on writes, and
+        # the reads in flight so concurrent misses share one query
+        self._get_cache = LRUCache(maxsize=GET_CACHE_SIZE, ttl=GET_CACHE_TTL)
+        self._pending_gets: Dict[str, asyncio.Task] = {}
+        self._copy_slots = asyncio.Semaphore(BATCH_UPSERT_MAX_CONCURRENCY)
+        self._connect_lock = asyncio.Lock()
     
     async def connect(self) -> None:
-        """Establish connection to Supabase."""
+        """Establish connection to Supabase.
+        
+        Records are read and written through a connection pool to the
+        underlying Postgres database.
+        """
         try:
-            # Use service role key for full access
-            self.client = create_client(
-                self.config["url"],
-                self.config["service_role_key"]
+            if not self.config.get("db_url"):
+                raise ValueError("Supabase database URL is not configured (SUPABASE_DB_URL)")
+            
+            self._pool = await asyncpg.create_pool(
+                dsn=self.config["db_url"],
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                max_inactive_connection_lifetime=POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+                command_timeout=POOL_COMMAND_TIMEOUT,
+                init=_init_connection,
             )
             
             # Test connection
@@ -59,18 +320,27 @@ class SupabaseClient(BaseDatabaseClient):
             logger.error("Failed to connect to Supabase", error=str(e))
             raise
     
+    async def _ensure_connected(self) -> None:
+        """Connect on first use, once, even when first used concurrently."""
+        if self._pool is not None:
+            return
+        async with self._connect_lock:
+            if self._pool is None:
+                await self.connect()
+    
     async def disconnect(self) -> None:
         """Close connection to Supabase."""
-        # Supabase client doesn't have explicit disconnect
-        self.client = None
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        
         self._table_cache.clear()
         logger.info("Disconnected from Supabase")
     
     async def _test_connection(self) -> None:
         """Test the database connection."""
         try:
-            # Try to query a simple count
-            result = self.client.table("base_records").select("count", count="exact").limit(1).execute()
+            await self._pool.fetchval("SELECT 1 FROM base_records LIMIT 1")
             logger.debug("Supabase connection test successful")
         except Exception as e:
             # If base_records doesn't exist, that's okay for now
@@ -84,21 +354,20 @@ class SupabaseClient(BaseDatabaseClient):
             record_id: Record ID (may or may not be UUID)
             
         Returns:
-            Valid UUID string
+            Valid UUID string; other IDs always map to the same derived UUID,
+            so repeated upserts of a record update the same row
         """
-        try:
-            # If it's already a valid UUID, return it
-            uuid_obj = uuid4() if not record_id else record_id
-            return str(uuid_obj)
-        except:
-            # Generate a new UUID if invalid
+        if not record_id:
             return str(uuid4())
+        return _row_id(record_id)
     
-    def _prepare_for_supabase(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_for_supabase(self, record: Dict[str, Any], now: Optional[str] = None) -> Dict[str, Any]:
         """Convert record to Supabase format with snake_case fields.
         
         Args:
             record: Record in standard format
+            now: ISO timestamp used for a missing synced_at value, defaults to
+                the current time
             
         Returns:
             Record in Supabase format
@@ -112,7 +381,7 @@ class SupabaseClient(BaseDatabaseClient):
             "record_type": record.get("record_type"),
             "created_at": record.get("created_at"),
             "updated_at": record.get("updated_at"),
-            "synced_at": record.get("synced_at", datetime.utcnow().isoformat()),
+            "synced_at": record.get("synced_at", now or datetime.utcnow().isoformat()),
             "source_system": record.get("source_system", "lit_law411_agent"),
             "source_id": record.get("source_id", record_id),
             "airtable_id": record.get("airtable_id"),
@@ -120,79 +389,25 @@ class SupabaseClient(BaseDatabaseClient):
             "sync_version": record.get("sync_version", 1),
             "created_by": record.get("created_by", "system"),
             "updated_by": record.get("updated_by", "system"),
-            "agent_version": record.get("agent_version", settings.APP_VERSION),
+            "agent_version": record.get("agent_version", self._agent_version),
         }
         
-        # Add metadata as JSONB
-        metadata = {}
-        
-        # Add record-type specific fields to metadata
-        if record.get("record_type") == "youtube_video":
-            metadata.update({
-                "title": record.get("title"),
-                "channel_name": record.get("channel_name"),
-                "channel_id": record.get("channel_id"),
-                "video_id": record.get("video_id"),
-                "url": record.get("url"),
-                "duration": record.get("duration"),
-                "view_count": record.get("view_count"),
-                "like_count": record.get("like_count"),
-                "comment_count": record.get("comment_count"),
-                "published_at": record.get("published_at"),
-                "description": record.get("description"),
-                "tags": record.get("tags", []),
-                "thumbnail_url": record.get("thumbnail_url"),
-                "legal_categories": record.get("legal_categories", []),
-                "has_transcript": record.get("has_transcript", False),
-                "transcript_id": record.get("transcript_id"),
-            })
-        elif record.get("record_type") == "legal_website":
-            metadata.update({
-                "name": record.get("name"),
-                "url": record.get("url"),
-                "domain": record.get("domain"),
-                "content_type": record.get("content_type"),
-                "legal_topics": record.get("legal_topics", []),
-                "jurisdiction": record.get("jurisdiction"),
-                "last_scraped": record.get("last_scraped"),
-                "quality_score": record.get("quality_score"),
-                "authority_level": record.get("authority_level"),
-                "scraping_strategy": record.get("scraping_strategy"),
-                "update_frequency": record.get("update_frequency"),
-            })
-        elif record.get("record_type") == "transcript":
-            metadata.update({
-                "content": record.get("content"),
-                "source_type": record.get("source_type"),
-                "source_id": record.get("source_id"),
-                "source_url": record.get("source_url"),
-                "language": record.get("language", "en"),
-                "duration_seconds": record.get("duration_seconds"),
-                "confidence_score": record.get("confidence_score"),
-                "legal_entities": record.get("legal_entities", []),
-                "key_phrases": record.get("key_phrases", []),
-                "summary": record.get("summary"),
-            })
-        elif record.get("record_type") == "legal_entity":
-            metadata.update({
-                "entity_type": record.get("entity_type"),
-                "entity_text": record.get("entity_text"),
-                "normalized_text": record.get("normalized_text"),
-                "context": record.get("context"),
-                "source_document_id": record.get("source_document_id"),
-                "confidence_score": record.get("confidence_score"),
-                "metadata": record.get("entity_metadata", {}),
-            })
+        # Add record-type specific fields to metadata, stored as JSONB
+        record_type = record.get("record_type")
+        metadata_for_type = _TYPE_METADATA.get(record_type)
+        metadata = metadata_for_type(record) if metadata_for_type is not None else {}
         
         # Add any additional fields to metadata
-        for key, value in record.items():
-            if key not in supabase_record and key not in metadata:
-                metadata[key] = value
+        reserved = _RESERVED_KEYS.get(record_type, _BASE_RECORD_KEYS)
+        metadata.update((key, value) for key, value in record.items() if key not in reserved)
         
         supabase_record["metadata"] = metadata
         
-        # Remove None values
-        return {k: v for k, v in supabase_record.items() if v is not None}
+        # Remove None values in place rather than copying the record
+        for key in [key for key, value in supabase_record.items() if value is None]:
+            del supabase_record[key]
+        
+        return supabase_record
     
     async def upsert(self, record: Dict[str, Any]) -> SyncResult:
         """Insert or update a record in Supabase.
@@ -204,23 +419,25 @@ class SupabaseClient(BaseDatabaseClient):
             SyncResult indicating success or failure
         """
         try:
-            if not self.client:
-                await self.connect()
+            await self._ensure_connected()
             
             supabase_data = self._prepare_for_supabase(record)
-            table_name = self._get_table_name(record.get("record_type", "default"))
+            columns = tuple(supabase_data)
             
             # Perform upsert
-            result = self.client.table(table_name).upsert(
-                supabase_data,
-                on_conflict="id"
-            ).execute()
+            try:
+                record_id = await self._pool.fetchval(
+                    _upsert_sql(columns),
+                    *(_to_column_value(column, supabase_data[column]) for column in columns)
+                )
+            finally:
+                self._invalidate_cached(supabase_data["id"])
             
-            if result.data and len(result.data) > 0:
+            if record_id is not None:
                 return SyncResult(
                     success=True,
                     database="Supabase",
-                    record_id=result.data[0]["id"],
+                    record_id=str(record_id),
                 )
             else:
                 return SyncResult(
@@ -240,36 +457,100 @@ class SupabaseClient(BaseDatabaseClient):
     async def get(self, record_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a record from Supabase.
         
+        Args:
+            record_id: Record ID, mapped to a UUID as on upsert
+            
+        Returns:
+            Record data if found, None otherwise
+        """
+        row_id = _row_id(record_id)
+        cached = self._get_cache.get(row_id)
+        if cached is not None:
+            return dict(cached)
+        
+        pending = self._pending_gets.get(row_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_record(row_id))
+            self._pending_gets[row_id] = pending
+        
+        # Shielded so a cancelled caller does not cancel a read others await
+        result = await asyncio.shield(pending)
+        return dict(result) if result is not None else None
+    
+    async def get_many(self, record_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Retrieve many records from Supabase in one query.
+        
+        Cached records are returned from the cache; the rest are read together.
+        
+        Args:
+            record_ids: Record IDs, mapped to UUIDs as on upsert
+            
+        Returns:
+            Record data for each ID, in input order, or None if not found
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        uncached: Dict[str, List[str]] = {}
+        for record_id in dict.fromkeys(record_ids):
+            row_id = _row_id(record_id)
+            cached = self._get_cache.get(row_id)
+            if cached is not None:
+                found[record_id] = cached
+            else:
+                uncached.setdefault(row_id, []).append(record_id)
+        
+        if uncached:
+            try:
+                await self._ensure_connected()
+                
+                rows = await self._pool.fetch(
+                    "SELECT * FROM base_records WHERE id = ANY($1::uuid[])", list(uncached)
+                )
+                for row in rows:
+                    result = self._from_supabase_format(_from_row(row))
+                    for record_id in uncached[result["id"]]:
+                        found[record_id] = result
+                    
+            except Exception as e:
+                logger.error("Supabase get_many failed", error=str(e), records=len(uncached))
+        
+        return [
+            dict(found[record_id]) if record_id in found else None
+            for record_id in record_ids
+        ]
+    
+    async def _fetch_record(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """Read a record from the database and cache it.
+        
+        Runs as the task stored in _pending_gets; a write to the record while
+        it runs removes the task, and its result is then not cached.
+        
         Args:
             record_id: Record ID (UUID)
             
         Returns:
             Record data if found, None otherwise
         """
+        task = asyncio.current_task()
         try:
-            if not self.client:
-                await self.connect()
+            await self._ensure_connected()
             
-            # Try base_records table first
-            result = self.client.table("base_records").select("*").eq("id", record_id).execute()
+            # All record types live in base_records (single table inheritance)
+            row = await self._pool.fetchrow("SELECT * FROM base_records WHERE id = $1", record_id)
             
-            if result.data and len(result.data) > 0:
-                return self._from_supabase_format(result.data[0])
+            if row is None:
+                return None
             
-            # Try other tables if not found
-            for table in ["youtube_videos", "legal_websites", "transcripts", "legal_entities"]:
-                try:
-                    result = self.client.table(table).select("*").eq("id", record_id).execute()
-                    if result.data and len(result.data) > 0:
-                        return self._from_supabase_format(result.data[0])
-                except:
-                    continue
-            
-            return None
+            result = self._from_supabase_format(_from_row(row))
+            if self._pending_gets.get(record_id) is task:
+                self._get_cache.set(record_id, result)
+            return result
             
         except Exception as e:
             logger.error("Supabase get failed", error=str(e), record_id=record_id)
             return None
+        finally:
+            if self._pending_gets.get(record_id) is task:
+                del self._pending_gets[record_id]
     
     async def query(self, filters: Dict[str, Any], limit: int = 100) -> List[Dict[str, Any]]:
         """Query records from Supabase with SQL capabilities.
@@ -282,69 +563,128 @@ class SupabaseClient(BaseDatabaseClient):
             List of matching records
         """
         try:
-            if not self.client:
-                await self.connect()
-            
-            table_name = self._get_table_name(filters.get("record_type", "default"))
-            query = self.client.table(table_name).select("*")
-            
-            # Apply filters
-            for key, value in filters.items():
-                if key == "record_type":
-                    continue
-                elif key.startswith("metadata."):
-                    # Handle JSONB queries
-                    json_key = key.replace("metadata.", "")
-                    query = query.contains("metadata", {json_key: value})
-                elif key.endswith("__gte"):
-                    field = key.replace("__gte", "")
-                    query = query.gte(field, value)
-                elif key.endswith("__lte"):
-                    field = key.replace("__lte", "")
-                    query = query.lte(field, value)
-                elif key.endswith("__like"):
-                    field = key.replace("__like", "")
-                    query = query.like(field, value)
-                elif key.endswith("__in"):
-                    field = key.replace("__in", "")
-                    query = query.in_(field, value)
-                else:
-                    query = query.eq(key, value)
-            
-            # Apply limit and execute
-            result = query.limit(limit).execute()
-            
-            return [self._from_supabase_format(r) for r in result.data]
+            return [record async for record in self.iterate(filters, limit=limit)]
             
         except Exception as e:
             logger.error("Supabase query failed", error=str(e), filters=filters)
             return []
     
+    async def iterate(
+        self, filters: Dict[str, Any], limit: int = 100, page_size: int = QUERY_PAGE_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream matching records from Supabase one page at a time.
+        
+        Pages are read in ID order, each starting after the last ID of the
+        previous page, so only one page is held in memory and later pages
+        cost no more than the first.
+        
+        Args:
+            filters: Query filters
+            limit: Maximum number of records to yield
+            page_size: Records read per query
+            
+        Yields:
+            Matching records in standard format
+        """
+        await self._ensure_connected()
+        
+        table_name = self._get_table_name(filters.get("record_type", "default"))
+        conditions, params = self._build_conditions(filters)
+        
+        # Later pages continue after the last ID read; the page size is the
+        # last parameter of both statements
+        select = f"SELECT * FROM {table_name}"
+        first_page_sql = select
+        if conditions:
+            first_page_sql += " WHERE " + " AND ".join(conditions)
+        first_page_sql += f" ORDER BY id LIMIT ${len(params) + 1}"
+        next_page_sql = (
+            f"{select} WHERE " + " AND ".join([*conditions, f"id > ${len(params) + 1}"])
+            + f" ORDER BY id LIMIT ${len(params) + 2}"
+        )
+        
+        rows = await self._pool.fetch(first_page_sql, *params, min(page_size, limit))
+        remaining = limit
+        while True:
+            for row in rows:
+                yield self._from_supabase_format(_from_row(row))
+            
+            remaining -= len(rows)
+            if remaining <= 0 or len(rows) < page_size:
+                return
+            rows = await self._pool.fetch(
+                next_page_sql, *params, rows[-1]["id"], min(page_size, remaining)
+            )
+    
+    def _build_conditions(self, filters: Dict[str, Any]) -> Tuple[List[str], List[Any]]:
+        """Build SQL conditions for query filters.
+        
+        Args:
+            filters: Query filters
+            
+        Returns:
+            WHERE clause conditions and their parameter values, numbered from $1
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        
+        def add_condition(field: str, operator: str, value: Any) -> None:
+            if field not in _BASE_COLUMNS:
+                raise ValueError(f"Unknown column: {field}")
+            params.append(value)
+            conditions.append(operator.format(field=field, param=f"${len(params)}"))
+        
+        for key, value in filters.items():
+            if key == "record_type":
+                continue
+            if key.startswith("metadata."):
+                # Handle JSONB queries
+                add_condition("metadata", "{field} @> {param}", {key[len("metadata."):]: value})
+                continue
+            
+            # Keys are a column name, optionally followed by __<operator>
+            field, _, operator_name = key.rpartition("__")
+            operator = _FILTER_OPERATORS.get(operator_name) if field else None
+            if operator is None:
+                field, operator_name, operator = key, "eq", "{field} = {param}"
+            
+            if operator_name == "in":
+                value = [_to_column_value(field, item) for item in value]
+            elif operator_name != "like":
+                value = _to_column_value(field, value)
+            add_condition(field, operator, value)
+        
+        return conditions, params
+    
     async def delete(self, record_id: str) -> SyncResult:
         """Delete a record from Supabase.
         
         Args:
-            record_id: Record ID (UUID)
+            record_id: Record ID, mapped to a UUID as on upsert
             
         Returns:
             SyncResult indicating success or failure
         """
         try:
-            if not self.client:
-                await self.connect()
+            await self._ensure_connected()
             
-            # Try to find and delete from appropriate table
-            record = await self.get(record_id)
-            if not record:
+            # Every record type shares one table, so the record does not need
+            # to be read first to find it
+            table_name = self._get_table_name("default")
+            row_id = _row_id(record_id)
+            try:
+                deleted_id = await self._pool.fetchval(
+                    f"DELETE FROM {table_name} WHERE id = $1 RETURNING id", row_id
+                )
+            finally:
+                self._invalidate_cached(row_id)
+            if deleted_id is None:
                 return SyncResult(
                     success=False,
                     database="Supabase",
                     error="Record not found",
                 )
             
-            table_name = self._get_table_name(record.get("record_type", "default"))
-            result = self.client.table(table_name).delete().eq("id", record_id).execute()
-            
             return SyncResult(
                 success=True,
                 database="Supabase",
@@ -362,80 +702,160 @@ class SupabaseClient(BaseDatabaseClient):
     async def batch_upsert(self, records: List[Dict[str, Any]]) -> List[SyncResult]:
         """Batch insert or update multiple records.
         
+        Records are copied in chunks that are upserted concurrently, each in
+        its own transaction. A record given more than once is stored as its
+        last occurrence.
+        
         Args:
             records: List of records to upsert
             
         Returns:
-            List of SyncResults for each record
+            List of SyncResults for each record, in input order
         """
-        results = []
-        
-        # Group records by table
-        records_by_table = {}
-        for record in records:
-            table_name = self._get_table_name(record.get("record_type", "default"))
-            if table_name not in records_by_table:
-                records_by_table[table_name] = []
-            records_by_table[table_name].append(record)
-        
-        # Process each table's records
-        for table_name, table_records in records_by_table.items():
-            try:
-                # Prepare all records
-                supabase_data = [self._prepare_for_supabase(r) for r in table_records]
-                
-                # Batch upsert
-                result = self.client.table(table_name).upsert(
-                    supabase_data,
-                    on_conflict="id"
-                ).execute()
-                
-                # Create success results
-                for record in result.data:
-                    results.append(SyncResult(
-                        success=True,
+        results: List[Optional[SyncResult]] = [None] * len(records)
+        
+        try:
+            await self._ensure_connected()
+            
+            # Prepare records grouped by table and by the columns they set,
+            # keeping only the last write of each ID; the whole batch shares
+            # one default timestamp
+            now = datetime.utcnow().isoformat()
+            rows_by_group: Dict[Tuple[str, Tuple[str, ...]], Dict[str, Tuple[Any, ...]]] = {}
+            group_by_id: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+            positions_by_id: Dict[str, List[int]] = {}
+            for position, record in enumerate(records):
+                try:
+                    supabase_data = self._prepare_for_supabase(record, now)
+                except Exception as e:
+                    results[position] = SyncResult(
+                        success=False,
                         database="Supabase",
-                        record_id=record["id"],
-                    ))
-                    
-            except Exception as e:
-                logger.error("Supabase batch upsert failed", error=str(e))
-                for _ in table_records:
-                    results.append(SyncResult(
+                        error=str(e),
+                    )
+                    continue
+                
+                record_id = supabase_data["id"]
+                columns = tuple(supabase_data)
+                group = (self._get_table_name(record.get("record_type", "default")), columns)
+                previous_group = group_by_id.get(record_id)
+                if previous_group is not None:
+                    del rows_by_group[previous_group][record_id]
+                group_by_id[record_id] = group
+                positions_by_id.setdefault(record_id, []).append(position)
+                rows_by_group.setdefault(group, {})[record_id] = tuple(
+                    _to_column_value(column, supabase_data[column]) for column in columns
+                )
+            
+            # Copy each group in chunks, sent concurrently over the pool up to
+            # BATCH_UPSERT_MAX_CONCURRENCY at a time
+            chunks = []
+            for (table_name, columns), rows_by_id in rows_by_group.items():
+                record_ids = list(rows_by_id)
+                for i in range(0, len(record_ids), BATCH_UPSERT_CHUNK_SIZE):
+                    chunk_ids = record_ids[i:i + BATCH_UPSERT_CHUNK_SIZE]
+                    chunks.append((table_name, columns, chunk_ids, [rows_by_id[x] for x in chunk_ids]))
+            
+            responses = await asyncio.gather(
+                *(
+                    self._copy_upsert(table_name, columns, rows)
+                    for table_name, columns, _, rows in chunks
+                ),
+                return_exceptions=True
+            )
+            for record_id in group_by_id:
+                self._invalidate_cached(record_id)
+            
+            for (_, _, chunk_ids, _), response in zip(chunks, responses):
+                failed = isinstance(response, Exception)
+                if failed:
+                    logger.error("Supabase batch upsert failed", error=str(response), records=len(chunk_ids))
+                for record_id in chunk_ids:
+                    if failed:
+                        result = SyncResult(
+                            success=False,
+                            database="Supabase",
+                            error=str(response),
+                        )
+                    else:
+                        result = SyncResult(
+                            success=True,
+                            database="Supabase",
+                            record_id=record_id,
+                        )
+                    for position in positions_by_id[record_id]:
+                        results[position] = result
+            
+        except Exception as e:
+            logger.error("Supabase batch upsert failed", error=str(e))
+            for position, result in enumerate(results):
+                if result is None:
+                    results[position] = SyncResult(
                         success=False,
                         database="Supabase",
                         error=str(e),
-                    ))
+                    )
         
         return results
     
+    async def _copy_upsert(
+        self, table_name: str, columns: Tuple[str, ...], rows: List[Tuple[Any, ...]]
+    ) -> None:
+        """Upsert rows by copying them into a temporary table and merging it.
+        
+        COPY streams the rows in Postgres's binary format instead of binding
+        each row's parameters to an INSERT.
+        
+        Args:
+            table_name: Table to upsert into
+            columns: Columns set by every row
+            rows: Row values in column order, with unique IDs
+        """
+        async with self._copy_slots, self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMP TABLE upsert_rows ON COMMIT DROP AS "
+                    f"SELECT {', '.join(columns)} FROM {table_name} WITH NO DATA"
+                )
+                await conn.copy_records_to_table("upsert_rows", records=rows, columns=columns)
+                await conn.execute(_copy_upsert_sql(table_name, columns))
+    
     async def execute_sql(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Execute raw SQL query (for complex queries).
         
         Args:
-            query: SQL query
-            params: Query parameters
+            query: SQL query, referencing parameters as :name
+            params: Query parameters by name
             
         Returns:
             Query results
         """
         try:
-            if not self.client:
-                await self.connect()
+            await self._ensure_connected()
             
-            # Use Supabase RPC for raw SQL
-            result = self.client.rpc("execute_sql", {
-                "query": query,
-                "params": params or {}
-            }).execute()
+            # Run on the pool rather than through an RPC, so the query is
+            # prepared once per connection and parameters are sent in binary
+            params = params or {}
+            sql, order = _positional_sql(query, tuple(sorted(params)))
+            rows = await self._pool.fetch(sql, *(params[name] for name in order))
             
-            return result.data
+            return [_from_row(row) for row in rows]
             
         except Exception as e:
             logger.error("SQL execution failed", error=str(e), query=query)
             raise
     
-    def _get_table_name(self, record_type: str) -> str:
+    def _invalidate_cached(self, record_id: str) -> None:
+        """Drop cached and in-flight reads that a write to a record may have made stale.
+        
+        Args:
+            record_id: Record ID that was written
+        """
+        self._get_cache.pop(record_id)
+        self._pending_gets.pop(record_id, None)
+    
+    @staticmethod
+    def _get_table_name(record_type: str) -> str:
         """Get Supabase table name for a record type.
         
         Args:
@@ -457,28 +877,23 @@ class SupabaseClient(BaseDatabaseClient):
         Returns:
             Record in standard format
         """
-        # Extract base fields
-        standard_record = {
-            "id": supabase_record.get("id"),
-            "record_type": supabase_record.get("record_type"),
-            "created_at": supabase_record.get("created_at"),
-            "updated_at": supabase_record.get("updated_at"),
-            "synced_at": supabase_record.get("synced_at"),
-            "source_system": supabase_record.get("source_system"),
-            "source_id": supabase_record.get("source_id"),
-            "airtable_id": supabase_record.get("airtable_id"),
-            "supabase_id": supabase_record.get("id"),
-            "pinecone_id": supabase_record.get("pinecone_id"),
-            "sync_version": supabase_record.get("sync_version"),
-            "created_by": supabase_record.get("created_by"),
-            "updated_by": supabase_record.get("updated_by"),
-            "agent_version": supabase_record.get("agent_version"),
+        # Every base_records column is present in a row; base fields take
+        # precedence over metadata keys of the same name
+        record_id = supabase_record["id"]
+        return {
+            **(supabase_record["metadata"] or {}),
+            "id": record_id,
+            "record_type": supabase_record["record_type"],
+            "created_at": supabase_record["created_at"],
+            "updated_at": supabase_record["updated_at"],
+            "synced_at": supabase_record["synced_at"],
+            "source_system": supabase_record["source_system"],
+            "source_id": supabase_record["source_id"],
+            "airtable_id": supabase_record["airtable_id"],
+            "supabase_id": record_id,
+            "pinecone_id": supabase_record["pinecone_id"],
+            "sync_version": supabase_record["sync_version"],
+            "created_by": supabase_record["created_by"],
+            "updated_by": supabase_record["updated_by"],
+            "agent_version": supabase_record["agent_version"],
         }
-        
-        # Extract metadata fields
-        metadata = supabase_record.get("metadata", {})
-        for key, value in metadata.items():
-            if key not in standard_record:
-                standard_record[key] = value
-        
-        return standard_record
\ No newline at end of file
@@ -1,18 +1,53 @@
 """Synchronization manager for three-database architecture."""
 
 import asyncio
+import json
+import operator
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
-from uuid import uuid4
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
 
 from src.core.config import settings
-from src.core.logging import logger
+from src.core.logging import get_logger
 from src.db.clients.airtable_client import AirtableClient
 from src.db.clients.base_client import BaseRecord, SyncResult
 from src.db.clients.pinecone_client import PineconeClient
 from src.db.clients.supabase_client import SupabaseClient
 
+logger = get_logger(__name__)
+
+# Maximum number of records whose last synced content hash is remembered
+SYNC_HASH_MAX_SIZE = 100_000
+
+# Records whose failed writes are retried in the background at once
+SYNC_RETRY_CONCURRENCY = 16
+
+# Fields the sync itself sets, left out of a record's content hash
+_SYNC_BOOKKEEPING_FIELDS = frozenset((
+    "synced_at",
+    "sync_version",
+    "airtable_id",
+    "supabase_id",
+    "pinecone_id",
+))
+
+
+# Reused canonical JSON encoder; json.dumps builds a new encoder per call when
+# given options
+_canonical_json = json.JSONEncoder(sort_keys=True, default=str).encode
+
+
+def _content_hash(record: Dict[str, Any]) -> int:
+    """Hash a record's content, ignoring fields set by syncing it."""
+    content = {
+        key: value for key, value in record.items() if key not in _SYNC_BOOKKEEPING_FIELDS
+    }
+    return hash(_canonical_json(content))
+
 
 class QueryType(Enum):
     """Types of database queries for optimal database selection."""
@@ -23,16 +58,16 @@ class QueryType(Enum):
     FULL_SYNC = "full_sync"  # Use all databases
 
 
+@dataclass(slots=True)
 class ConsistencyResult:
     """Result of consistency check across databases."""
     
-    def __init__(self):
-        self.is_consistent = True
-        self.missing_in_airtable: Set[str] = set()
-        self.missing_in_supabase: Set[str] = set()
-        self.missing_in_pinecone: Set[str] = set()
-        self.version_mismatches: List[Dict[str, Any]] = []
-        self.timestamp = datetime.utcnow()
+    is_consistent: bool = True
+    missing_in_airtable: Set[str] = field(default_factory=set)
+    missing_in_supabase: Set[str] = field(default_factory=set)
+    missing_in_pinecone: Set[str] = field(default_factory=set)
+    version_mismatches: List[Dict[str, Any]] = field(default_factory=list)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
     
     def add_missing(self, database: str, record_id: str):
         """Add a missing record to the appropriate set."""
@@ -44,6 +79,18 @@ class ConsistencyResult:
             self.missing_in_pinecone.add(record_id)
         self.is_consistent = False
     
+    def add_missing_ids(self, database: str, record_ids: Set[str]):
+        """Add a set of missing records to the appropriate set."""
+        if not record_ids:
+            return
+        if database == "airtable":
+            self.missing_in_airtable |= record_ids
+        elif database == "supabase":
+            self.missing_in_supabase |= record_ids
+        elif database == "pinecone":
+            self.missing_in_pinecone |= record_ids
+        self.is_consistent = False
+    
     def add_version_mismatch(self, record_id: str, versions: Dict[str, int]):
         """Add a version mismatch."""
         self.version_mismatches.append({
@@ -61,41 +108,140 @@ class ThreeDatabaseSyncManager:
         self.airtable = AirtableClient()
         self.supabase = SupabaseClient()
         self.pinecone = PineconeClient()
+        self._clients = {
+            "airtable": self.airtable,
+            "supabase": self.supabase,
+            "pinecone": self.pinecone,
+        }
+        
+        # Databases to read from per query type, primary first, then fallbacks
+        self._read_order = {
+            QueryType.VISUAL_BROWSE: (self.airtable, self.supabase, self.pinecone),
+            QueryType.COMPLEX_QUERY: (self.supabase, self.airtable, self.pinecone),
+            QueryType.SEMANTIC_SEARCH: (self.pinecone, self.supabase, self.airtable),
+        }
+        # Default to most reliable
+        self._default_read_order = self._read_order[QueryType.COMPLEX_QUERY]
         
         # Sync configuration
-        self.batch_size = settings.SYNC_BATCH_SIZE
-        self.max_retries = settings.SYNC_MAX_RETRIES
-        self.retry_delay = settings.SYNC_RETRY_DELAY
-        self.consistency_check_enabled = settings.CONSISTENCY_CHECK_ENABLED
-        self.consistency_tolerance_seconds = settings.CONSISTENCY_TOLERANCE_SECONDS
+        self.batch_size = settings.sync_batch_size
+        self.max_retries = settings.sync_max_retries
+        self.retry_delay = settings.sync_retry_delay
+        self.consistency_check_enabled = settings.consistency_check_enabled
+        self.consistency_tolerance_seconds = settings.consistency_tolerance_seconds
+        self.min_batch_interval = settings.sync_min_batch_interval_ms / 1000
+        self.read_hedge_delay = settings.read_hedge_ms / 1000
+        
+        # Exponential backoff before each retry of a failed sync
+        self._backoffs = tuple(self.retry_delay * 2 ** attempt for attempt in range(self.max_retries))
+        self._app_version = settings.app_version
+        
+        # Record ID -> (content hash, results) of the last sync that reached
+        # all three databases
+        self._synced_hashes: OrderedDict[str, Tuple[int, Dict[str, SyncResult]]] = OrderedDict()
+        
+        # Background retries of partially failed syncs
+        self._pending_retries: Set[asyncio.Task] = set()
+        self._retry_slots = asyncio.Semaphore(SYNC_RETRY_CONCURRENCY)
+        
+        # Records submitted for syncing in coalesced batches, each with the
+        # future its caller awaits, and the task writing them
+        self._submit_queue: asyncio.Queue = asyncio.Queue()
+        self._coalescer: Optional[asyncio.Task] = None
     
-    async def connect_all(self) -> None:
-        """Connect to all three databases."""
-        await asyncio.gather(
-            self.airtable.connect(),
-            self.supabase.connect(),
-            self.pinecone.connect()
+    async def connect_all(self) -> Dict[str, bool]:
+        """Connect to all three databases.
+        
+        A database that fails to connect does not stop the others.
+        
+        Returns:
+            Dictionary of database name to whether it connected
+        """
+        results = await asyncio.gather(
+            *(client.connect() for client in self._clients.values()),
+            return_exceptions=True
         )
-        logger.info("Connected to all three databases")
+        status = self._gather_status("connect", results)
+        if all(status.values()):
+            logger.info("Connected to all three databases")
+        return status
     
-    async def disconnect_all(self) -> None:
-        """Disconnect from all three databases."""
-        await asyncio.gather(
-            self.airtable.disconnect(),
-            self.supabase.disconnect(),
-            self.pinecone.disconnect()
+    async def disconnect_all(self) -> Dict[str, bool]:
+        """Disconnect from all three databases.
+        
+        Records already submitted are synced, and pending retries finished,
+        first.
+        
+        Returns:
+            Dictionary of database name to whether it disconnected cleanly
+        """
+        if self._coalescer is not None:
+            await self._submit_queue.join()
+            self._coalescer.cancel()
+            self._coalescer = None
+        await self.wait_pending_retries()
+        
+        results = await asyncio.gather(
+            *(client.disconnect() for client in self._clients.values()),
+            return_exceptions=True
         )
+        status = self._gather_status("disconnect", results)
         logger.info("Disconnected from all three databases")
+        return status
     
-    async def sync_to_all_databases(self, record: Dict[str, Any]) -> Dict[str, SyncResult]:
+    def _gather_status(self, operation: str, results: List[Any]) -> Dict[str, bool]:
+        """Log failed per-database operations and report which succeeded.
+        
+        Args:
+            operation: Name of the operation, for logging
+            results: Gathered results in database order, exceptions included
+            
+        Returns:
+            Dictionary of database name to whether the operation succeeded
+        """
+        status = {}
+        for db_name, result in zip(self._clients, results):
+            status[db_name] = not isinstance(result, Exception)
+            if not status[db_name]:
+                logger.error(f"Database {operation} failed", database=db_name, error=str(result))
+        return status
+    
+    async def sync_to_all_databases(
+        self, record: Dict[str, Any], force: bool = False
+    ) -> Dict[str, SyncResult]:
         """Sync a record to all three databases in parallel.
         
+        A record whose content is unchanged since it last synced to all three
+        databases is not written again; its results are returned as skipped.
+        
+        Failed writes are retried in the background, so the results returned
+        are those of the first attempt; retries update them in place. Retries
+        write the content of the first attempt, and the IDs they obtain are
+        not copied onto the record.
+        
         Args:
             record: Record to sync
+            force: Write the record even if its content is unchanged
             
         Returns:
             Dictionary of database name to SyncResult
         """
+        content_hash = _content_hash(record) if "id" in record else None
+        if not force and content_hash is not None:
+            last_sync = self._synced_hashes.get(record["id"])
+            if last_sync is not None and last_sync[0] == content_hash:
+                self._synced_hashes.move_to_end(record["id"])
+                skipped_results = {}
+                for db_name, result in last_sync[1].items():
+                    record[f"{db_name}_id"] = result.record_id
+                    skipped_results[db_name] = SyncResult(
+                        success=True,
+                        database=result.database,
+                        record_id=result.record_id,
+                        skipped=True,
+                    )
+                return skipped_results
+        
         # Ensure we have base record fields
         if "id" not in record:
             record["id"] = str(uuid4())
@@ -106,40 +252,154 @@ class ThreeDatabaseSyncManager:
         else:
             record["sync_version"] = 1
         
-        # Parallel writes to all databases
-        results = await asyncio.gather(
-            self.airtable.upsert(record),
-            self.supabase.upsert(record),
-            self.pinecone.upsert(record),
-            return_exceptions=True
-        )
+        # Parallel writes to all databases, each handled as soon as it
+        # finishes rather than after the slowest one. The writes share a copy
+        # of the record, so none of them sees IDs recorded while they run.
+        snapshot = dict(record)
+        sync_results: Dict[str, SyncResult] = dict.fromkeys(self._clients)
+        for completed in asyncio.as_completed([
+            self._upsert_to(db_name, snapshot) for db_name in self._clients
+        ]):
+            db_name, result = await completed
+            sync_results[db_name] = result
+            
+            # Update record with database ID
+            if result.success:
+                record[f"{db_name}_id"] = result.record_id
         
-        # Map results
-        sync_results = {
-            "airtable": results[0] if not isinstance(results[0], Exception) else SyncResult(
-                success=False, database="Airtable", error=str(results[0])
-            ),
-            "supabase": results[1] if not isinstance(results[1], Exception) else SyncResult(
-                success=False, database="Supabase", error=str(results[1])
-            ),
-            "pinecone": results[2] if not isinstance(results[2], Exception) else SyncResult(
-                success=False, database="Pinecone", error=str(results[2])
-            ),
-        }
+        if all(result.success for result in sync_results.values()):
+            self._remember_sync(record, content_hash, sync_results)
+        elif self.consistency_check_enabled:
+            # Retry failed databases without making the caller wait, on a
+            # copy of what the first attempt wrote along with the IDs it got,
+            # so later changes to the caller's record are not half-applied
+            retry_record = dict(snapshot)
+            for db_name, result in sync_results.items():
+                if result.success:
+                    retry_record[f"{db_name}_id"] = result.record_id
+            task = asyncio.create_task(
+                self._retry_in_background(retry_record, content_hash, sync_results)
+            )
+            self._pending_retries.add(task)
+            task.add_done_callback(self._pending_retries.discard)
         
-        # Update record with database IDs
-        if sync_results["airtable"].success:
-            record["airtable_id"] = sync_results["airtable"].record_id
-        if sync_results["supabase"].success:
-            record["supabase_id"] = sync_results["supabase"].record_id
-        if sync_results["pinecone"].success:
-            record["pinecone_id"] = sync_results["pinecone"].record_id
+        return sync_results
+    
+    async def _retry_in_background(
+        self,
+        record: Dict[str, Any],
+        content_hash: Optional[int],
+        sync_results: Dict[str, SyncResult]
+    ) -> None:
+        """Retry a partially failed sync, up to SYNC_RETRY_CONCURRENCY records at once.
         
-        # Check consistency if enabled
-        if self.consistency_check_enabled:
+        Args:
+            record: Copy of the record as first written, with the IDs obtained
+            content_hash: Content hash from before the sync, if it had an ID
+            sync_results: Results from sync operation, updated by the retries
+        """
+        async with self._retry_slots:
             await self._verify_sync_consistency(record, sync_results)
+        if all(result.success for result in sync_results.values()):
+            self._remember_sync(record, content_hash, sync_results)
+    
+    async def wait_pending_retries(self) -> None:
+        """Wait for background retries of failed syncs to finish."""
+        if self._pending_retries:
+            await asyncio.gather(*self._pending_retries, return_exceptions=True)
+    
+    def _remember_sync(
+        self,
+        record: Dict[str, Any],
+        content_hash: Optional[int],
+        sync_results: Dict[str, SyncResult]
+    ) -> None:
+        """Remember the content hash of a record that synced to all databases.
         
-        return sync_results
+        Args:
+            record: Record that was synced
+            content_hash: Content hash from before the sync, if it had an ID
+            sync_results: Successful results of the sync
+        """
+        if content_hash is None:
+            content_hash = _content_hash(record)
+        self._synced_hashes[record["id"]] = (content_hash, sync_results)
+        self._synced_hashes.move_to_end(record["id"])
+        if len(self._synced_hashes) > SYNC_HASH_MAX_SIZE:
+            self._synced_hashes.popitem(last=False)
+    
+    def _forget_syncs(self, record_ids: List[str]) -> None:
+        """Forget the content hashes of records written outside sync_to_all_databases.
+        
+        Args:
+            record_ids: IDs of the records written
+        """
+        for record_id in record_ids:
+            self._synced_hashes.pop(record_id, None)
+    
+    async def submit(self, record: Dict[str, Any]) -> Dict[str, SyncResult]:
+        """Sync a record to all three databases as part of a coalesced batch.
+        
+        Records submitted within min_batch_interval of each other, or while
+        the previous batch is being written, are synced together with
+        batch_sync_to_all_databases. Unlike sync_to_all_databases, database
+        IDs are not copied back onto the record and failed writes are not
+        retried.
+        
+        Args:
+            record: Record to sync
+            
+        Returns:
+            Dictionary of database name to SyncResult
+        """
+        if self._coalescer is None or self._coalescer.done():
+            self._coalescer = asyncio.create_task(self._coalesce_submissions())
+        
+        future = asyncio.get_running_loop().create_future()
+        self._submit_queue.put_nowait((record, future))
+        return await future
+    
+    async def _coalesce_submissions(self) -> None:
+        """Write submitted records in batches until cancelled."""
+        queue = self._submit_queue
+        while True:
+            submissions = [await queue.get()]
+            await asyncio.sleep(self.min_batch_interval)
+            while not queue.empty():
+                submissions.append(queue.get_nowait())
+            
+            try:
+                results = await self.batch_sync_to_all_databases(
+                    [record for record, _ in submissions]
+                )
+                for position, (_, future) in enumerate(submissions):
+                    if not future.done():
+                        future.set_result({
+                            db_name: db_results[position]
+                            for db_name, db_results in results.items()
+                        })
+            except Exception as e:
+                for _, future in submissions:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in submissions:
+                    queue.task_done()
+    
+    async def _upsert_to(self, db_name: str, record: Dict[str, Any]) -> Tuple[str, SyncResult]:
+        """Upsert a record to one database, turning exceptions into failed results.
+        
+        Args:
+            db_name: Database name
+            record: Record to upsert
+            
+        Returns:
+            The database name and its SyncResult
+        """
+        try:
+            return db_name, await self._clients[db_name].upsert(record)
+        except Exception as e:
+            return db_name, SyncResult(success=False, database=db_name.title(), error=str(e))
     
     async def batch_sync_to_all_databases(
         self,
@@ -153,47 +413,48 @@ class ThreeDatabaseSyncManager:
         Returns:
             Dictionary of database name to list of SyncResults
         """
-        all_results = {
-            "airtable": [],
-            "supabase": [],
-            "pinecone": [],
-        }
+        # Prepare records with one timestamp for the call, and new random
+        # (version 4) IDs cut from a single urandom read
+        now = datetime.utcnow().isoformat()
+        new_records = [record for record in records if "id" not in record]
+        random_bytes = os.urandom(16 * len(new_records))
+        for position, record in enumerate(new_records):
+            record["id"] = str(UUID(bytes=random_bytes[16 * position:16 * position + 16], version=4))
+        for record in records:
+            record.setdefault("synced_at", now)
+            record["sync_version"] = record.get("sync_version", 0) + 1
         
-        # Process in batches
-        for i in range(0, len(records), self.batch_size):
-            batch = records[i:i + self.batch_size]
-            
-            # Prepare batch records
-            for record in batch:
-                if "id" not in record:
-                    record["id"] = str(uuid4())
-                if "synced_at" not in record:
-                    record["synced_at"] = datetime.utcnow().isoformat()
-                if "sync_version" in record:
-                    record["sync_version"] += 1
-                else:
-                    record["sync_version"] = 1
-            
-            # Batch sync to all databases
-            results = await asyncio.gather(
-                self.airtable.batch_upsert(batch),
-                self.supabase.batch_upsert(batch),
-                self.pinecone.batch_upsert(batch),
+        # Submit every batch to all databases up front; each client bounds the
+        # requests it has in flight
+        batches = [
+            records[i:i + self.batch_size]
+            for i in range(0, len(records), self.batch_size)
+        ]
+        batch_results = await asyncio.gather(*(
+            asyncio.gather(
+                *(client.batch_upsert(batch) for client in self._clients.values()),
                 return_exceptions=True
             )
-            
-            # Handle results
-            for db_idx, db_name in enumerate(["airtable", "supabase", "pinecone"]):
-                if isinstance(results[db_idx], Exception):
+            for batch in batches
+        ))
+        
+        # The records may now differ from what sync_to_all_databases last wrote
+        self._forget_syncs([record["id"] for record in records])
+        
+        # Handle results, in input order
+        all_results: Dict[str, List[SyncResult]] = {db_name: [] for db_name in self._clients}
+        for batch, results in zip(batches, batch_results):
+            for db_name, db_results in zip(self._clients, results):
+                if isinstance(db_results, Exception):
                     # All records in batch failed
                     for _ in batch:
                         all_results[db_name].append(SyncResult(
                             success=False,
                             database=db_name.title(),
-                            error=str(results[db_idx])
+                            error=str(db_results)
                         ))
                 else:
-                    all_results[db_name].extend(results[db_idx])
+                    all_results[db_name].extend(db_results)
         
         return all_results
     
@@ -206,14 +467,7 @@ class ThreeDatabaseSyncManager:
         Returns:
             Database client
         """
-        if query_type == QueryType.VISUAL_BROWSE:
-            return self.airtable
-        elif query_type == QueryType.COMPLEX_QUERY:
-            return self.supabase
-        elif query_type == QueryType.SEMANTIC_SEARCH:
-            return self.pinecone
-        else:
-            return self.supabase  # Default to most reliable
+        return self._read_order.get(query_type, self._default_read_order)[0]
     
     async def query_with_fallback(
         self,
@@ -223,6 +477,17 @@ class ThreeDatabaseSyncManager:
     ) -> List[Dict[str, Any]]:
         """Query with automatic fallback to other databases if primary fails.
         
+        The databases are not equivalent: Pinecone ranks by similarity to
+        filters["query_text"], Supabase filters on its columns, and Airtable
+        answers slowly under a tight rate limit. A fallback's results may
+        therefore differ from what the primary would have returned.
+        
+        A primary query still running after read_hedge_delay is hedged: the
+        first fallback database is queried too, and whichever returns results
+        first is used. Only queries the fallback answers the same way are
+        hedged, so semantic searches (query_text) and Airtable fallbacks
+        wait for the primary instead.
+        
         Args:
             filters: Query filters
             query_type: Type of query
@@ -232,25 +497,41 @@ class ThreeDatabaseSyncManager:
             List of matching records
         """
         # Determine primary and fallback databases
-        primary_db = self.select_read_database(query_type)
-        fallback_order = []
+        primary_db, *fallback_order = self._read_order.get(query_type, self._default_read_order)
         
-        if primary_db == self.airtable:
-            fallback_order = [self.supabase, self.pinecone]
-        elif primary_db == self.supabase:
-            fallback_order = [self.airtable, self.pinecone]
-        else:  # Pinecone
-            fallback_order = [self.supabase, self.airtable]
+        # Try primary database, hedged with the first fallback if it is slow
+        in_flight = {asyncio.create_task(primary_db.query(filters, limit)): primary_db}
+        hedge_db = self._hedge_database(filters, fallback_order)
+        done, _ = await asyncio.wait(
+            in_flight, timeout=self.read_hedge_delay if hedge_db is not None else None
+        )
+        if not done:
+            fallback_order.remove(hedge_db)
+            in_flight[asyncio.create_task(hedge_db.query(filters, limit))] = hedge_db
         
-        # Try primary database
         try:
-            results = await primary_db.query(filters, limit)
-            if results:
-                return results
-        except Exception as e:
-            logger.warning(f"Primary database query failed: {e}")
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer the primary when both finish together
+                for task in [task for task in in_flight if task in done]:
+                    db = in_flight.pop(task)
+                    try:
+                        results = task.result()
+                    except Exception as e:
+                        if db is primary_db:
+                            logger.warning(f"Primary database query failed: {e}")
+                        else:
+                            logger.warning(f"Fallback database query failed: {e}")
+                        continue
+                    if results:
+                        if db is not primary_db:
+                            logger.info(f"Query succeeded with fallback database: {db.database_name}")
+                        return results
+        finally:
+            for task in in_flight:
+                task.cancel()
         
-        # Try fallback databases
+        # Try remaining fallback databases
         for db in fallback_order:
             try:
                 results = await db.query(filters, limit)
@@ -262,6 +543,24 @@ class ThreeDatabaseSyncManager:
         
         return []
     
+    def _hedge_database(self, filters: Dict[str, Any], fallback_order: List[Any]) -> Optional[Any]:
+        """Select the database a slow query is hedged to, if any.
+        
+        Args:
+            filters: Query filters
+            fallback_order: Fallback databases, in order
+            
+        Returns:
+            First fallback database when it answers the query the same way as
+            the primary, else None
+        """
+        if not fallback_order or "query_text" in filters:
+            return None
+        hedge_db = fallback_order[0]
+        if hedge_db is self.airtable:
+            return None
+        return hedge_db
+    
     async def check_consistency(
         self,
         record_ids: Optional[List[str]] = None,
@@ -280,39 +579,41 @@ class ThreeDatabaseSyncManager:
         
         # Get records from each database
         if record_ids:
-            # Check specific records
-            for record_id in record_ids:
-                records = await asyncio.gather(
-                    self.airtable.get(record_id),
-                    self.supabase.get(record_id),
-                    self.pinecone.get(record_id),
-                    return_exceptions=True
-                )
-                
-                # Check existence
-                airtable_record = records[0] if not isinstance(records[0], Exception) else None
-                supabase_record = records[1] if not isinstance(records[1], Exception) else None
-                pinecone_record = records[2] if not isinstance(records[2], Exception) else None
-                
-                # Track missing records
-                if not airtable_record:
-                    result.add_missing("airtable", record_id)
-                if not supabase_record:
-                    result.add_missing("supabase", record_id)
-                if not pinecone_record:
-                    result.add_missing("pinecone", record_id)
-                
-                # Check version consistency
-                versions = {}
-                if airtable_record:
-                    versions["airtable"] = airtable_record.get("sync_version", 0)
-                if supabase_record:
-                    versions["supabase"] = supabase_record.get("sync_version", 0)
-                if pinecone_record:
-                    versions["pinecone"] = pinecone_record.get("sync_version", 0)
+            # Check specific records, read from each database in bulk
+            records_by_db = await asyncio.gather(
+                *(client.get_many(record_ids) for client in self._clients.values()),
+                return_exceptions=True
+            )
+            no_records = [None] * len(record_ids)
+            records_by_db = [
+                no_records if isinstance(records, Exception) else records
+                for records in records_by_db
+            ]
+            
+            for record_id, *records in zip(record_ids, *records_by_db):
+                # Track missing records, and whether the records found agree
+                # on their sync version
+                first_version = None
+                found = False
+                version_mismatch = False
+                for db_name, record in zip(self._clients, records):
+                    if not record:
+                        result.add_missing(db_name, record_id)
+                        continue
+                    version = record.get("sync_version", 0)
+                    if not found:
+                        first_version = version
+                        found = True
+                    elif version != first_version:
+                        version_mismatch = True
                 
-                if len(set(versions.values())) > 1:
-                    result.add_version_mismatch(record_id, versions)
+                # Only a mismatch needs the versions by database
+                if version_mismatch:
+                    result.add_version_mismatch(record_id, {
+                        db_name: record.get("sync_version", 0)
+                        for db_name, record in zip(self._clients, records)
+                        if record
+                    })
         
         else:
             # Check all records (expensive operation)
@@ -332,14 +633,9 @@ class ThreeDatabaseSyncManager:
             
             # Find missing records
             all_ids = supabase_ids | airtable_ids | pinecone_ids
-            
-            for record_id in all_ids:
-                if record_id not in airtable_ids:
-                    result.add_missing("airtable", record_id)
-                if record_id not in supabase_ids:
-                    result.add_missing("supabase", record_id)
-                if record_id not in pinecone_ids:
-                    result.add_missing("pinecone", record_id)
+            result.add_missing_ids("airtable", all_ids - airtable_ids)
+            result.add_missing_ids("supabase", all_ids - supabase_ids)
+            result.add_missing_ids("pinecone", all_ids - pinecone_ids)
         
         return result
     
@@ -364,46 +660,66 @@ class ThreeDatabaseSyncManager:
             "errors": []
         }
         
-        # Use Supabase as source of truth
-        for record_id in consistency_result.missing_in_airtable | consistency_result.missing_in_pinecone:
-            try:
-                # Get record from Supabase
-                record = await self.supabase.get(record_id)
-                if record:
-                    action = {
-                        "type": "sync_missing",
-                        "record_id": record_id,
-                        "missing_in": []
-                    }
-                    
-                    if record_id in consistency_result.missing_in_airtable:
-                        action["missing_in"].append("airtable")
-                    if record_id in consistency_result.missing_in_pinecone:
-                        action["missing_in"].append("pinecone")
-                    
-                    if not dry_run:
-                        # Sync to missing databases
-                        sync_results = await self.sync_to_all_databases(record)
-                        action["results"] = {
-                            db: result.success
-                            for db, result in sync_results.items()
-                        }
-                    
-                    report["actions"].append(action)
-                    
-            except Exception as e:
-                report["errors"].append({
-                    "record_id": record_id,
-                    "error": str(e)
-                })
+        # Use Supabase as source of truth, reading every missing record at once
+        missing_sets = {
+            "airtable": consistency_result.missing_in_airtable,
+            "pinecone": consistency_result.missing_in_pinecone,
+        }
+        missing_ids = list(set().union(*missing_sets.values()))
+        try:
+            source_records = await self.supabase.get_many(missing_ids) if missing_ids else []
+        except Exception as e:
+            source_records = []
+            report["errors"].extend(
+                {"record_id": record_id, "error": str(e)} for record_id in missing_ids
+            )
+        
+        # Collect the records each database is missing
+        actions_by_id: Dict[str, Dict[str, Any]] = {}
+        ids_by_db: Dict[str, List[str]] = {db_name: [] for db_name in missing_sets}
+        records_by_db: Dict[str, List[Dict[str, Any]]] = {db_name: [] for db_name in missing_sets}
+        for record_id, record in zip(missing_ids, source_records):
+            if not record:
+                continue
+            action = {
+                "type": "sync_missing",
+                "record_id": record_id,
+                "missing_in": []
+            }
+            for db_name, missing in missing_sets.items():
+                if record_id in missing:
+                    action["missing_in"].append(db_name)
+                    ids_by_db[db_name].append(record_id)
+                    records_by_db[db_name].append(record)
+            actions_by_id[record_id] = action
+            report["actions"].append(action)
+        
+        if not dry_run:
+            # Sync to missing databases, one batch per database
+            targets = [db_name for db_name, records in records_by_db.items() if records]
+            batch_results = await asyncio.gather(
+                *(self._clients[db_name].batch_upsert(records_by_db[db_name]) for db_name in targets),
+                return_exceptions=True
+            )
+            self._forget_syncs(list(actions_by_id))
+            for db_name, results in zip(targets, batch_results):
+                for position, record_id in enumerate(ids_by_db[db_name]):
+                    if isinstance(results, Exception):
+                        success = False
+                        report["errors"].append({
+                            "record_id": record_id,
+                            "error": str(results)
+                        })
+                    else:
+                        success = results[position].success
+                    actions_by_id[record_id].setdefault("results", {})[db_name] = success
         
         # Handle version mismatches
         for mismatch in consistency_result.version_mismatches:
             try:
                 # Get the latest version (highest sync_version)
                 record_id = mismatch["record_id"]
-                latest_version = max(mismatch["versions"].values())
-                source_db = [db for db, v in mismatch["versions"].items() if v == latest_version][0]
+                source_db, _ = max(mismatch["versions"].items(), key=operator.itemgetter(1))
                 
                 action = {
                     "type": "resolve_version_mismatch",
@@ -414,16 +730,11 @@ class ThreeDatabaseSyncManager:
                 
                 if not dry_run:
                     # Get record from source database
-                    if source_db == "airtable":
-                        record = await self.airtable.get(record_id)
-                    elif source_db == "supabase":
-                        record = await self.supabase.get(record_id)
-                    else:
-                        record = await self.pinecone.get(record_id)
+                    record = await self._clients[source_db].get(record_id)
                     
                     if record:
                         # Sync to all databases
-                        sync_results = await self.sync_to_all_databases(record)
+                        sync_results = await self.sync_to_all_databases(record, force=True)
                         action["results"] = {
                             db: result.success
                             for db, result in sync_results.items()
@@ -462,34 +773,27 @@ class ThreeDatabaseSyncManager:
                 failed_databases=failed_dbs
             )
             
-            # Retry failed databases
-            for attempt in range(self.max_retries):
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+            # Retry the databases that are still failing; a success replaces
+            # that database's result, so it is not written again
+            for attempt, backoff in enumerate(self._backoffs):
+                await asyncio.sleep(backoff)
                 
-                retry_tasks = []
-                if "airtable" in failed_dbs and not sync_results["airtable"].success:
-                    retry_tasks.append(self.airtable.upsert(record))
-                if "supabase" in failed_dbs and not sync_results["supabase"].success:
-                    retry_tasks.append(self.supabase.upsert(record))
-                if "pinecone" in failed_dbs and not sync_results["pinecone"].success:
-                    retry_tasks.append(self.pinecone.upsert(record))
+                retry_results = await asyncio.gather(*(
+                    self._upsert_to(db_name, record) for db_name in failed_dbs
+                ))
+                for db_name, result in retry_results:
+                    if result.success:
+                        sync_results[db_name] = result
+                        record[f"{db_name}_id"] = result.record_id
                 
-                if retry_tasks:
-                    retry_results = await asyncio.gather(*retry_tasks, return_exceptions=True)
-                    
-                    # Check if retries succeeded
-                    all_retry_success = all(
-                        not isinstance(r, Exception) and r.success
-                        for r in retry_results
+                failed_dbs = [db for db in failed_dbs if not sync_results[db].success]
+                if not failed_dbs:
+                    logger.info(
+                        "Sync consistency restored after retry",
+                        record_id=record.get("id"),
+                        attempt=attempt + 1
                     )
-                    
-                    if all_retry_success:
-                        logger.info(
-                            "Sync consistency restored after retry",
-                            record_id=record.get("id"),
-                            attempt=attempt + 1
-                        )
-                        break
+                    break
             else:
                 # All retries failed
                 logger.critical(
@@ -530,7 +834,7 @@ class ThreeDatabaseSyncManager:
             "source_system": "sync_manager",
             "created_by": "system",
             "updated_by": "system",
-            "agent_version": settings.APP_VERSION,
+            "agent_version": self._app_version,
         }
         
         try:
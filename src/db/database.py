@@ -6,17 +6,28 @@ from typing import AsyncGenerator, Generator
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from ..core.config import get_settings
 
 settings = get_settings()
 
+# Pool sizing shared by both engines. Connections are checked out newest
+# first, so a small set stays warm and the rest can idle out.
+_pool_options = {
+    "pool_size": settings.database_pool_size,
+    "max_overflow": settings.database_max_overflow,
+    "pool_timeout": settings.database_pool_timeout,
+    "pool_use_lifo": True,
+}
+
 # Synchronous database setup
 engine = create_engine(
     settings.get_database_url(),
     pool_pre_ping=True,
     pool_recycle=300,
     echo=settings.is_development,
+    **_pool_options,
 )
 
 SessionLocal = sessionmaker(
@@ -25,12 +36,21 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
-# Asynchronous database setup
+# Asynchronous database setup. PgBouncer already pools connections and, in
+# transaction pooling mode, cannot keep asyncpg's prepared statements, so
+# connections through it are not pooled again or cached on.
+if settings.database_pgbouncer:
+    _async_pool_options = {
+        "poolclass": NullPool,
+        "connect_args": {"statement_cache_size": 0},
+    }
+else:
+    _async_pool_options = {"pool_pre_ping": True, "pool_recycle": 300, **_pool_options}
+
 async_engine = create_async_engine(
     settings.get_database_url().replace("postgresql://", "postgresql+asyncpg://"),
-    pool_pre_ping=True,
-    pool_recycle=300,
     echo=settings.is_development,
+    **_async_pool_options,
 )
 
 AsyncSessionLocal = async_sessionmaker(
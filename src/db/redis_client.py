@@ -185,14 +185,17 @@ class RedisCache:
                 else:
                     serialized_mapping[k] = v
             
-            # Set all values
-            result = await self.client.mset(serialized_mapping)
+            if not ttl:
+                result = await self.client.mset(serialized_mapping)
+                return bool(result)
             
-            # Set TTL if specified
-            if ttl and result:
-                await self.client.expire(*serialized_mapping.keys(), ttl)
+            # MSET cannot set a TTL, so pipeline one SET ... EX per key
+            pipeline = self.client.pipeline(transaction=False)
+            for k, v in serialized_mapping.items():
+                pipeline.set(k, v, ex=ttl)
+            results = await pipeline.execute()
             
-            return bool(result)
+            return all(results)
             
         except RedisError as e:
             logger.error("Failed to set multiple cache values", keys=list(mapping.keys()), error=str(e))
@@ -11,7 +11,7 @@ from src.core.config import settings
 from src.core.logging import get_logger, log_exception, setup_logging
 from src.core.metrics_middleware import MetricsMiddleware, PerformanceTimingMiddleware
 from src.core.api_key_middleware import APIKeyRateLimitMiddleware
-from src.core.sentry import setup_sentry
+from src.core.sentry import flush_sentry, setup_sentry
 from src.core.security_headers import SecurityHeadersMiddleware
 from src.core.cors import get_cors_middleware
 from src.core.https_redirect import get_https_redirect_middleware
@@ -55,6 +55,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     except Exception as e:
         logger.error("Error closing Redis connection", error=str(e))
     
+    # Send any pending error events before exiting
+    flush_sentry()
+    
     print("Shutting down lit_law411-agent")
 
 
@@ -0,0 +1,67 @@
+"""In-process LRU cache with optional per-entry expiry."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Bounded least-recently-used cache held in process memory.
+    
+    Entries are evicted oldest-first once ``maxsize`` is reached and, when a
+    ``ttl`` is given, treated as missing once they are older than ``ttl``
+    seconds.
+    """
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid, or None to never expire
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value and mark it as recently used."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at and expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a value and return it."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether a live entry exists for the key."""
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __len__(self) -> int:
+        """Number of stored entries, including any not yet purged after expiry."""
+        return len(self._data)
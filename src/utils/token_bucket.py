@@ -0,0 +1,43 @@
+"""Token bucket for throttling outbound API calls."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket allowing bursts up to ``capacity`` calls.
+    
+    Tokens refill continuously at ``rate`` per second; ``acquire`` waits until
+    a token is available instead of letting a request be rejected upstream.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """Initialize the bucket full.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens held
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Take tokens from the bucket, waiting for them to refill if needed.
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
@@ -312,8 +312,7 @@ class TestCacheManagement:
         
         # Test performance check
         performance = await health_checker.check_performance()
-        assert "set_latency_ms" in performance
-        assert "get_latency_ms" in performance
+        assert "round_trip_latency_ms" in performance
         assert "test_successful" in performance
         assert performance["test_successful"] is True
         
@@ -0,0 +1,53 @@
+"""Unit tests for the Airtable client."""
+
+import pytest
+
+from src.db.clients.airtable_client import AirtableClient
+
+
+class TestBuildFormula:
+    """Test cases for building Airtable filter formulas."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.client = AirtableClient({"api_key": "test-key", "base_id": "test-base"})
+    
+    def test_record_type_only_matches_everything(self):
+        """Test that a filter on the record type alone builds no formula."""
+        assert self.client._build_formula({"record_type": "youtube_video"}) is None
+    
+    def test_values_are_escaped(self):
+        """Test that quotes in a value cannot break the formula."""
+        formula = self.client._build_formula({"title": "It's"})
+        
+        assert formula == "AND({Title}='It\\'s')"
+    
+    def test_list_values_match_any_item(self):
+        """Test that a list value matches any of its items."""
+        formula = self.client._build_formula(
+            {"record_type": "youtube_video", "status": ["a", "b"], "source_id": 3}
+        )
+        
+        assert formula == "AND(OR({Status}='a', {Status}='b'), {Source Id}=3)"
+    
+    def test_empty_list_matches_nothing(self):
+        """Test that an empty list value builds a formula matching no records."""
+        assert self.client._build_formula({"status": [], "source_id": 3}) == "FALSE()"
+
+
+class TestAirtableClientLifecycle:
+    """Test cases for AirtableClient connection lifecycle."""
+    
+    @pytest.mark.asyncio
+    async def test_disconnect_shuts_down_executor(self):
+        """Test that the executor created by connect is shut down by disconnect."""
+        client = AirtableClient({"api_key": "test-key", "base_id": "test-base"})
+        
+        await client.connect()
+        executor = client._executor
+        assert executor is not None
+        
+        await client.disconnect()
+        
+        assert client._executor is None
+        assert executor._shutdown
@@ -0,0 +1,201 @@
+"""Unit tests for cache management."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.db.cache_manager import (
+    SESSION_CLEANUP_INTERVAL,
+    SESSION_CLEANUP_LOCK_KEY,
+    SESSION_CLEANUP_SCAN_COUNT,
+    USER_CACHE_TTL,
+    WARM_BATCH_SIZE,
+    CacheHealthChecker,
+    CacheInvalidationManager,
+    CacheWarmer,
+)
+
+
+class TestCacheWarmer:
+    """Test cases for CacheWarmer class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_cache = Mock()
+        self.warmer = CacheWarmer(self.mock_cache)
+    
+    @pytest.mark.asyncio
+    async def test_warm_user_data_counts_missing_keys(self):
+        """Test that only uncached users are counted as warmed."""
+        self.mock_cache.client.mget = AsyncMock(return_value=["cached", None, None])
+        
+        warmed = await self.warmer.warm_user_data(["user1", "user2", "user3"])
+        
+        assert warmed == 2
+        self.mock_cache.client.mget.assert_awaited_once_with(
+            ["user:user1", "user:user2", "user:user3"]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_warm_popular_content_probes_in_batches(self):
+        """Test that existence probes are batched per MGET call."""
+        content_ids = [f"c{i}" for i in range(WARM_BATCH_SIZE + 5)]
+        self.mock_cache.client.mget = AsyncMock(
+            side_effect=lambda keys: [None] * len(keys)
+        )
+        
+        warmed = await self.warmer.warm_popular_content(content_ids)
+        
+        assert warmed == len(content_ids)
+        assert self.mock_cache.client.mget.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_warm_user_data_writes_loaded_data(self):
+        """Test that loaded data for uncached users is written in one batch."""
+        self.mock_cache.client.mget = AsyncMock(return_value=["cached", None])
+        self.mock_cache.set_multiple = AsyncMock(return_value=True)
+        loader = AsyncMock(return_value={"user2": {"name": "Jane"}})
+        
+        warmed = await self.warmer.warm_user_data(["user1", "user2"], loader=loader)
+        
+        assert warmed == 1
+        loader.assert_awaited_once_with(["user2"])
+        self.mock_cache.set_multiple.assert_awaited_once_with(
+            {"user:user2": {"name": "Jane"}}, ttl=USER_CACHE_TTL
+        )
+    
+    @pytest.mark.asyncio
+    async def test_warm_user_data_handles_errors(self):
+        """Test that probe failures are logged and reported as nothing warmed."""
+        self.mock_cache.client.mget = AsyncMock(side_effect=Exception("Redis down"))
+        
+        warmed = await self.warmer.warm_user_data(["user1"])
+        
+        assert warmed == 0
+
+
+class TestCacheInvalidationManager:
+    """Test cases for CacheInvalidationManager class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_cache = Mock()
+        self.invalidator = CacheInvalidationManager(self.mock_cache)
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_expired_sessions_checks_scanned_batches(self):
+        """Test that scanned session keys are checked and unlinked in batches."""
+        keys = [f"session:{i}" for i in range(SESSION_CLEANUP_SCAN_COUNT + 2)]
+        
+        async def scan_iter(**kwargs):
+            for key in keys:
+                yield key
+        
+        self.mock_cache.client.set = AsyncMock(return_value=True)
+        self.mock_cache.client.scan_iter = Mock(side_effect=scan_iter)
+        self.mock_cache.client.eval = AsyncMock(side_effect=[3, 1])
+        
+        deleted = await self.invalidator.invalidate_expired_sessions()
+        
+        assert deleted == 4
+        self.mock_cache.client.set.assert_awaited_once_with(
+            SESSION_CLEANUP_LOCK_KEY, "1", nx=True, ex=SESSION_CLEANUP_INTERVAL
+        )
+        self.mock_cache.client.scan_iter.assert_called_once_with(
+            match="session:*", count=SESSION_CLEANUP_SCAN_COUNT
+        )
+        first, last = self.mock_cache.client.eval.await_args_list
+        assert first.args[1:] == (SESSION_CLEANUP_SCAN_COUNT, *keys[:SESSION_CLEANUP_SCAN_COUNT])
+        assert last.args[1:] == (2, *keys[SESSION_CLEANUP_SCAN_COUNT:])
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_expired_sessions_skips_when_locked(self):
+        """Test that session cleanup is skipped while another run holds the lock."""
+        self.mock_cache.client.set = AsyncMock(return_value=None)
+        self.mock_cache.client.eval = AsyncMock()
+        
+        deleted = await self.invalidator.invalidate_expired_sessions()
+        
+        assert deleted == 0
+        self.mock_cache.client.eval.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_user_data_clears_all_patterns(self):
+        """Test that every user key pattern is cleared."""
+        self.mock_cache.clear_pattern = AsyncMock(return_value=1)
+        
+        cleared = await self.invalidator.invalidate_user_data("u1")
+        
+        assert cleared == 5
+        patterns = [call.args[0] for call in self.mock_cache.clear_pattern.await_args_list]
+        assert patterns == [
+            "user:u1",
+            "user:u1:*",
+            "*:user:u1",
+            "search:*:user:u1",
+            "session:*:u1",
+        ]
+
+
+class TestCacheHealthChecker:
+    """Test cases for CacheHealthChecker class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_cache = Mock()
+        self.health_checker = CacheHealthChecker(self.mock_cache)
+    
+    @pytest.mark.asyncio
+    async def test_full_health_report_uses_single_pipeline(self):
+        """Test that the health report is built from one pipelined round trip."""
+        mock_pipeline = Mock()
+        mock_pipeline.execute = AsyncMock(return_value=[
+            True,
+            True,
+            "test_value",
+            1,
+            {"used_memory": 50, "maxmemory": 200, "used_memory_human": "50B"},
+        ])
+        self.mock_cache.client.pipeline.return_value = mock_pipeline
+        
+        report = await self.health_checker.get_full_health_report()
+        
+        assert report["healthy"] is True
+        assert report["connectivity"] is True
+        assert report["performance"]["test_successful"] is True
+        assert report["memory"]["memory_usage_percentage"] == 25.0
+        mock_pipeline.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_full_health_report_on_failure(self):
+        """Test that pipeline failures produce an unhealthy report."""
+        mock_pipeline = Mock()
+        mock_pipeline.execute = AsyncMock(side_effect=Exception("Connection refused"))
+        self.mock_cache.client.pipeline.return_value = mock_pipeline
+        
+        report = await self.health_checker.get_full_health_report()
+        
+        assert report["healthy"] is False
+        assert report["connectivity"] is False
+        assert report["performance"]["error"] == "Connection refused"
+    
+    @pytest.mark.asyncio
+    async def test_check_performance_single_round_trip(self):
+        """Test that the performance probe is a single SET ... GET command."""
+        self.mock_cache.client.set = AsyncMock(return_value=None)
+        
+        performance = await self.health_checker.check_performance()
+        
+        assert performance["test_successful"] is True
+        assert performance["round_trip_latency_ms"] >= 0
+        self.mock_cache.client.set.assert_awaited_once_with(
+            "health_check_test", "test_value", ex=10, get=True
+        )
+    
+    @pytest.mark.asyncio
+    async def test_check_performance_unexpected_reply(self):
+        """Test that the probe fails when the key held an unexpected value."""
+        self.mock_cache.client.set = AsyncMock(return_value="stale")
+        
+        performance = await self.health_checker.check_performance()
+        
+        assert performance["test_successful"] is False
@@ -0,0 +1,55 @@
+"""Unit tests for the in-process LRU cache."""
+
+from unittest.mock import patch
+
+from src.utils.memory_cache import LRUCache
+
+
+class TestLRUCache:
+    """Test cases for LRUCache class."""
+    
+    def test_get_and_set(self):
+        """Test storing and reading values."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+        assert "a" in cache
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+    
+    def test_entries_expire_after_ttl(self):
+        """Test that entries older than the TTL are treated as missing."""
+        cache = LRUCache(maxsize=10, ttl=30)
+        
+        with patch("src.utils.memory_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("src.utils.memory_cache.time.monotonic", return_value=120.0):
+            assert cache.get("a") == 1
+        with patch("src.utils.memory_cache.time.monotonic", return_value=131.0):
+            assert cache.get("a") is None
+        
+        assert len(cache) == 0
+    
+    def test_pop_and_clear(self):
+        """Test removing entries."""
+        cache = LRUCache(maxsize=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        assert cache.pop("a") == 1
+        assert cache.pop("a", "gone") == "gone"
+        
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,64 @@
+"""Unit tests for the Pinecone client helpers."""
+
+from src.db.clients.pinecone_utils import batch_file_ranges, chunk_text
+
+
+class TestChunkText:
+    """Test cases for chunk_text function."""
+    
+    def test_short_text_is_one_chunk(self):
+        """Test that text within the chunk size is returned whole."""
+        assert chunk_text("short text", 100, 10) == ["short text"]
+    
+    def test_chunks_overlap_and_cover_text(self):
+        """Test that chunks overlap and together cover the whole text."""
+        text = " ".join(f"word{i}" for i in range(200))
+        
+        chunks = chunk_text(text, 100, 20)
+        
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert chunks[0] == text[:len(chunks[0])]
+        assert text.endswith(chunks[-1])
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current[:20] == previous[-20:]
+    
+    def test_chunks_end_at_spaces(self):
+        """Test that chunks end at a space rather than inside a word."""
+        text = " ".join(["abcdefghi"] * 30)
+        
+        chunks = chunk_text(text, 50, 10)
+        
+        for chunk in chunks[:-1]:
+            assert text[text.index(chunk) + len(chunk)] == " "
+    
+    def test_text_without_spaces_is_split_at_size(self):
+        """Test that text with no spaces is still split at the chunk size."""
+        chunks = chunk_text("x" * 250, 100, 10)
+        
+        assert [len(chunk) for chunk in chunks] == [100, 100, 70]
+
+
+class TestBatchFileRanges:
+    """Test cases for batch_file_ranges function."""
+    
+    def test_no_lines(self):
+        """Test that no lines make no jobs."""
+        assert batch_file_ranges([]) == []
+    
+    def test_split_by_request_count(self):
+        """Test that jobs hold at most max_requests lines."""
+        ranges = batch_file_ranges([b"x"] * 5, max_requests=2)
+        
+        assert ranges == [(0, 2), (2, 4), (4, 5)]
+    
+    def test_split_by_file_size(self):
+        """Test that a job's lines and newlines fit within max_bytes."""
+        ranges = batch_file_ranges([b"a" * 4] * 5, max_bytes=10)
+        
+        assert ranges == [(0, 2), (2, 4), (4, 5)]
+    
+    def test_oversized_line_gets_its_own_job(self):
+        """Test that a line larger than max_bytes is still submitted alone."""
+        ranges = batch_file_ranges([b"a", b"b" * 20, b"c"], max_bytes=10)
+        
+        assert ranges == [(0, 1), (1, 2), (2, 3)]
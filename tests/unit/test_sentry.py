@@ -0,0 +1,211 @@
+"""Unit tests for Sentry integration."""
+
+import logging
+from unittest.mock import patch
+
+from src.core import sentry
+from src.core.sentry import (
+    add_breadcrumb,
+    capture_exception,
+    capture_message,
+    configure_sentry_logging_handler,
+    filter_sensitive_data,
+    filter_transaction_data,
+    flush_sentry,
+)
+
+
+class TestFilterSensitiveData:
+    """Test cases for filter_sensitive_data."""
+    
+    def test_removes_sensitive_headers(self):
+        """Test that credential headers are stripped."""
+        event = {
+            "request": {
+                "headers": {
+                    "authorization": "Bearer abc",
+                    "x-api-key": "secret",
+                    "user-agent": "pytest",
+                }
+            }
+        }
+        
+        result = filter_sensitive_data(event, {})
+        
+        assert result["request"]["headers"] == {"user-agent": "pytest"}
+    
+    def test_filters_sensitive_query_string(self):
+        """Test that query strings carrying credentials are replaced."""
+        event = {"request": {"query_string": "page=1&API_KEY=abc"}}
+        
+        result = filter_sensitive_data(event, {})
+        
+        assert result["request"]["query_string"] == "[Filtered]"
+    
+    def test_keeps_plain_query_string(self):
+        """Test that query strings without credentials are kept."""
+        event = {"request": {"query_string": "page=1&size=10"}}
+        
+        result = filter_sensitive_data(event, {})
+        
+        assert result["request"]["query_string"] == "page=1&size=10"
+    
+    def test_filters_sensitive_form_fields(self):
+        """Test that sensitive form fields are masked."""
+        event = {"request": {"data": {"username": "jane", "password": "hunter2"}}}
+        
+        result = filter_sensitive_data(event, {})
+        
+        assert result["request"]["data"] == {"username": "jane", "password": "[Filtered]"}
+    
+    def test_drops_sampled_out_log_events(self):
+        """Test that logged errors are sampled before filtering."""
+        event = {"request": {"headers": {"authorization": "Bearer abc"}}}
+        hint = {"log_record": object()}
+        
+        with patch("src.core.sentry._error_sample_rate", 0.0):
+            assert filter_sensitive_data(event, hint) is None
+        
+        assert event["request"]["headers"] == {"authorization": "Bearer abc"}
+    
+    def test_event_without_request(self):
+        """Test that events without request data pass through unchanged."""
+        event = {"message": "task failed"}
+        
+        assert filter_sensitive_data(event, {}) == {"message": "task failed"}
+
+
+class TestFilterTransactionData:
+    """Test cases for filter_transaction_data."""
+    
+    def test_drops_health_check_transactions(self):
+        """Test that health and metrics transactions are dropped."""
+        assert filter_transaction_data({"transaction": "/health"}, {}) is None
+        assert filter_transaction_data({"transaction": "/metrics"}, {}) is None
+    
+    def test_keeps_api_transactions(self):
+        """Test that regular API transactions are kept."""
+        event = {"transaction": "/api/v1/search"}
+        
+        assert filter_transaction_data(event, {}) is event
+    
+    def test_drops_health_sub_route_transactions(self):
+        """Test that nested health check routes are dropped."""
+        assert filter_transaction_data({"transaction": "/health/redis"}, {}) is None
+    
+    def test_keeps_event_without_transaction_name(self):
+        """Test that events without a transaction name are kept."""
+        event = {"type": "transaction"}
+        
+        assert filter_transaction_data(event, {}) is event
+
+
+class TestCaptureHelpers:
+    """Test cases for the capture helpers."""
+    
+    def test_capture_exception_without_context(self):
+        """Test that exceptions without context go straight to the SDK."""
+        exc = ValueError("boom")
+        
+        with patch("src.core.sentry.sentry_sdk") as mock_sdk:
+            mock_sdk.capture_exception.return_value = "event-id"
+            
+            assert capture_exception(exc) == "event-id"
+            mock_sdk.capture_exception.assert_called_once_with(exc)
+            mock_sdk.configure_scope.assert_not_called()
+    
+    def test_capture_exception_with_context(self):
+        """Test that extra context is attached to the captured event."""
+        exc = ValueError("boom")
+        
+        with patch("src.core.sentry.sentry_sdk") as mock_sdk:
+            capture_exception(exc, task_id="abc")
+            
+            mock_sdk.capture_exception.assert_called_once_with(exc, extras={"task_id": "abc"})
+    
+    def test_capture_exception_sampled_out(self):
+        """Test that sampled-out exceptions never reach the SDK."""
+        with patch("src.core.sentry.sentry_sdk") as mock_sdk, \
+             patch("src.core.sentry._error_sample_rate", 0.0):
+            assert capture_exception(ValueError("boom"), task_id="abc") is None
+            mock_sdk.capture_exception.assert_not_called()
+    
+    def test_capture_message_with_context(self):
+        """Test that messages carry their level and extra context."""
+        with patch("src.core.sentry.sentry_sdk") as mock_sdk:
+            capture_message("sync lagging", level="warning", table="Videos")
+            
+            mock_sdk.capture_message.assert_called_once_with(
+                "sync lagging", level="warning", extras={"table": "Videos"}
+            )
+    
+    def test_add_breadcrumb(self):
+        """Test that breadcrumbs are passed to the SDK with their data."""
+        with patch("src.core.sentry.sentry_sdk") as mock_sdk:
+            add_breadcrumb("Cache miss", category="cache", key="user:1")
+            
+            mock_sdk.add_breadcrumb.assert_called_once_with(
+                message="Cache miss", category="cache", level="info", data={"key": "user:1"}
+            )
+
+
+class TestSentryLoggingHandler:
+    """Test cases for the queued Sentry logging handler."""
+    
+    def test_error_records_forwarded_from_queue(self):
+        """Test that error records reach the Sentry handler and the queue is detached on flush."""
+        forwarded = []
+        
+        class RecordingHandler(logging.Handler):
+            def emit(self, record):
+                forwarded.append(record.getMessage())
+        
+        root_logger = logging.getLogger()
+        handlers_before = list(root_logger.handlers)
+        
+        with patch("sentry_sdk.integrations.logging.SentryHandler", RecordingHandler), \
+             patch("src.core.sentry.sentry_sdk.flush") as mock_flush:
+            try:
+                configure_sentry_logging_handler()
+                logging.getLogger("test.sentry").error("database unavailable")
+                logging.getLogger("test.sentry").warning("slow query")
+                flush_sentry(timeout=1)
+                handlers_after = list(root_logger.handlers)
+            finally:
+                root_logger.handlers = handlers_before
+        
+        assert forwarded == ["database unavailable"]
+        assert sentry._sentry_log_listener is None
+        assert sentry._sentry_queue_handler is None
+        assert handlers_after == handlers_before
+        mock_flush.assert_called_once_with(timeout=1)
+    
+    def test_exception_and_scope_kept_when_forwarded(self):
+        """Test that forwarded records keep their traceback and the logging scope."""
+        forwarded = []
+        
+        class RecordingHandler(logging.Handler):
+            def emit(self, record):
+                forwarded.append((record.exc_info, sentry.sentry_sdk.get_current_scope()._tags))
+        
+        root_logger = logging.getLogger()
+        handlers_before = list(root_logger.handlers)
+        
+        with patch("sentry_sdk.integrations.logging.SentryHandler", RecordingHandler), \
+             patch("src.core.sentry.sentry_sdk.flush"):
+            try:
+                configure_sentry_logging_handler()
+                with sentry.sentry_sdk.new_scope() as scope:
+                    scope.set_tag("request_id", "req-1")
+                    try:
+                        raise ValueError("boom")
+                    except ValueError:
+                        logging.getLogger("test.sentry").exception("sync failed")
+                flush_sentry(timeout=1)
+            finally:
+                root_logger.handlers = handlers_before
+        
+        [(exc_info, tags)] = forwarded
+        assert exc_info[0] is ValueError
+        assert exc_info[2] is not None
+        assert tags["request_id"] == "req-1"
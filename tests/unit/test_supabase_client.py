@@ -0,0 +1,174 @@
+"""Unit tests for the Supabase client."""
+
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.db.clients.supabase_client import (
+    SupabaseClient,
+    _copy_upsert_sql,
+    _positional_sql,
+    _row_id,
+    _upsert_sql,
+)
+
+
+def _row(record_id: str) -> dict:
+    """Build a base_records row with the given ID."""
+    return {
+        "id": record_id,
+        "record_type": "transcript",
+        "created_at": None,
+        "updated_at": None,
+        "synced_at": None,
+        "source_system": None,
+        "source_id": None,
+        "airtable_id": None,
+        "pinecone_id": None,
+        "sync_version": 1,
+        "created_by": None,
+        "updated_by": None,
+        "agent_version": None,
+        "metadata": {},
+    }
+
+
+class TestRowId:
+    """Test cases for mapping record IDs to row UUIDs."""
+    
+    def test_uuid_is_canonicalized(self):
+        """Test that a UUID maps to its canonical lowercase form."""
+        record_id = uuid4()
+        
+        assert _row_id(str(record_id).upper()) == str(record_id)
+    
+    def test_non_uuid_maps_to_stable_uuid(self):
+        """Test that a non-UUID ID always maps to the same derived UUID."""
+        assert _row_id("video-123") == _row_id("video-123")
+        assert _row_id("video-123") != _row_id("video-124")
+        assert _row_id(_row_id("video-123")) == _row_id("video-123")
+
+
+class TestStatements:
+    """Test cases for the SQL statement builders."""
+    
+    def test_positional_sql_numbers_parameters(self):
+        """Test that named parameters become $n in first-use order."""
+        sql, order = _positional_sql(
+            "SELECT * FROM t WHERE a = :b AND c = :a OR d = :b", ("a", "b")
+        )
+        
+        assert sql == "SELECT * FROM t WHERE a = $1 AND c = $2 OR d = $1"
+        assert order == ("b", "a")
+    
+    def test_positional_sql_keeps_casts_and_unknown_names(self):
+        """Test that :: casts and names without a parameter are left as written."""
+        sql, order = _positional_sql(
+            "SELECT :value::text, '12:30', :other", ("value",)
+        )
+        
+        assert sql == "SELECT $1::text, '12:30', :other"
+        assert order == ("value",)
+    
+    def test_upsert_sql(self):
+        """Test that the upsert updates every column except the ID."""
+        sql = _upsert_sql(("id", "record_type", "metadata"))
+        
+        assert sql == (
+            "INSERT INTO base_records (id, record_type, metadata) VALUES ($1, $2, $3) "
+            "ON CONFLICT (id) DO UPDATE SET record_type = EXCLUDED.record_type, "
+            "metadata = EXCLUDED.metadata RETURNING id"
+        )
+    
+    def test_copy_upsert_sql(self):
+        """Test that copied rows are merged from upsert_rows."""
+        sql = _copy_upsert_sql("base_records", ("id", "metadata"))
+        
+        assert sql == (
+            "INSERT INTO base_records (id, metadata) SELECT id, metadata FROM upsert_rows "
+            "ON CONFLICT (id) DO UPDATE SET metadata = EXCLUDED.metadata"
+        )
+
+
+class TestSupabaseClient:
+    """Test cases for SupabaseClient with a mocked connection pool."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.client = SupabaseClient({"url": "https://example.supabase.co", "db_url": "postgresql://test"})
+        self.pool = Mock()
+        self.client._pool = self.pool
+    
+    @pytest.mark.asyncio
+    async def test_connect_requires_db_url(self):
+        """Test that connecting without a database URL fails clearly."""
+        client = SupabaseClient({"url": "https://example.supabase.co", "db_url": None})
+        
+        with pytest.raises(ValueError, match="SUPABASE_DB_URL"):
+            await client.connect()
+    
+    @pytest.mark.asyncio
+    async def test_copy_upsert_copies_then_merges(self):
+        """Test that rows are copied into a temporary table and merged in one transaction."""
+        conn = Mock()
+        conn.execute = AsyncMock()
+        conn.copy_records_to_table = AsyncMock()
+        conn.transaction.return_value = MagicMock(
+            __aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False)
+        )
+        self.pool.acquire.return_value = MagicMock(
+            __aenter__=AsyncMock(return_value=conn), __aexit__=AsyncMock(return_value=False)
+        )
+        columns = ("id", "metadata")
+        rows = [("a", {}), ("b", {})]
+        
+        await self.client._copy_upsert("base_records", columns, rows)
+        
+        create_sql = conn.execute.await_args_list[0].args[0]
+        assert create_sql == (
+            "CREATE TEMP TABLE upsert_rows ON COMMIT DROP AS "
+            "SELECT id, metadata FROM base_records WITH NO DATA"
+        )
+        conn.copy_records_to_table.assert_awaited_once_with(
+            "upsert_rows", records=rows, columns=columns
+        )
+        assert conn.execute.await_args_list[1].args[0] == _copy_upsert_sql("base_records", columns)
+    
+    @pytest.mark.asyncio
+    async def test_iterate_pages_by_last_id(self):
+        """Test that later pages continue after the last ID of the previous page."""
+        pages = [[_row("a"), _row("b")], [_row("c"), _row("d")], [_row("e")]]
+        self.pool.fetch = AsyncMock(side_effect=pages)
+        
+        records = [
+            record async for record in self.client.iterate(
+                {"record_type": "transcript", "sync_version": 1}, limit=10, page_size=2
+            )
+        ]
+        
+        assert [record["id"] for record in records] == ["a", "b", "c", "d", "e"]
+        calls = self.pool.fetch.await_args_list
+        assert calls[0].args == (
+            "SELECT * FROM base_records WHERE sync_version = $1 ORDER BY id LIMIT $2", 1, 2
+        )
+        assert calls[1].args == (
+            "SELECT * FROM base_records WHERE sync_version = $1 AND id > $2 ORDER BY id LIMIT $3",
+            1, "b", 2,
+        )
+        assert calls[2].args[-2:] == ("d", 2)
+    
+    @pytest.mark.asyncio
+    async def test_iterate_stops_at_limit(self):
+        """Test that no more rows are requested than the limit."""
+        self.pool.fetch = AsyncMock(side_effect=[[_row("a"), _row("b")], [_row("c")]])
+        
+        records = [record async for record in self.client.iterate({}, limit=3, page_size=2)]
+        
+        assert len(records) == 3
+        calls = self.pool.fetch.await_args_list
+        assert calls[0].args == ("SELECT * FROM base_records ORDER BY id LIMIT $1", 2)
+        assert calls[1].args == (
+            "SELECT * FROM base_records WHERE id > $1 ORDER BY id LIMIT $2", "b", 1
+        )
+        assert self.pool.fetch.await_count == 2
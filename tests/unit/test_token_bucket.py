@@ -0,0 +1,38 @@
+"""Unit tests for the token bucket."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.utils.token_bucket import TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket class."""
+    
+    @pytest.mark.asyncio
+    async def test_burst_up_to_capacity_without_waiting(self):
+        """Test that a full bucket serves a burst without sleeping."""
+        bucket = TokenBucket(rate=5, capacity=5)
+        
+        with patch("src.utils.token_bucket.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            for _ in range(5):
+                await bucket.acquire()
+        
+        mock_sleep.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_when_empty(self):
+        """Test that an empty bucket waits for a token to refill."""
+        clock = [100.0]
+        
+        async def advance(seconds):
+            clock[0] += seconds
+        
+        with patch("src.utils.token_bucket.time.monotonic", side_effect=lambda: clock[0]), \
+             patch("src.utils.token_bucket.asyncio.sleep", side_effect=advance) as mock_sleep:
+            bucket = TokenBucket(rate=5, capacity=1)
+            await bucket.acquire()
+            await bucket.acquire()
+        
+        mock_sleep.assert_awaited_once()
+        assert mock_sleep.await_args.args[0] == pytest.approx(0.2)